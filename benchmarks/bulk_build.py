@@ -0,0 +1,59 @@
+"""
+Compares building a catalogue entity by entity (PropertySet.create_child for every predefined PropertySet)
+with building the same catalogue through Project.bulk().
+"""
+from __future__ import annotations
+
+from uuid import uuid4
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+
+from common import measure
+
+OBJECT_COUNT = 2000
+PREDEFINED_PSET_COUNT = 5
+ATTRIBUTE_COUNT = 10
+
+
+def build_single() -> classes.Project:
+    proj = classes.Project("Benchmark", "SOMcreator")
+    predefined_psets = [classes.PropertySet(f"Predefined {index}", None, project=proj)
+                        for index in range(PREDEFINED_PSET_COUNT)]
+    for pset in predefined_psets:
+        for index in range(ATTRIBUTE_COUNT):
+            classes.Attribute(pset, f"Attribute {index}", [str(index)], value_constants.LIST, project=proj)
+    for object_index in range(OBJECT_COUNT):
+        obj = classes.Object(f"Object {object_index}", None, project=proj)
+        pset = classes.PropertySet("Identification", obj, project=proj)
+        obj.ident_attrib = classes.Attribute(pset, "Ident", [str(object_index)], value_constants.LIST, project=proj)
+        for predefined_pset in predefined_psets:
+            obj.add_property_set(predefined_pset.create_child(predefined_pset.name))
+    return proj
+
+
+def build_bulk() -> classes.Project:
+    proj = classes.Project("Benchmark", "SOMcreator")
+    with proj.bulk() as builder:
+        predefined_psets = [builder.add_property_set(f"Predefined {index}")
+                            for index in range(PREDEFINED_PSET_COUNT)]
+        for pset in predefined_psets:
+            builder.add_attributes({"property_set": pset, "name": f"Attribute {index}", "value": [str(index)],
+                                    "value_type": value_constants.LIST} for index in range(ATTRIBUTE_COUNT))
+        for object_index in range(OBJECT_COUNT):
+            ident_attribute = str(uuid4())
+            obj = builder.add_object(f"Object {object_index}", ident_attribute=ident_attribute)
+            pset = builder.add_property_set("Identification", obj)
+            builder.add_attribute(pset, "Ident", [str(object_index)], value_constants.LIST, uuid=ident_attribute)
+            for index, predefined_pset in enumerate(predefined_psets):
+                builder.add_property_set(f"Predefined {index}", obj, parent=predefined_pset)
+    return proj
+
+
+def main():
+    print(f"single: {measure(build_single, 3):.3f} s")
+    print(f"bulk:   {measure(build_bulk, 3):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Helpers shared by the benchmark scripts in this folder.
+Run the scripts from the repository root with SOMcreator installed (pip install -e .)
+"""
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+
+
+def generate_project(object_count: int, pset_count: int = 3, attribute_count: int = 10, phase_count: int = 1,
+                     use_case_count: int = 1) -> classes.Project:
+    """creates a Project with object_count Objects. Each Object gets pset_count PropertySets with
+    attribute_count Attributes. Every third Object is filtered out of the last phase/use_case combination"""
+    proj = classes.Project("Benchmark", "SOMcreator")
+    for index in range(1, phase_count):
+        proj.create_project_phase(f"Phase {index}")
+    for index in range(1, use_case_count):
+        proj.create_use_case(f"UseCase {index}")
+    last_phase = proj.get_project_phase_list()[-1]
+    last_use_case = proj.get_use_case_list()[-1]
+
+    for object_index in range(object_count):
+        obj = classes.Object(f"Object {object_index}", None, project=proj, abbreviation=f"O{object_index}")
+        for pset_index in range(pset_count):
+            pset = classes.PropertySet(f"PropertySet {pset_index}", obj, project=proj)
+            for attribute_index in range(attribute_count):
+                classes.Attribute(pset, f"Attribute {attribute_index}", [f"{object_index}.{attribute_index}"],
+                                  value_constants.LIST, project=proj)
+        ident_pset = obj.get_all_property_sets()[0]
+        obj.ident_attrib = ident_pset.get_attribute_by_name("Attribute 0")
+        if object_index % 3 == 0:
+            obj.set_filter_state(last_phase, last_use_case, False)
+    return proj
+
+
+def measure(func: Callable, repeat: int = 5) -> float:
+    """returns the fastest runtime of func in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
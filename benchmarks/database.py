@@ -0,0 +1,48 @@
+"""
+Compares opening a generated project as JSON and as SQLite database (.somdb), reading a single Object of the opened
+project and saving a single change.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+
+from SOMcreator import classes
+from SOMcreator.filehandling import database
+
+from common import generate_project, measure
+
+OBJECT_COUNT = 2000
+
+
+def main():
+    proj = generate_project(OBJECT_COUNT, phase_count=4, use_case_count=3)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "benchmark.SOMjson")
+        database_path = os.path.join(directory, f"benchmark{database.FILE_EXTENSION}")
+        proj.save(json_path)
+        proj.save(database_path)
+
+        def read_object(path: str):
+            opened = classes.Project.open(path)
+            obj = next(iter(opened.get_all_objects()))
+            return [attribute.value for pset in obj.get_all_property_sets() for attribute in pset.get_all_attributes()]
+
+        print(f"{'format':>8} {'open [s]':>9} {'open+read [s]':>14}")
+        for name, path in (("json", json_path), ("somdb", database_path)):
+            open_time = measure(lambda: classes.Project.open(path), 3)
+            read_time = measure(lambda: read_object(path), 3)
+            print(f"{name:>8} {open_time:>9.3f} {read_time:>14.3f}")
+
+        opened = classes.Project.open(database_path)
+        obj = next(iter(opened.get_all_objects()))
+
+        def change_and_save():
+            obj.description = obj.description + "."
+            opened.save(database_path)
+
+        print(f"incremental save of one change: {measure(change_and_save, 3):.4f} s")
+
+
+if __name__ == "__main__":
+    main()
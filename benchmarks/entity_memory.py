@@ -0,0 +1,82 @@
+"""
+Reports the memory allocated per entity (Object, PropertySet, Attribute) of a generated Project and per child
+Attribute of predefined PropertySets that get inherited by every Object.
+Uses tracemalloc, so the numbers include all containers an entity owns.
+Pass the src folder of another checkout to measure it as well, e.g. a git worktree of the commit before the entities
+got __slots__: python entity_memory.py /path/to/worktree/src
+"""
+from __future__ import annotations
+
+import gc
+import os
+import subprocess
+import sys
+import tracemalloc
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+from common import generate_project
+
+OBJECT_COUNT = 2000
+PREDEFINED_PSET_COUNT = 30
+INHERITING_OBJECT_COUNT = 100
+
+
+def measure_entities() -> tuple[float, float]:
+    """returns the bytes per entity and the bytes per child Attribute"""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    proj = generate_project(OBJECT_COUNT)
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # counted by iterating, older checkouts have no get_*_count()
+    entity_count = sum(len(list(items)) for items in (proj.get_all_objects(), proj.get_all_property_sets(),
+                                                       proj.get_all_attributes()))
+    bytes_per_entity = (end - start) / entity_count
+
+    proj = classes.Project("Benchmark", "SOMcreator")
+    predefined_psets = list()
+    for pset_index in range(PREDEFINED_PSET_COUNT):
+        pset = classes.PropertySet(f"PropertySet {pset_index}", None, project=proj)
+        for attribute_index in range(20):
+            classes.Attribute(pset, f"Attribute {attribute_index}", [f"Value {i}" for i in range(10)],
+                              value_constants.LIST, project=proj)
+        predefined_psets.append(pset)
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    for object_index in range(INHERITING_OBJECT_COUNT):
+        obj = classes.Object(f"Object {object_index}", None, project=proj)
+        for pset in predefined_psets:
+            obj.add_property_set(pset.create_child(pset.name))
+    gc.collect()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    child_count = len(list(proj.get_all_attributes())) - PREDEFINED_PSET_COUNT * 20
+    return bytes_per_entity, (end - start) / child_count
+
+
+def main():
+    if sys.argv[1:] == ["--measure"]:  # child process of a comparison run
+        print(*measure_entities())
+        return
+    results = {"current": measure_entities()}
+    for src_path in sys.argv[1:]:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([src_path, os.path.dirname(os.path.abspath(__file__))]))
+        output = subprocess.run([sys.executable, __file__, "--measure"], env=env, capture_output=True, text=True,
+                                check=True).stdout
+        results[src_path] = tuple(float(value) for value in output.split())
+
+    print(f"{OBJECT_COUNT} Objects with 3 PropertySets of 10 Attributes, "
+          f"{INHERITING_OBJECT_COUNT} Objects inheriting {PREDEFINED_PSET_COUNT} PropertySets of 20 Attributes")
+    print(f"{'source':<30} {'bytes / entity':>15} {'bytes / child attribute':>24}")
+    for name, (bytes_per_entity, bytes_per_child) in results.items():
+        print(f"{name:<30} {bytes_per_entity:>15.1f} {bytes_per_child:>24.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Compares file size, save and load time of the JSON and the binary (.sombin) format on a generated project.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+
+from SOMcreator import classes, filehandling
+from SOMcreator.filehandling import binary
+
+from common import generate_project, measure
+
+OBJECT_COUNT = 2000
+
+
+def main():
+    proj = generate_project(OBJECT_COUNT, phase_count=4, use_case_count=3)
+    formats = {
+        "json":         (".SOMjson", lambda p: proj.save(p)),
+        "binary zlib":  (binary.FILE_EXTENSION, lambda p: filehandling.export_binary(proj, p, binary.ZLIB)),
+        "binary lzma":  (binary.FILE_EXTENSION, lambda p: filehandling.export_binary(proj, p, binary.LZMA)),
+    }
+    print(f"{'format':>12} {'size [KiB]':>10} {'save [s]':>9} {'load [s]':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (extension, save) in formats.items():
+            path = os.path.join(directory, f"benchmark{extension}")
+            save_time = measure(lambda: save(path), 3)
+            load_time = measure(lambda: classes.Project.open(path), 3)
+            print(f"{name:>12} {os.path.getsize(path) / 1024:>10.0f} {save_time:>9.3f} {load_time:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
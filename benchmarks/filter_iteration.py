@@ -0,0 +1,32 @@
+"""
+Measures the cost of a filtered walk over project.objects -> obj.property_sets -> pset.attributes
+for an increasing number of project phases. The runtime should stay flat.
+"""
+from __future__ import annotations
+
+from common import generate_project, measure
+
+OBJECT_COUNT = 500
+PHASE_COUNTS = [1, 5, 20, 50]
+
+
+def _walk(proj) -> int:
+    count = 0
+    for obj in proj.objects:
+        for pset in obj.property_sets:
+            count += len(pset.attributes)
+    return count
+
+
+def main():
+    print(f"{'phases':>8} {'attributes':>12} {'seconds':>10}")
+    for phase_count in PHASE_COUNTS:
+        proj = generate_project(OBJECT_COUNT, phase_count=phase_count, use_case_count=phase_count)
+        proj.current_project_phase = proj.get_project_phase_list()[-1]
+        proj.current_use_case = proj.get_use_case_list()[-1]
+        runtime = measure(lambda: _walk(proj))
+        print(f"{phase_count:>8} {_walk(proj):>12} {runtime:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Compares a full JSON save with an incremental save (journal) of a single change, and the time to compact the journal.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+
+from SOMcreator import classes
+from SOMcreator.filehandling import journal
+
+from common import generate_project, measure
+
+OBJECT_COUNT = 2000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.SOMjson")
+        generate_project(OBJECT_COUNT, phase_count=4, use_case_count=3).save(path)
+        proj = classes.Project.open(path)
+        obj = next(iter(proj.get_all_objects()))
+
+        def change_and_save(incremental: bool):
+            obj.description = obj.description + "."
+            proj.save(path, incremental=incremental)
+
+        print(f"full save:        {measure(lambda: change_and_save(False), 3):.4f} s")
+        print(f"incremental save: {measure(lambda: change_and_save(True), 3):.4f} s")
+        print(f"compaction:       {measure(lambda: journal.compact(path), 1):.4f} s")
+
+
+if __name__ == "__main__":
+    main()
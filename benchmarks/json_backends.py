@@ -0,0 +1,41 @@
+"""
+Compares the installed JSON backends on the export dict of generated projects with 1k, 10k and 100k Attributes.
+Backends that are not installed (orjson, ujson) are skipped.
+"""
+from __future__ import annotations
+
+from SOMcreator import filehandling
+from SOMcreator.filehandling import serializer
+
+from common import generate_project, measure
+
+ATTRIBUTE_COUNTS = [1_000, 10_000, 100_000]
+PSET_COUNT = 2
+ATTRIBUTES_PER_PSET = 10
+
+
+def main():
+    backends = serializer.get_available_backends()
+    print(f"{'attributes':>10} {'backend':>10} {'dumps [s]':>10} {'loads [s]':>10} {'size [KiB]':>10}")
+    for attribute_count in ATTRIBUTE_COUNTS:
+        object_count = attribute_count // (PSET_COUNT * ATTRIBUTES_PER_PSET)
+        proj = generate_project(object_count, PSET_COUNT, ATTRIBUTES_PER_PSET)
+        main_dict = filehandling.create_export_dict(proj)
+        for name in backends + ["canonical"]:
+            if name == "canonical":
+                def dumps():
+                    return serializer.dumps(main_dict, canonical=True)
+                backend = serializer.get_backend(serializer.STDLIB)
+            else:
+                backend = serializer.get_backend(name)
+
+                def dumps():
+                    return backend.dumps(main_dict)
+            data = dumps()
+            dump_time = measure(dumps, 3)
+            load_time = measure(lambda: backend.loads(data), 3)
+            print(f"{attribute_count:>10} {name:>10} {dump_time:>10.4f} {load_time:>10.4f} {len(data) / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Compares opening a generated project from JSON with restoring it from the load cache.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+
+from SOMcreator import classes
+from SOMcreator.filehandling import cache
+
+from common import generate_project, measure
+
+OBJECT_COUNT = 2000
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.SOMjson")
+        generate_project(OBJECT_COUNT, phase_count=4, use_case_count=3).save(path)
+        load_cache = cache.LoadCache(os.path.join(directory, "cache"))
+        print(f"open:          {measure(lambda: classes.Project.open(path), 3):.3f} s")
+        print(f"first cached:  {measure(lambda: classes.Project.open(path, cache=load_cache), 1):.3f} s")
+        print(f"cache hit:     {measure(lambda: classes.Project.open(path, cache=load_cache), 3):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
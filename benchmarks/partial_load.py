@@ -0,0 +1,31 @@
+"""
+Compares opening a generated project as a whole with opening only a few of its Objects (Project.open(include=...)).
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+
+from SOMcreator import classes
+
+from common import generate_project, measure
+
+OBJECT_COUNT = 2000
+SELECTED_COUNTS = (1, 20, 200)
+
+
+def main():
+    proj = generate_project(OBJECT_COUNT, phase_count=4, use_case_count=3)
+    ident_values = sorted(obj.ident_value for obj in proj.get_all_objects())
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.SOMjson")
+        proj.save(path)
+        print(f"{'objects':>8} {'open [s]':>9}")
+        print(f"{OBJECT_COUNT:>8} {measure(lambda: classes.Project.open(path), 3):>9.3f}")
+        for count in SELECTED_COUNTS:
+            include = ident_values[:count]
+            print(f"{count:>8} {measure(lambda: classes.Project.open(path, include=include), 3):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
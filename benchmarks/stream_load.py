@@ -0,0 +1,39 @@
+"""
+Compares the peak memory of Project.open with and without stream mode on a generated file.
+Uses tracemalloc, so the numbers include the decoded JSON document and the loaded Project.
+"""
+from __future__ import annotations
+
+import gc
+import os
+import tempfile
+import tracemalloc
+
+from SOMcreator import classes
+
+from common import generate_project
+
+OBJECT_COUNT = 3000
+
+
+def peak_memory(path: str, stream: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    proj = classes.Project.open(path, stream=stream)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del proj
+    return peak
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.SOMjson")
+        generate_project(OBJECT_COUNT).save(path)
+        print(f"file size:      {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+        for stream in (False, True):
+            print(f"stream={stream!s:5}:   {peak_memory(path, stream) / 2 ** 20:.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares renaming every Attribute of a nested PropertySet hierarchy one by one with renaming them inside of
+Project.transaction(). Every rename cascades into all descendants, the transaction walks every subtree once.
+"""
+from __future__ import annotations
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+
+from common import measure
+
+ATTRIBUTE_COUNT = 50
+DEPTH = 5
+CHILD_COUNT = 4
+
+
+def generate_hierarchy() -> tuple[classes.Project, list[classes.Attribute]]:
+    """returns the Project and all of its Attributes sorted from the root to the leaves"""
+    proj = classes.Project("Benchmark", "SOMcreator")
+    root = classes.PropertySet("PropertySet", None, project=proj)
+    for index in range(ATTRIBUTE_COUNT):
+        classes.Attribute(root, f"Attribute {index}", [str(index)], value_constants.LIST, project=proj)
+    attributes = list(root.get_all_attributes())
+    level = [root]
+    for _ in range(DEPTH):
+        level = [pset.create_child(pset.name) for pset in level for _ in range(CHILD_COUNT)]
+        attributes += [attribute for pset in level for attribute in pset.get_all_attributes()]
+    return proj, attributes
+
+
+def rename(attributes: list[classes.Attribute], prefix: str) -> None:
+    for index, attribute in enumerate(attributes):
+        attribute.name = f"{prefix} {index}"
+
+
+def main():
+    proj, attributes = generate_hierarchy()
+    print(f"attributes:  {len(attributes)}")
+
+    def rename_in_transaction():
+        with proj.transaction():
+            rename(attributes, "Transaction")
+
+    print(f"one by one:  {measure(lambda: rename(attributes, 'Single'), 3):.3f} s")
+    print(f"transaction: {measure(rename_in_transaction, 3):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
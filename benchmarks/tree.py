@@ -0,0 +1,28 @@
+"""
+Measures Project.tree() for a generated Project whose Objects form a tree with three children per Object:
+building it with anytree nodes, building it with lightweight TreeNodes and returning the cached tree.
+"""
+from __future__ import annotations
+
+from common import generate_project, measure
+
+OBJECT_COUNT = 2000
+
+
+def main():
+    proj = generate_project(OBJECT_COUNT)
+    objects = sorted(proj.objects, key=lambda o: o.name)  # active Objects only
+    for index, obj in enumerate(objects[1:], 1):
+        objects[(index - 1) // 3].add_child(obj)
+
+    def build(lightweight: bool) -> None:
+        proj.update_object_index(objects[0])  # invalidates the cached trees
+        proj.tree(lightweight)
+
+    print(f"anytree:     {measure(lambda: build(False)) * 1000:.2f} ms")
+    print(f"lightweight: {measure(lambda: build(True)) * 1000:.2f} ms")
+    print(f"cached:      {measure(proj.tree) * 1000:.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
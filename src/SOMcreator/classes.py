@@ -1,9 +1,11 @@
 from __future__ import annotations
 import SOMcreator
+import itertools
 import logging
 import os
-from typing import Iterator, Union
-from uuid import uuid4
+import pickle
+import warnings
+from typing import Callable, Iterable, Iterator, Union
 
 import copy as cp
 from anytree import AnyNode
@@ -18,11 +20,10 @@ from dataclasses import dataclass, field
 def filter_by_filter_dict(func):
     """decorator function that filters list output of function by project phase and use_case"""
 
-    def inner(self):
-        res = func(self)
-        phase = self.current_project_phase if isinstance(self, Project) else self.project.current_project_phase
-        use_case = self.current_use_case if isinstance(self, Project) else self.project.current_use_case
-        return list(filter(lambda obj: obj.get_filter_state(phase, use_case), res))
+    def inner(self, *args, **kwargs):
+        res = func(self, *args, **kwargs)
+        proj = self if isinstance(self, Project) else self.project
+        return proj.filter_items(res)
 
     return inner
 
@@ -30,18 +31,47 @@ def filter_by_filter_dict(func):
 def get_element_by_uuid(uuid: str, proj: SOMcreator.Project) -> Attribute | PropertySet | Object | Aggregation | None:
     if uuid is None:
         return None
-    return proj.get_uuid_dict().get(uuid)
+    return proj.get_element_by_uuid(uuid)
+
+
+_UUID_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+def _create_uuid() -> str:
+    """same as str(uuid4()) without building a UUID object, which is about as expensive as creating an Attribute"""
+    digits = os.urandom(16).hex()
+    return f"{digits[:8]}-{digits[8:12]}-4{digits[13:16]}-{_UUID_VARIANT[digits[16]]}{digits[17:20]}-{digits[20:]}"
+
+
+_NO_CHILDREN = frozenset()
+
+
+def _subtract_values(values: list, exclude: list) -> list:
+    """returns the entries of values that are not part of exclude (keeps order)"""
+    try:
+        excluded = set(exclude)
+    except TypeError:  # unhashable values like ranges
+        return [v for v in values if v not in exclude]
+    try:
+        return [v for v in values if v not in excluded]
+    except TypeError:
+        return [v for v in values if v not in exclude]
 
 
 class IterRegistry(type):
-    _registry = set()
-    """ Helper for Iteration"""
+    """ Helper for Iteration over all items of the active Project"""
+
+    def _get_registry(cls) -> list[PropertySet | Object | Attribute | Aggregation]:
+        project = SOMcreator.active_project
+        if project is None:
+            return list()
+        return list(project.get_items_of_type(cls))
 
-    def __iter__(self) -> Iterator[PropertySet | Object | Attribute | Aggregation]:
-        return iter(sorted(list(self._registry), key=lambda x: x.name))
+    def __iter__(cls) -> Iterator[PropertySet | Object | Attribute | Aggregation]:
+        return iter(sorted(cls._get_registry(), key=lambda x: x.name))
 
-    def __len__(self) -> int:
-        return len(self._registry)
+    def __len__(cls) -> int:
+        return len(cls._get_registry())
 
 
 class Project(object):
@@ -49,6 +79,16 @@ class Project(object):
                  use_case: list[UseCase] = None, filter_matrix: list[list[bool]] = None) -> None:
         SOMcreator.active_project = self
         self._items = set()
+        self._objects: set[Object] = set()
+        self._property_sets: set[PropertySet] = set()
+        self._attributes: set[Attribute] = set()
+        self._aggregations: set[Aggregation] = set()
+        self._uuid_dict: dict[str, Hirarchy] = dict()
+        self._ident_dict: dict[str, set[Object]] = dict()
+        self._abbreviation_dict: dict[str, set[Object]] = dict()
+        self._object_index_keys: dict[Object, tuple[str, str]] = dict()
+        self._tree_revision = 0  # changes if Objects get added, removed, renamed, re-parented or filtered
+        self._trees: dict[tuple[int, int, bool], tuple[int, AnyNode | TreeNode]] = dict()
         self._name = ""
         self._author = author
         self._version = "1.0.0"
@@ -58,6 +98,7 @@ class Project(object):
         self._filter_matrix = filter_matrix
         self.plugin_dict = dict()
         self.import_dict = dict()
+        self.load_report: dict[str, dict[str, int]] = dict()
 
         if phases is None:
             self._project_phases = [Phase("Stand", "Standard", "Automatisch generiert. Bitte umbenennen")]
@@ -73,31 +114,338 @@ class Project(object):
         if filter_matrix is None:
             self._filter_matrix = self.create_filter_matrix(True)
 
+        # every cell of the filter matrix gets its own bit. Items store the bits of the cells they are
+        # filtered out of, so new cells default to True and adding filters never touches the items
+        self._next_filter_bit = 0
+        self._free_filter_masks: list[int] = list()  # bits of removed cells, cleared on all items, largest first
+        self._filter_masks: list[list[int]] = [[self._create_filter_mask() for __ in self._use_cases]
+                                               for _ in self._project_phases]
+
+        self._phase_indexes: dict[Phase, int] = dict()
+        self._use_case_indexes: dict[UseCase, int] = dict()
+        self._update_filter_indexes()
+
         self._current_use_case = self._use_cases[0]
         self.change_log = list()
+        self._revision = 0
+        self._views: dict[tuple[Phase, UseCase], ProjectView] = dict()
+        self._views_revision = 0
+
+        # item level change tracking for incremental saves (.somdb store, JSON journal). The changes are relative
+        # to _change_base, the file the project was loaded from or written to as a whole
+        self._track_items = False
+        self._dirty_items: set[Hirarchy] = set()
+        self._removed_items: dict[str, type] = dict()
+        self._change_base: str | None = None
+        self._change_base_filters: tuple[list[Phase], list[UseCase]] = (list(), list())
+        self._store = None
+        self._pending_objects: set[Object] = set()  # Objects whose PropertySets are not loaded yet
+        self._loading_pending = False
+        self._deferred_object_index: set[Object] | None = None  # collects index updates while a BulkBuilder runs
+
+        self._change_listeners: list[Callable[[list[ChangeEvent]], None]] = list()
+        self._transaction: Transaction | None = None
+        self._recording_changes = False  # True if there are change listeners or a Transaction is running
+
+    def __getstate__(self) -> dict:
+        """the attached store, the cached views and the change listeners are not part of a pickled Project"""
+        if self._pending_objects:
+            raise pickle.PicklingError("Project still has Objects that are not loaded from its store")
+        state = dict(self.__dict__)
+        state["_views"] = dict()
+        state["_trees"] = dict()
+        state["_store"] = None
+        state["_change_listeners"] = list()
+        state["_transaction"] = None
+        state["_recording_changes"] = False
+        return state
+
+    def _get_item_bucket(self, item: Hirarchy) -> set | None:
+        item_type = type(item)  # exact types first, isinstance on the IterRegistry classes is comparatively slow
+        if item_type is Attribute:
+            return self._attributes
+        if item_type is PropertySet:
+            return self._property_sets
+        if isinstance(item, Object):
+            return self._objects
+        if isinstance(item, PropertySet):
+            return self._property_sets
+        if isinstance(item, Attribute):
+            return self._attributes
+        if isinstance(item, Aggregation):
+            return self._aggregations
+        return None
+
+    def register_change(self, item: Hirarchy | None = None) -> None:
+        """needs to be called on every modification that changes the content or order of a ProjectView.
+        item: the item whose own data changed"""
+        self._revision += 1
+        if type(item) is Object:
+            self._tree_revision += 1
+        if item is not None and self._track_items:
+            self._dirty_items.add(item)
+        if self._recording_changes:
+            self._record_change(item, MODIFIED)
+
+    def mark_dirty(self, item: Hirarchy) -> None:
+        """needs to be called if data of an item changes that doesn't affect a ProjectView"""
+        if self._track_items:
+            self._dirty_items.add(item)
+        if self._recording_changes:
+            self._record_change(item, MODIFIED)
+
+    def start_change_tracking(self, path: str | os.PathLike) -> None:
+        """tracks all item changes relative to the file at path, which needs to hold the current state of the project"""
+        self._change_base = os.path.abspath(os.fspath(path))
+        self._change_base_filters = (self.get_project_phase_list(), self.get_use_case_list())
+        self._track_items = True
+        self._dirty_items = set()
+        self._removed_items = dict()
+
+    @property
+    def change_base(self) -> str | None:
+        return self._change_base
+
+    def has_filter_changes(self) -> bool:
+        """True if phases or use cases changed since start_change_tracking. That changes every filter matrix"""
+        return self._change_base_filters != (self.get_project_phase_list(), self.get_use_case_list())
+
+    def pop_item_changes(self) -> tuple[set[Hirarchy], dict[str, type]]:
+        """returns the items that were modified and the uuids of the items that were removed since the last call"""
+        changes = (self._dirty_items, self._removed_items)
+        self._dirty_items = set()
+        self._removed_items = dict()
+        return changes
+
+    def attach_store(self, store) -> None:
+        """attaches a storage backend which loads the content of pending Objects on demand"""
+        self._store = store
+
+    @property
+    def store(self):
+        return self._store
+
+    def close(self) -> None:
+        """
+        closes the attached store. Objects that are not loaded yet can't be loaded afterwards, call
+        load_pending_objects() first to keep working with the Project
+        """
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def __enter__(self) -> Project:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def add_pending_object(self, obj: Object) -> None:
+        self._pending_objects.add(obj)
+
+    def load_pending_object(self, obj: Object) -> None:
+        if obj not in self._pending_objects:
+            return
+        if self._store is None:
+            raise ValueError(f"Object '{obj.name}' can't be loaded, the store of the Project is closed")
+        self._pending_objects.discard(obj)
+        revision, tracking, loading = self._revision, self._track_items, self._loading_pending
+        self._track_items = False
+        self._loading_pending = True
+        try:
+            self._store.load_object_content(obj)
+            obj._pending_ident_value = None
+        finally:
+            self._track_items = tracking
+            self._loading_pending = loading
+            self._revision = revision
+
+    def load_pending_objects(self) -> None:
+        """loads the content of all Objects that were not loaded yet"""
+        while self._pending_objects:
+            self.load_pending_object(next(iter(self._pending_objects)))
+
+    def load_pending_children(self, item: Hirarchy) -> None:
+        """loads the Objects that contain children of item"""
+        if self._loading_pending:  # children that are still pending link themselves once they get loaded
+            return
+        for obj in self._store.get_objects_with_children_of(item):
+            self.load_pending_object(obj)
+
+    @property
+    def revision(self) -> int:
+        return self._revision
+
+    def view(self, phase: Phase | None = None, use_case: UseCase | None = None) -> ProjectView:
+        """returns the filtered and sorted Project structure for the given phase and use_case
+        (default: current phase & use_case). The view is shared until the Project gets modified"""
+        phase = self.current_project_phase if phase is None else phase
+        use_case = self.current_use_case if use_case is None else use_case
+        if self._views_revision != self._revision:
+            self._views = dict()
+            self._views_revision = self._revision
+        key = (phase, use_case)
+        if key not in self._views:
+            self._views[key] = ProjectView(self, phase, use_case)
+        return self._views[key]
+
+    def bulk(self) -> BulkBuilder:
+        """
+        with project.bulk() as builder: creates many Objects, PropertySets and Attributes at once,
+        see BulkBuilder
+        """
+        return BulkBuilder(self)
+
+    def transaction(self, rollback: bool = False) -> Transaction:
+        """
+        with project.transaction(): coalesces the changes of the with block and reports them to the change listeners
+        at the end, see Transaction
+        """
+        return Transaction(self, rollback)
+
+    @property
+    def active_transaction(self) -> Transaction | None:
+        return self._transaction
+
+    def add_change_listener(self, listener: Callable[[list[ChangeEvent]], None]) -> None:
+        """listener gets called with a list of ChangeEvents after every change or once at the end of a Transaction"""
+        self._change_listeners.append(listener)
+        self._update_change_recording()
+
+    def remove_change_listener(self, listener: Callable[[list[ChangeEvent]], None]) -> None:
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+        self._update_change_recording()
+
+    def _update_change_recording(self) -> None:
+        self._recording_changes = bool(self._change_listeners) or self._transaction is not None
+
+    def _record_change(self, item: Hirarchy | None, kind: str) -> None:
+        if self._loading_pending:  # loading the content of an Object from the store is no change
+            return
+        if self._transaction is not None:
+            self._transaction.record(item, kind)
+        else:
+            self._notify_change_listeners([ChangeEvent(item, kind)])
+
+    def _notify_change_listeners(self, events: list[ChangeEvent]) -> None:
+        for listener in list(self._change_listeners):
+            listener(events)
+
+    def _defer_cascade(self, item: Hirarchy, field_name: str, value) -> bool:
+        """returns True if a running Transaction takes over cascading the value into the children of item"""
+        if self._transaction is None:
+            return False
+        self._transaction.defer_cascade(item, field_name, value)
+        return True
+
+    def _defer_ident_index(self, attribute: Attribute) -> bool:
+        """returns True if a running Transaction takes over Attribute.update_ident_index"""
+        if self._transaction is None:
+            return False
+        return self._transaction.defer_ident_index(attribute)
+
+    def _defer_object_index(self) -> bool:
+        """collects the Objects passed to update_object_index. Returns False if they get collected already"""
+        if self._deferred_object_index is not None:
+            return False
+        self._deferred_object_index = set()
+        return True
+
+    def _flush_object_index(self) -> None:
+        deferred_objects = self._deferred_object_index
+        self._deferred_object_index = None
+        for obj in deferred_objects:
+            self.update_object_index(obj)
 
     def add_item(self, item: Hirarchy):
+        self._revision += 1
+        if self._track_items:
+            self._dirty_items.add(item)
+        if self._recording_changes:
+            self._record_change(item, CREATED)
         self._items.add(item)
+        bucket = self._get_item_bucket(item)
+        if bucket is not None:
+            bucket.add(item)
+        if item.uuid is not None:
+            self._uuid_dict[item.uuid] = item
+        if bucket is self._objects:
+            self._tree_revision += 1
+            self.update_object_index(item)
 
     def remove_item(self, item: Hirarchy):
+        self.register_change()
+        if self._recording_changes:
+            self._record_change(item, REMOVED)
+        if self._track_items:
+            self._dirty_items.discard(item)
+            if item.uuid is not None:
+                self._removed_items[item.uuid] = type(item)
         if item in self._items:
             self._items.remove(item)
+        bucket = self._get_item_bucket(item)
+        if bucket is not None:
+            bucket.discard(item)
+        if self._uuid_dict.get(item.uuid) is item:
+            self._uuid_dict.pop(item.uuid)
+        if isinstance(item, Object):
+            self._tree_revision += 1
+            self._remove_from_object_index(item)
+
+    def change_uuid(self, item: Hirarchy, old_uuid: str | None, new_uuid: str | None) -> None:
+        """keeps the uuid index in sync if the uuid of an item changes"""
+        if old_uuid is not None and self._uuid_dict.get(old_uuid) is item:
+            self._uuid_dict.pop(old_uuid)
+            if self._track_items:
+                self._removed_items[old_uuid] = type(item)
+                self._dirty_items.add(item)
+        if new_uuid is not None and item in self._items:
+            self._uuid_dict[new_uuid] = item
 
     # Item Getter Methods
     def get_all_hirarchy_items(self) -> Iterator[Object, PropertySet, Attribute, Aggregation]:
-        return filter(lambda i: isinstance(i, (Object, PropertySet, Attribute, Aggregation)), self._items)
+        self.load_pending_objects()
+        return itertools.chain(self._objects, self._property_sets, self._attributes, self._aggregations)
 
     def get_all_objects(self) -> Iterator[Object]:
-        return filter(lambda item: isinstance(item, Object), self._items)
+        return iter(self._objects)
 
     def get_all_property_sets(self) -> Iterator[PropertySet]:
-        return filter(lambda item: isinstance(item, PropertySet), self._items)
+        self.load_pending_objects()
+        return iter(self._property_sets)
 
     def get_all_attributes(self) -> Iterator[Attribute]:
-        return filter(lambda item: isinstance(item, Attribute), self._items)
+        self.load_pending_objects()
+        return iter(self._attributes)
 
     def get_all_aggregations(self) -> Iterator[Aggregation]:
-        return filter(lambda item: isinstance(item, Aggregation), self._items)
+        return iter(self._aggregations)
+
+    def get_items_of_type(self, item_type: type) -> Iterator[Hirarchy]:
+        """returns all items that are instances of item_type"""
+        self.load_pending_objects()
+        for base_type, bucket in ((Object, self._objects), (PropertySet, self._property_sets),
+                                  (Attribute, self._attributes), (Aggregation, self._aggregations)):
+            if item_type is base_type:
+                return iter(bucket)
+            if issubclass(item_type, base_type):
+                return filter(lambda item: isinstance(item, item_type), bucket)
+        return filter(lambda item: isinstance(item, item_type), self.get_all_hirarchy_items())
+
+    def get_object_count(self) -> int:
+        return len(self._objects)
+
+    def get_property_set_count(self) -> int:
+        self.load_pending_objects()
+        return len(self._property_sets)
+
+    def get_attribute_count(self) -> int:
+        self.load_pending_objects()
+        return len(self._attributes)
+
+    def get_aggregation_count(self) -> int:
+        return len(self._aggregations)
 
     def get_predefined_psets(self) -> set[PropertySet]:
         return set(filter(lambda p: p.is_predefined, self.get_all_property_sets()))
@@ -124,30 +472,127 @@ class Project(object):
         else:
             return "", ""
 
-    def get_object_by_identifier(self, identifier: str) -> Object | None:
-        return {obj.ident_value: obj for obj in self.get_all_objects()}.get(identifier)
+    def update_object_index(self, obj: Object) -> None:
+        """re-indexes ident_value and abbreviation of an Object, needs to be called if one of them changes"""
+        self.register_change()
+        self._tree_revision += 1
+        if self._deferred_object_index is not None:
+            self._deferred_object_index.add(obj)
+            return
+        self._remove_from_object_index(obj)
+        if obj not in self._objects:
+            return
+        keys = (obj.ident_value, (obj.abbreviation or "").upper())
+        self._ident_dict.setdefault(keys[0], set()).add(obj)
+        self._abbreviation_dict.setdefault(keys[1], set()).add(obj)
+        self._object_index_keys[obj] = keys
+
+    def _remove_from_object_index(self, obj: Object) -> None:
+        keys = self._object_index_keys.pop(obj, None)
+        if keys is None:
+            return
+        for index, key in zip((self._ident_dict, self._abbreviation_dict), keys):
+            objects = index.get(key)
+            if objects is None:
+                continue
+            objects.discard(obj)
+            if not objects:
+                index.pop(key)
+
+    def _pick_indexed_object(self, objects: Iterable[Object], filtered: bool) -> Object | None:
+        """the same Object wins every time if several Objects share a key, regardless of set order"""
+        if filtered:
+            objects = self.filter_items(objects)
+        return min(objects, key=lambda obj: (obj.name, obj.uuid or ""), default=None)
+
+    def get_object_by_identifier(self, identifier: str, filtered: bool = False) -> Object | None:
+        """if filtered is True only Objects active in the current phase and use_case are considered"""
+        return self._pick_indexed_object(self._ident_dict.get(identifier, ()), filtered)
+
+    def get_object_by_abbreviation(self, abbreviation: str, filtered: bool = False) -> Object | None:
+        """case-insensitive lookup of an Object by its abbreviation"""
+        if abbreviation is None:
+            return None
+        return self._pick_indexed_object(self._abbreviation_dict.get(abbreviation.upper(), ()), filtered)
 
-    def get_uuid_dict(self):
-        pset_dict = {pset.uuid: pset for pset in self.get_all_property_sets()}
-        object_dict = {obj.uuid: obj for obj in self.get_all_objects()}
-        attribute_dict = {attribute.uuid: attribute for attribute in self.get_all_attributes()}
-        aggregation_dict = {aggreg.uuid: aggreg for aggreg in self.get_all_aggregations()}
-        full_dict = pset_dict | object_dict | attribute_dict | aggregation_dict
-        if None in full_dict:
-            full_dict.pop(None)
-        return full_dict
+    def get_uuid_dict(self) -> dict[str, Attribute | PropertySet | Object | Aggregation]:
+        self.load_pending_objects()
+        return dict(self._uuid_dict)
+
+    def get_uuids(self) -> set[str]:
+        """uuids of all items, including the content of pending Objects which doesn't get loaded for this"""
+        uuids = set(self._uuid_dict)
+        if self._pending_objects:
+            uuids.update(self._store.get_content_uuids({obj.uuid for obj in self._pending_objects}))
+        return uuids
 
     def get_element_by_uuid(self, uuid: str) -> Attribute | PropertySet | Object | Aggregation | None:
         if uuid is None:
             return None
-        return self.get_uuid_dict().get(uuid)
+        item = self._uuid_dict.get(uuid)
+        if item is None and self._pending_objects:
+            obj = self._store.get_object_of(uuid)
+            if obj is not None:
+                self.load_pending_object(obj)
+                item = self._uuid_dict.get(uuid)
+        return item
 
     @classmethod
-    def open(cls, path: str | os.PathLike) -> Project:
+    def open(cls, path: str | os.PathLike, stream: bool = False,
+             cache: filehandling.cache.LoadCache | None = None,
+             include: filehandling.selection.Selection | str | Iterable[str] | None = None) -> Project:
+        """
+        the format is picked by extension: .sombin is the binary format, .somdb a SQLite database whose Objects get
+        loaded on demand, everything else gets read as JSON
+        stream: decode a JSON file entity by entity to keep the peak memory low on very large files
+        cache: restore the project from this cache if the file didn't change since it got cached
+        (default: the cache set by the environment variable SOMCREATOR_LOAD_CACHE, if any)
+        include: only load the Objects of this Selection (or these ident values) with the entities they depend on.
+        Skips the cache and stream mode. Ignored for .somdb files, those load the content of Objects on demand anyway
+        Opening doesn't change SOMcreator.active_project, so several files can be opened on different threads.
+        Assign the opened Project to SOMcreator.active_project to activate it
+        """
+        if filehandling.database.is_database_path(path):
+            return filehandling.database.open_database(cls, path)
+        if include is not None:
+            include = filehandling.selection.Selection.create(include)
+            if filehandling.is_binary_path(path):
+                return filehandling.open_binary(cls, path, include)
+            return filehandling.open_json(cls, path, include)
+        if cache is None:
+            cache = filehandling.cache.get_default_cache()
+        if cache is not None:
+            return cache.open(path, lambda: cls._open_file(path, stream))
+        return cls._open_file(path, stream)
+
+    @classmethod
+    def _open_file(cls, path: str | os.PathLike, stream: bool) -> Project:
+        if filehandling.is_binary_path(path):
+            return filehandling.open_binary(cls, path)
+        if stream:
+            return filehandling.open_json_stream(cls, path)
         return filehandling.open_json(cls, path)
 
-    def save(self, path: str | os.PathLike) -> dict:
-        json_dict = filehandling.export_json(self, path)
+    def save(self, path: str | os.PathLike, canonical: bool = False, lean: bool = False,
+             incremental: bool = False) -> dict:
+        """
+        the format is picked by extension: .sombin is the binary format, .somdb a SQLite database,
+        everything else gets written as JSON
+        canonical: write JSON with sorted keys without whitespace, byte-identical for identical projects
+        lean: omit all-True filter matrices, inherited descriptions and other values the loader restores on its own
+        incremental: append the items that changed since the last save to the journal of a JSON file
+        (see filehandling.journal) instead of rewriting it
+        saving to the .somdb file the project was opened from only writes the items that changed since the last save,
+        no dict gets returned in that case because building it would load every pending Object
+        """
+        if filehandling.database.is_database_path(path):
+            filehandling.database.export_database(self, path)
+            return dict()
+        if filehandling.is_binary_path(path):
+            return filehandling.export_binary(self, path, lean=lean)
+        if incremental:
+            return filehandling.export_json_incremental(self, path, canonical, lean)
+        json_dict = filehandling.export_json(self, path, canonical, lean)
         return json_dict
 
     @property
@@ -157,6 +602,7 @@ class Project(object):
     @name.setter
     def name(self, value: str):
         self._name = value
+        self._tree_revision += 1  # the name is the id of the root node of tree()
 
     @property
     def author(self) -> str:
@@ -174,22 +620,37 @@ class Project(object):
     def version(self, value: str):
         self._version = value
 
-    def tree(self) -> AnyNode:
-        def create_childen(node: AnyNode):
-            n_obj: Object = node.obj
-            for child in n_obj.children:
-                child_node = AnyNode(name=child.name, id=child.ident_value, obj=child, parent=node)
-                create_childen(child_node)
-
-        base = AnyNode(id=self.name, obj=self)
-        root_objects = list()
-        for obj in self.objects:
-            if obj.parent is not None:
+    def tree(self, lightweight: bool = False) -> AnyNode | TreeNode:
+        """
+        returns the active Objects (current phase & use_case) as a tree below a node of the Project.
+        The tree is shared until the Project or an Object gets renamed or an Object gets added, removed, re-parented or
+        filtered, don't modify it.
+        lightweight: TreeNodes instead of anytree.AnyNodes for read-only traversal
+        """
+        key = (id(self.current_project_phase), id(self.current_use_case), lightweight)
+        revision, root = self._trees.get(key, (None, None))
+        if revision != self._tree_revision:
+            root = self._build_tree(TreeNode if lightweight else AnyNode)
+            self._trees[key] = (self._tree_revision, root)
+        return root
+
+    def _build_tree(self, node_type: type[AnyNode] | type[TreeNode]) -> AnyNode | TreeNode:
+        base = node_type(id=self.name, obj=self)
+        cell_mask = self.get_filter_mask(self.current_project_phase, self.current_use_case)
+        if cell_mask is None:
+            return base
+        # same filter as Object.children, the mask of the cell only gets looked up once
+        stack = [(obj, base) for obj in self.get_all_objects()
+                 if obj.parent is None and not obj._filter_mask & cell_mask]
+        stack.reverse()
+        visited = set()  # guards against parent loops
+        while stack:
+            obj, parent_node = stack.pop()
+            if obj in visited:
                 continue
-            root_objects.append(AnyNode(name=obj.name, id=obj.ident_value, obj=obj, parent=base))
-
-        for n in root_objects:
-            create_childen(n)
+            visited.add(obj)
+            node = node_type(name=obj.name, id=obj.ident_value, obj=obj, parent=parent_node)
+            stack += [(child, node) for child in obj.get_all_children() if not child._filter_mask & cell_mask]
         return base
 
     # UseCase / ProjectPhase Handling
@@ -212,15 +673,71 @@ class Project(object):
     def set_filter_state(self, phase: Phase, use_case: UseCase, value: bool):
         self._filter_matrix[self.get_phase_index(phase)][self.get_use_case_index(use_case)] = value
 
+    def _create_filter_mask(self) -> int:
+        if self._free_filter_masks:
+            return self._free_filter_masks.pop()
+        mask = 1 << self._next_filter_bit
+        self._next_filter_bit += 1
+        return mask
+
+    def _release_filter_masks(self, masks: list[int]) -> None:
+        """clears the bits of removed cells on all items, so new cells can reuse them and still default to True"""
+        keep = ~sum(masks)
+        for item in self._items:
+            item._filter_mask &= keep
+        self._free_filter_masks.extend(masks)
+        self._free_filter_masks.sort(reverse=True)
+
+    def get_filter_mask(self, phase: Phase, use_case: UseCase) -> int | None:
+        """returns the bit that represents the given phase/use_case combination in the item filter masks"""
+        phase_index = self.get_phase_index(phase)
+        use_case_index = self.get_use_case_index(use_case)
+        if phase_index is None or use_case_index is None:
+            return None
+        return self._filter_masks[phase_index][use_case_index]
+
+    def matrix_to_filter_mask(self, matrix: list[list[bool]]) -> int:
+        """converts a filter matrix into an item filter mask. Missing cells are treated as True"""
+        mask = 0
+        for phase_masks, phase_values in zip(self._filter_masks, matrix):
+            for cell_mask, value in zip(phase_masks, phase_values):
+                if not value:
+                    mask |= cell_mask
+        return mask
+
+    def filter_mask_to_matrix(self, mask: int) -> list[list[bool]]:
+        return [[not mask & cell_mask for cell_mask in phase_masks] for phase_masks in self._filter_masks]
+
+    def filter_items(self, items: Iterable[Hirarchy], phase: Phase | None = None,
+                     use_case: UseCase | None = None) -> list[Hirarchy]:
+        """returns all items that are active in the given phase and use_case (default: current phase & use_case)"""
+        phase = self.current_project_phase if phase is None else phase
+        use_case = self.current_use_case if use_case is None else use_case
+        cell_mask = self.get_filter_mask(phase, use_case)
+        if cell_mask is None:
+            return list()
+        return [item for item in items if not item._filter_mask & cell_mask]
+
+    def _update_filter_indexes(self) -> None:
+        """rebuilds the Phase/UseCase -> index maps. Needs to be called if a Phase or UseCase gets added,
+        removed or renamed"""
+        self._phase_indexes = {phase: index for index, phase in reversed(list(enumerate(self._project_phases)))}
+        self._use_case_indexes = {uc: index for index, uc in reversed(list(enumerate(self._use_cases)))}
+        self._tree_revision += 1
+
     def get_phase_index(self, phase: Phase) -> int | None:
-        if phase in self._project_phases:
-            return self._project_phases.index(phase)
-        return None
+        index = self._phase_indexes.get(phase)
+        if index is None and phase in self._project_phases:  # Phase got renamed without the Project noticing
+            self._update_filter_indexes()
+            index = self._phase_indexes.get(phase)
+        return index
 
     def get_use_case_index(self, use_case: UseCase) -> int | None:
-        if use_case in self._use_cases:
-            return self._use_cases.index(use_case)
-        return None
+        index = self._use_case_indexes.get(use_case)
+        if index is None and use_case in self._use_cases:  # UseCase got renamed without the Project noticing
+            self._update_filter_indexes()
+            index = self._use_case_indexes.get(use_case)
+        return index
 
     def get_project_phase_list(self) -> list[Phase]:
         return list(self._project_phases)
@@ -240,10 +757,11 @@ class Project(object):
     def add_project_phase(self, phase: Phase):
         if phase not in self._project_phases:
             self._project_phases.append(phase)
-            for item in self.get_all_hirarchy_items():
-                item.add_project_phase()
             self._filter_matrix.append([True for _ in self._use_cases])
-        return self._project_phases.index(phase)
+            self._filter_masks.append([self._create_filter_mask() for _ in self._use_cases])
+            self._update_filter_indexes()
+            self.register_change()
+        return self.get_phase_index(phase)
 
     def create_use_case(self, use_case_name: str, long_name: str = None, description: str = None) -> UseCase:
         if long_name is None:
@@ -257,11 +775,13 @@ class Project(object):
     def add_use_case(self, use_case: UseCase):
         if use_case not in self._use_cases:
             self._use_cases.append(use_case)
-            for item in self.get_all_hirarchy_items():
-                item.add_use_case()
             for use_case_list in self._filter_matrix:
                 use_case_list.append(True)
-        return self._use_cases.index(use_case)
+            for mask_list in self._filter_masks:
+                mask_list.append(self._create_filter_mask())
+            self._update_filter_indexes()
+            self.register_change()
+        return self.get_use_case_index(use_case)
 
     def get_project_phase_by_name(self, name: str):
         for project_phase in self._project_phases:
@@ -279,6 +799,8 @@ class Project(object):
             logging.warning(f"Leistungsphase '{old_name}' nicht vorhanden")
             return
         phase.name = new_name
+        self._update_filter_indexes()
+        self.register_change()
 
     def rename_use_case(self, old_name: str, new_name: str) -> None:
         use_case = self.get_use_case_by_name(old_name)
@@ -286,17 +808,19 @@ class Project(object):
             logging.warning(f"Anwendungsfall '{use_case}' nicht vorhanden")
             return
         use_case.name = new_name
+        self._update_filter_indexes()
+        self.register_change()
 
     def remove_project_phase(self, project_phase_name: str) -> None:
         phase = self.get_project_phase_by_name(project_phase_name)
         if phase is None:
             return
         index = self.get_phase_index(phase)
-        for item in self.get_all_hirarchy_items():
-            item.remove_project_phase(phase)
-
         self._project_phases.remove(phase)
         self._filter_matrix.pop(index)
+        self._release_filter_masks(self._filter_masks.pop(index))
+        self._update_filter_indexes()
+        self.register_change()
 
     def remove_use_case(self, use_case_name: str) -> None:
         use_case = self.get_use_case_by_name(use_case_name)
@@ -304,21 +828,22 @@ class Project(object):
             return
         index = self.get_use_case_index(use_case)
         self._use_cases.remove(use_case)
-        for item in self.get_all_hirarchy_items():
-            item.remove_use_case(use_case)
         for use_case_list in self._filter_matrix:
             use_case_list.pop(index)
+        self._release_filter_masks([mask_list.pop(index) for mask_list in self._filter_masks])
+        self._update_filter_indexes()
+        self.register_change()
 
     @property
     def current_project_phase(self) -> Phase:
-        if self._current_project_phase in self._project_phases:
+        if self.get_phase_index(self._current_project_phase) is not None:
             return self._current_project_phase
         else:
             logging.error(f"{self._current_project_phase.name} not in {self._project_phases}")
 
     @property
     def current_use_case(self) -> UseCase:
-        if self._current_use_case in self._use_cases:
+        if self.get_use_case_index(self._current_use_case) is not None:
             return self._current_use_case
         else:
             logging.error(f"{self._current_use_case.name} not in {self._use_cases}")
@@ -355,11 +880,19 @@ class Project(object):
     @property
     @filter_by_filter_dict
     def aggregations(self) -> list[Aggregation]:
-        aggregations = list(Aggregation)
-        return aggregations
+        return self.get_all_aggregations()
+
+
+# shared by all items until their mapping_dict gets accessed
+DEFAULT_MAPPING_DICT = {
+    value_constants.SHARED_PARAMETERS:  True,
+    filehandling.constants.IFC_MAPPING: True
+}
 
 
 class Hirarchy(object, metaclass=IterRegistry):
+    __slots__ = ("_project", "_uuid", "_filter_mask", "_parent", "_children", "_name", "_mapping_dict",
+                 "_description", "_optional", "__weakref__")
 
     def __init__(self, name: str, description: str | None = None, optional: bool | None = None,
                  project: Project | None = None,
@@ -368,23 +901,16 @@ class Hirarchy(object, metaclass=IterRegistry):
             project = SOMcreator.active_project
 
         self._project = project
+        self._uuid = None
         project.add_item(self)
-        self._filter_matrix = filter_matrix
-        if self._filter_matrix is None:
-            self._filter_matrix = list()
-            for _ in project.get_project_phase_list():
-                phase_list = list()
-                for __ in project.get_use_case_list():
-                    phase_list.append(True)
-                self._filter_matrix.append(phase_list)
+        self._filter_mask = 0  # bits of all phase/use_case combinations the item is filtered out of
+        if filter_matrix is not None:
+            self._filter_mask = project.matrix_to_filter_mask(filter_matrix)
 
         self._parent = None
-        self._children = set()
+        self._children = _NO_CHILDREN  # replaced by a set with the first child, most items never get children
         self._name = name
-        self._mapping_dict = {
-            value_constants.SHARED_PARAMETERS:  True,
-            filehandling.constants.IFC_MAPPING: True
-        }
+        self._mapping_dict = None
         self._description = ""
         if description is not None:
             self.description = description
@@ -397,40 +923,57 @@ class Hirarchy(object, metaclass=IterRegistry):
     def project(self):
         return self._project
 
+    @property
+    def uuid(self) -> str | None:
+        return self._uuid
+
+    @uuid.setter
+    def uuid(self, value: str | None) -> None:
+        old_uuid = self._uuid
+        self._uuid = value
+        self._project.change_uuid(self, old_uuid, value)
+
     def remove_parent(self) -> None:
         self._parent = None
+        self.project.register_change(self)
 
-    def get_filter_matrix(self):
-        return self._filter_matrix
+    def get_filter_matrix(self) -> list[list[bool]]:
+        """returns a new matrix, editing it changes nothing. Use set_filter_matrix or set_filter_state instead"""
+        return self.project.filter_mask_to_matrix(self._filter_mask)
+
+    def set_filter_matrix(self, matrix: list[list[bool]]) -> None:
+        self._filter_mask = self.project.matrix_to_filter_mask(matrix)
+        self.project.register_change(self)
 
     def get_filter_state(self, phase: Phase, use_case: UseCase) -> bool | None:
-        phase_index = self.project.get_phase_index(phase)
-        use_case_index = self.project.get_use_case_index(use_case)
-        if phase_index is None or use_case_index is None:
+        cell_mask = self.project.get_filter_mask(phase, use_case)
+        if cell_mask is None:
             return None
-        return self._filter_matrix[phase_index][use_case_index]
+        return not self._filter_mask & cell_mask
 
     def set_filter_state(self, phase: Phase, use_case: UseCase, value: bool) -> None:
-        phase_index = self.project.get_phase_index(phase)
-        use_case_index = self.project.get_use_case_index(use_case)
-        self._filter_matrix[phase_index][use_case_index] = value
+        cell_mask = self.project.get_filter_mask(phase, use_case)
+        if value:
+            self._filter_mask &= ~cell_mask
+        else:
+            self._filter_mask |= cell_mask
+        self.project.register_change(self)
 
     def remove_project_phase(self, phase: Phase) -> None:
-        phase_index = self.project.get_phase_index(phase)
-        self._filter_matrix.pop(phase_index)
+        """deprecated, the filter of an item follows Project.remove_project_phase on its own"""
+        warnings.warn("Hirarchy.remove_project_phase is not needed anymore", DeprecationWarning, stacklevel=2)
 
     def remove_use_case(self, use_case: UseCase) -> None:
-        use_case_index = self.project.get_use_case_index(use_case)
-        for use_case_list in self._filter_matrix:
-            use_case_list.pop(use_case_index)
+        """deprecated, the filter of an item follows Project.remove_use_case on its own"""
+        warnings.warn("Hirarchy.remove_use_case is not needed anymore", DeprecationWarning, stacklevel=2)
 
     def add_project_phase(self) -> None:
-        use_cases = self.project.get_use_case_list()
-        self._filter_matrix.append([True for _ in use_cases])
+        """deprecated, the filter of an item follows Project.add_project_phase on its own"""
+        warnings.warn("Hirarchy.add_project_phase is not needed anymore", DeprecationWarning, stacklevel=2)
 
     def add_use_case(self) -> None:
-        for use_case_list in self._filter_matrix:
-            use_case_list.append(True)
+        """deprecated, the filter of an item follows Project.add_use_case on its own"""
+        warnings.warn("Hirarchy.add_use_case is not needed anymore", DeprecationWarning, stacklevel=2)
 
     @property
     def optional_wo_hirarchy(self) -> bool:
@@ -446,6 +989,11 @@ class Hirarchy(object, metaclass=IterRegistry):
     @optional.setter
     def optional(self, value: bool) -> None:
         self._optional = value
+        self._project.mark_dirty(self)
+
+    @property
+    def description_wo_hirarchy(self) -> str | None:
+        return self._description
 
     @property
     def description(self):
@@ -458,9 +1006,12 @@ class Hirarchy(object, metaclass=IterRegistry):
     @description.setter
     def description(self, value):
         self._description = value
+        self._project.mark_dirty(self)
 
     @property
     def mapping_dict(self) -> dict[str, bool]:
+        if self._mapping_dict is None:  # copy the shared default because the caller might modify it
+            self._mapping_dict = dict(DEFAULT_MAPPING_DICT)
         return self._mapping_dict
 
     @mapping_dict.setter
@@ -474,6 +1025,9 @@ class Hirarchy(object, metaclass=IterRegistry):
     @name.setter
     def name(self, value: str):
         self._name = value
+        self.project.register_change(self)
+        if self._project._defer_cascade(self, "name", value):
+            return
         for child in self.children:
             child.name = value
 
@@ -487,7 +1041,8 @@ class Hirarchy(object, metaclass=IterRegistry):
             self.parent._children.remove(self)
         self._parent = parent
         if parent is not None:
-            self._parent._children.add(self)
+            self._parent._add_to_children(self)
+        self.project.register_change(self)
 
     @property
     def is_parent(self) -> bool:
@@ -506,28 +1061,34 @@ class Hirarchy(object, metaclass=IterRegistry):
     @property
     @filter_by_filter_dict
     def children(self) -> set[PropertySet | Object | Attribute | Aggregation]:
-        return self._children
+        return self.get_all_children()
 
     def get_all_children(self):
+        if self._project._pending_objects:
+            self._project.load_pending_children(self)
         return self._children
 
-    def add_child(self, child: PropertySet | Object | Attribute | Aggregation) -> None:
+    def _add_to_children(self, child: PropertySet | Object | Attribute | Aggregation) -> None:
+        if not self._children:  # might be the shared empty frozenset, also after unpickling
+            self._children = set()
         self._children.add(child)
+
+    def add_child(self, child: PropertySet | Object | Attribute | Aggregation) -> None:
+        self._add_to_children(child)
         child.parent = self
+        self.project.register_change()
 
     def remove_child(self, child: PropertySet | Object | Attribute | Aggregation | Hirarchy) -> None:
         if child in self._children:
             self._children.remove(child)
             child.remove_parent()
+        self.project.register_change()
 
     def delete(self, recursive: bool = False) -> None:
         logging.info(f"Delete {self.__class__.__name__} {self.name} (recursive: {recursive})")
         if self.parent is not None:
             self.parent.remove_child(self)
 
-        if self in self._registry:
-            self._registry.remove(self)
-
         if recursive:
             for child in list(self.children):
                 child.delete(recursive)
@@ -540,30 +1101,34 @@ class Hirarchy(object, metaclass=IterRegistry):
 
 
 class Object(Hirarchy):
-    _registry: set[Object] = set()
+    __slots__ = ("_ident_attrib", "_abbreviation", "_property_sets", "_aggregations", "custom_attribues",
+                 "_ifc_mapping", "_sorted_property_sets", "_property_set_name_dict", "_pending_ident_value")
 
     def __init__(self, name: str, ident_attrib: [Attribute, str], uuid: str = None,
                  ifc_mapping: set[str] | None = None, description: None | str = None,
                  optional: None | bool = None, abbreviation: None | str = None, project: None | Project = None,
                  filter_matrix: list[list[bool]] = None) -> None:
-        super(Object, self).__init__(name, description, optional, project, filter_matrix)
-        self._registry.add(self)
-        self._property_sets: list[PropertySet] = list()
+        # ident_attrib and abbreviation are needed by the project index which is filled in Hirarchy.__init__
         self._ident_attrib = ident_attrib
-        self._aggregations: set[Aggregation] = set()
-        self.custom_attribues = {}
-
+        self._pending_ident_value: str | None = None  # ident_value of an Object whose content is not loaded yet
         self._abbreviation = abbreviation
         if abbreviation is None:
             self._abbreviation = ""
 
+        super(Object, self).__init__(name, description, optional, project, filter_matrix)
+        self._property_sets: list[PropertySet] = list()
+        self._sorted_property_sets: list[PropertySet] | None = None
+        self._property_set_name_dict: dict[str, list[PropertySet]] | None = None
+        self._aggregations: set[Aggregation] = set()
+        self.custom_attribues = {}
+
         self._ifc_mapping = ifc_mapping
         if ifc_mapping is None:
             self._ifc_mapping = {"IfcBuildingElementProxy"}
 
         self.uuid = uuid
         if uuid is None:
-            self.uuid = str(uuid4())
+            self.uuid = _create_uuid()
 
     def __str__(self):
         return f"Object {self.name}"
@@ -589,10 +1154,11 @@ class Object(Hirarchy):
         if new_ident_attribute is None:
             raise ValueError(f"Identifier Attribute could'nt be found")
 
-        new_object = Object(name=self.name, ident_attrib=new_ident_attribute, uuid=str(uuid4()),
+        new_object = Object(name=self.name, ident_attrib=new_ident_attribute, uuid=_create_uuid(),
                             ifc_mapping=self.ifc_mapping,
                             description=self.description, optional=self.optional, abbreviation=self.abbreviation,
-                            project=self.project, filter_matrix=self._filter_matrix)
+                            project=self.project)
+        new_object._filter_mask = self._filter_mask
 
         for pset in new_property_sets:
             new_object.add_property_set(pset)
@@ -613,6 +1179,8 @@ class Object(Hirarchy):
     @abbreviation.setter
     def abbreviation(self, value) -> None:
         self._abbreviation = value
+        self.project.mark_dirty(self)
+        self.project.update_object_index(self)
 
     @property
     def ifc_mapping(self) -> set[str]:
@@ -625,12 +1193,15 @@ class Object(Hirarchy):
             if not (item == "" or item is None):
                 value_set.add(item)
         self._ifc_mapping = value_set
+        self.project.mark_dirty(self)
 
     def add_ifc_map(self, value: str) -> None:
         self._ifc_mapping.add(value)
+        self.project.mark_dirty(self)
 
     def remove_ifc_map(self, value: str) -> None:
         self._ifc_mapping.remove(value)
+        self.project.mark_dirty(self)
 
     @property
     def aggregations(self) -> set[Aggregation]:
@@ -672,20 +1243,63 @@ class Object(Hirarchy):
 
     @property
     def ident_attrib(self) -> Attribute | str:
+        if self._pending_ident_value is not None:
+            self.load_content()
         return self._ident_attrib
 
     @ident_attrib.setter
     def ident_attrib(self, value: Attribute) -> None:
         self._ident_attrib = value
+        self._pending_ident_value = None
+        self.project.mark_dirty(self)
+        self.project.update_object_index(self)
+
+    @property
+    def is_loaded(self) -> bool:
+        """False if the PropertySets of the Object still need to be loaded from the storage backend"""
+        return self not in self._project._pending_objects
+
+    def set_pending(self, ident_value: str) -> None:
+        """marks the Object as not loaded. ident_value gets used for the project index until it is loaded"""
+        self._pending_ident_value = ident_value
+        self.project.add_pending_object(self)
+        self.project.update_object_index(self)
+
+    def load_content(self) -> None:
+        """loads the PropertySets and Attributes of a pending Object"""
+        self.project.load_pending_object(self)
 
     def get_all_property_sets(self) -> list[PropertySet]:
         """returns all Propertysets even if they don't fit the current Project Phase"""
+        if self._pending_ident_value is not None:
+            self.load_content()
         return self._property_sets
 
+    def _get_sorted_property_sets(self) -> list[PropertySet]:
+        """cached list of all PropertySets sorted by name. Don't modify the returned list"""
+        if self._pending_ident_value is not None:
+            self.load_content()
+        if self._sorted_property_sets is None:
+            self._sorted_property_sets = sorted(self._property_sets, key=lambda x: x.name)
+        return self._sorted_property_sets
+
+    def _get_property_set_name_dict(self) -> dict[str, list[PropertySet]]:
+        if self._property_set_name_dict is None:
+            sorted_psets = self._get_sorted_property_sets()  # loads pending content, which clears the caches
+            self._property_set_name_dict = dict()
+            for property_set in sorted_psets:
+                self._property_set_name_dict.setdefault(property_set.name, list()).append(property_set)
+        return self._property_set_name_dict
+
+    def clear_property_set_cache(self) -> None:
+        """needs to be called if a PropertySet gets added, removed or renamed"""
+        self._sorted_property_sets = None
+        self._property_set_name_dict = None
+
     @property
     @filter_by_filter_dict
     def property_sets(self) -> list[PropertySet]:
-        return sorted(self._property_sets, key=lambda x: x.name)
+        return self._get_sorted_property_sets()
 
     # override name setter because of intheritance
     @property
@@ -695,14 +1309,24 @@ class Object(Hirarchy):
     @name.setter
     def name(self, value: str):
         self._name = value
+        self.project.register_change(self)
 
     def add_property_set(self, property_set: PropertySet) -> None:
+        if self._pending_ident_value is not None:
+            self.load_content()
         self._property_sets.append(property_set)
+        self.clear_property_set_cache()
         property_set.object = self
+        for attribute in property_set.get_all_attributes():  # the stored Attributes reference their Object
+            self.project.mark_dirty(attribute)
+        self.project.register_change()
 
     def remove_property_set(self, property_set: PropertySet) -> None:
         if property_set in self._property_sets:
             self._property_sets.remove(property_set)
+            self.clear_property_set_cache()
+            self.project.mark_dirty(property_set)
+        self.project.register_change()
 
     def get_all_attributes(self, inherit: bool = False) -> list[Attribute]:
         attributes = list()
@@ -728,33 +1352,34 @@ class Object(Hirarchy):
             aggregation.delete(recursive)
 
     def get_property_set_by_name(self, property_set_name: str) -> PropertySet | None:
-        for property_set in self.property_sets:
-            if property_set.name == property_set_name:
-                return property_set
-        return None
+        property_sets = self._get_property_set_name_dict().get(property_set_name, ())
+        return next(iter(self.project.filter_items(property_sets)), None)
 
     @property
     def ident_value(self) -> str:
+        if self._pending_ident_value is not None:
+            return self._pending_ident_value
         if self.is_concept:
             return str()
         return ";".join(str(x) for x in self.ident_attrib.value)
 
 
 class PropertySet(Hirarchy):
-    _registry: set[PropertySet] = set()
+    __slots__ = ("_attributes", "_object", "_sorted_attributes", "_attribute_name_dict")
 
     def __init__(self, name: str, obj: Object = None, uuid: str = None, description: None | str = None,
                  optional: None | bool = None, project: None | Project = None,
                  filter_matrix: list[list[bool]] = None) -> None:
         super(PropertySet, self).__init__(name, description, optional, project, filter_matrix)
         self._attributes = set()
+        self._sorted_attributes: list[Attribute] | None = None
+        self._attribute_name_dict: dict[str, list[Attribute]] | None = None
         self._object = None
         if obj is not None:
             obj.add_property_set(self)  # adds Pset to Object and sets pset.object = obj
-        self._registry.add(self)
         self.uuid = uuid
         if self.uuid is None:
-            self.uuid = str(uuid4())
+            self.uuid = _create_uuid()
 
     def __lt__(self, other):
         if isinstance(other, PropertySet):
@@ -766,9 +1391,9 @@ class PropertySet(Hirarchy):
         return f"PropertySet: {self.name}"
 
     def __copy__(self) -> PropertySet:
-        new_pset = PropertySet(name=self.name, obj=None, uuid=str(uuid4()), description=self.description,
-                               optional=self.optional, project=self.project,
-                               filter_matrix=self._filter_matrix)
+        new_pset = PropertySet(name=self.name, obj=None, uuid=_create_uuid(), description=self.description,
+                               optional=self.optional, project=self.project)
+        new_pset._filter_mask = self._filter_mask
 
         for attribute in self.attributes:
             new_attribute = cp.copy(attribute)
@@ -783,6 +1408,21 @@ class PropertySet(Hirarchy):
     def is_predefined(self) -> bool:
         return self.object is None
 
+    @property
+    def name(self) -> str:
+        return super(PropertySet, self).name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self.project.register_change(self)
+        if self.object is not None:
+            self.object.clear_property_set_cache()
+        if self._project._defer_cascade(self, "name", value):
+            return
+        for child in self.children:
+            child.name = value
+
     @property
     def parent(self) -> PropertySet:
         parent = super(PropertySet, self).parent
@@ -800,6 +1440,7 @@ class PropertySet(Hirarchy):
             self.remove_parent()
             return
         self._parent = parent
+        self.project.register_change(self)
 
     def remove_child(self, child: PropertySet) -> None:
         super().remove_child(child)
@@ -834,35 +1475,60 @@ class PropertySet(Hirarchy):
     @object.setter
     def object(self, value: Object):
         self._object = value
+        self.project.register_change(self)
 
     def get_all_attributes(self) -> set[Attribute]:
         """returns all Attributes even if they don't fit the current Project Phase"""
         return self._attributes
 
+    def _get_sorted_attributes(self) -> list[Attribute]:
+        """cached list of all Attributes sorted by name. Don't modify the returned list"""
+        if self._sorted_attributes is None:
+            self._sorted_attributes = sorted(self._attributes, key=lambda a: a.name)
+        return self._sorted_attributes
+
+    def _get_attribute_name_dict(self) -> dict[str, list[Attribute]]:
+        if self._attribute_name_dict is None:
+            self._attribute_name_dict = dict()
+            for attribute in self._get_sorted_attributes():
+                self._attribute_name_dict.setdefault(attribute.name.lower(), list()).append(attribute)
+        return self._attribute_name_dict
+
+    def clear_attribute_cache(self) -> None:
+        """needs to be called if an Attribute gets added, removed or renamed"""
+        self._sorted_attributes = None
+        self._attribute_name_dict = None
+
     @property
     @filter_by_filter_dict
     def attributes(self) -> list[Attribute]:
         """returns Attributes filtered"""
-        return sorted(self._attributes, key=lambda a: a.name)
+        return self._get_sorted_attributes()
 
     @attributes.setter
     def attributes(self, value: set[Attribute]) -> None:
         self._attributes = value
+        self.clear_attribute_cache()
+        self.project.register_change()
+        for attribute in value:
+            self.project.mark_dirty(attribute)
 
     def add_attribute(self, value: Attribute) -> None:
         if value.property_set is not None and value.property_set != self:
             value.property_set.remove_attribute(value)
         self._attributes.add(value)
+        self.clear_attribute_cache()
+        self.project.register_change()
 
         value.property_set = self
         for child in self.children:
-            attrib: Attribute = cp.copy(value)
-            value.add_child(attrib)
-            child.add_attribute(attrib)
+            child.add_attribute(value.create_child())
 
     def remove_attribute(self, value: Attribute, recursive=False) -> None:
         if value in self.attributes:
             self._attributes.remove(value)
+            self.clear_attribute_cache()
+            self.project.register_change(value)
             if recursive:
                 for child in list(value.children):
                     child.property_set.remove_attribute(child)
@@ -870,15 +1536,14 @@ class PropertySet(Hirarchy):
             logging.warning(f"{self.name} -> {value} not in Attributes")
 
     def get_attribute_by_name(self, name: str):
-        for attribute in self.attributes:
-            if attribute.name.lower() == name.lower():
-                return attribute
-        return None
+        attributes = self._get_attribute_name_dict().get(name.lower(), ())
+        return next(iter(self.project.filter_items(attributes)), None)
 
     def create_child(self, name) -> PropertySet:
         child = PropertySet(name=name, project=self.project)
-        self._children.add(child)
+        self._add_to_children(child)
         child.parent = self
+        self.project.register_change()
         for attribute in self.attributes:
             new_attrib = attribute.create_child()
             child.add_attribute(new_attrib)
@@ -886,7 +1551,8 @@ class PropertySet(Hirarchy):
 
 
 class Attribute(Hirarchy):
-    _registry: set[Attribute] = set()
+    __slots__ = ("_value", "_property_set", "_value_type", "_data_type", "_revit_name", "_child_inherits_values",
+                 "_resolved_value")
 
     def __init__(self, property_set: PropertySet | None, name: str, value: list, value_type: str,
                  data_type: str = value_constants.LABEL,
@@ -895,11 +1561,11 @@ class Attribute(Hirarchy):
                  filter_matrix: list[list[bool]] = None):
 
         super(Attribute, self).__init__(name, description, optional, project, filter_matrix)
-        self._value = value
+        self._value: list | None = value  # None: shares the values of the parent until they get set (copy-on-write)
+        self._resolved_value: list | None = None
         self._property_set = property_set
         self._value_type = value_type
         self._data_type = data_type
-        self._registry.add(self)
         if revit_mapping is None:
             self._revit_name = name
         else:
@@ -909,7 +1575,7 @@ class Attribute(Hirarchy):
         self.uuid = uuid
 
         if self.uuid is None:
-            self.uuid = str(uuid4())
+            self.uuid = _create_uuid()
         if property_set is not None:
             property_set.add_attribute(self)
 
@@ -927,9 +1593,10 @@ class Attribute(Hirarchy):
         new_attrib = Attribute(property_set=None, name=self.name, value=cp.copy(self.value),
                                value_type=cp.copy(self.value_type),
                                data_type=cp.copy(self.data_type), child_inherits_values=self.child_inherits_values,
-                               uuid=str(uuid4()),
+                               uuid=_create_uuid(),
                                description=self.description, optional=self.optional, revit_mapping=self.revit_name,
-                               project=self.project, filter_matrix=self._filter_matrix)
+                               project=self.project)
+        new_attrib._filter_mask = self._filter_mask
 
         if self.parent is not None:
             self.parent.add_child(new_attrib)
@@ -948,6 +1615,7 @@ class Attribute(Hirarchy):
     @revit_name.setter
     def revit_name(self, value: str) -> None:
         self._revit_name = value
+        self.project.mark_dirty(self)
 
     @property
     def child_inherits_values(self) -> bool:
@@ -956,6 +1624,9 @@ class Attribute(Hirarchy):
     @child_inherits_values.setter
     def child_inherits_values(self, value: bool) -> None:
         self._child_inherits_values = value
+        self.project.mark_dirty(self)
+        self.clear_value_cache()
+        self.update_ident_index()
 
     @property
     def name(self) -> str:
@@ -965,6 +1636,11 @@ class Attribute(Hirarchy):
     def name(self, value: str) -> None:
         # ToDo: add request for unlink
         self._name = value
+        self.project.register_change(self)
+        if self.property_set is not None:
+            self.property_set.clear_attribute_cache()
+        if self._project._defer_cascade(self, "name", value):
+            return
         for child in self.children:
             child.name = value
 
@@ -976,27 +1652,101 @@ class Attribute(Hirarchy):
             return True
         return False
 
+    @property
+    def is_sharing_values(self) -> bool:
+        """True if the values are read from the parent because they never got set on this Attribute"""
+        return self._value is None and self._parent is not None
+
     def get_own_values(self):
         """returns values without inherited values"""
         if not self.parent:
-            return self._value
-        return [v for v in self._value if v not in self.parent.value]
+            return list() if self._value is None else self._value
+        if self._value is None:
+            return list()
+        return _subtract_values(self._value, self.parent.value)
+
     @property
     def value(self) -> list:
-        if self.is_inheriting_values:
-            return self.parent.value + self.get_own_values()
-        return self._value
+        if self._value is None:
+            return list() if self._parent is None else list(self._parent.value)
+        if not self.is_inheriting_values:
+            return list(self._value)
+        if self._resolved_value is None:
+            parent_values = self.parent.value
+            self._resolved_value = parent_values + _subtract_values(self._value, parent_values)
+        return list(self._resolved_value)
 
     @value.setter
     def value(self, values: list) -> None:
         if self.is_inheriting_values:
-            own_values = list()
-            for value in values:
-                if value not in self.parent.value:
-                    own_values.append(value)
-            self._value = own_values
+            self._value = _subtract_values(values, self.parent.value)
         else:
             self._value = values
+        self.project.mark_dirty(self)
+        self.clear_value_cache()
+        self.update_ident_index()
+
+    def clear_value_cache(self) -> None:
+        """drops the resolved inherited values of this Attribute and all of its descendants"""
+        attributes = [self]
+        while attributes:
+            attribute = attributes.pop()
+            attribute._resolved_value = None
+            attributes.extend(attribute.get_all_children())
+
+    def update_ident_index(self) -> None:
+        """re-indexes all Objects whose ident_value depends on the values of this Attribute"""
+        if self._project._defer_ident_index(self):
+            return
+        attributes = [self]
+        while attributes:
+            attribute = attributes.pop()
+            property_set = attribute.property_set
+            if property_set is not None and property_set.object is not None:
+                if property_set.object.ident_attrib is attribute:
+                    self.project.update_object_index(property_set.object)
+            attributes.extend(attribute.get_all_children())
+
+    @property
+    def parent(self) -> Attribute:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Attribute) -> None:
+        if parent is not self._parent:
+            self._materialize_value()
+        Hirarchy.parent.fset(self, parent)
+        self.clear_value_cache()
+
+    def _materialize_value(self) -> None:
+        """copies the shared values and description of the parent before the link to it gets changed"""
+        if self._value is not None or self._parent is None:
+            return
+        self._value = list() if self.is_inheriting_values else list(self._parent.value)
+        if not self._description:
+            self._description = self._parent.description
+
+    def remove_parent(self) -> None:
+        self._materialize_value()
+        super(Attribute, self).remove_parent()
+        self.clear_value_cache()
+
+    def create_child(self) -> Attribute:
+        """the child shares the values of this Attribute until they get set on the child (copy-on-write)"""
+        child = Attribute(None, self.name, list(), self.value_type, self.data_type, self.child_inherits_values,
+                          revit_mapping=self.revit_name, project=self.project)
+        child._filter_mask = self._filter_mask
+        self.add_child(child)
+        child._value = None
+        return child
+
+    def add_child(self, child: Attribute) -> None:
+        super(Attribute, self).add_child(child)
+        child.update_ident_index()
+
+    def remove_child(self, child: Attribute) -> None:
+        super(Attribute, self).remove_child(child)
+        child.update_ident_index()
 
     @property
     def value_type(self) -> str:
@@ -1007,10 +1757,12 @@ class Attribute(Hirarchy):
 
         if not self.is_child:
             self._value_type = value
+            self.project.mark_dirty(self)
 
-        if self.is_parent:
+        if self.is_parent and not self._project._defer_cascade(self, "value_type", value):
             for child in self.children:
                 child._value_type = value
+                self.project.mark_dirty(child)
 
     @property
     def data_type(self) -> str:
@@ -1025,10 +1777,12 @@ class Attribute(Hirarchy):
     def data_type(self, value: str) -> None:
         if not self.is_child:
             self._data_type = value
+            self.project.mark_dirty(self)
 
-        if self.is_parent:
+        if self.is_parent and not self._project._defer_cascade(self, "data_type", value):
             for child in self.children:
                 child._data_type = value
+                self.project.mark_dirty(child)
 
     @property
     def property_set(self) -> PropertySet:
@@ -1037,6 +1791,7 @@ class Attribute(Hirarchy):
     @property_set.setter
     def property_set(self, value: PropertySet) -> None:
         self._property_set = value
+        self.project.mark_dirty(self)
 
     def is_equal(self, attribute: Attribute) -> bool:
         equal = True
@@ -1059,14 +1814,9 @@ class Attribute(Hirarchy):
         super(Attribute, self).delete(recursive)
         self.property_set.remove_attribute(self)
 
-    def create_child(self) -> Attribute:
-        child = cp.copy(self)
-        self.add_child(child)
-        return child
-
 
 class Aggregation(Hirarchy):
-    _registry: set[Aggregation] = set()
+    __slots__ = ("object", "_parent_connection")
 
     def __str__(self):
         return self.name
@@ -1076,9 +1826,8 @@ class Aggregation(Hirarchy):
                  optional: None | bool = None, filter_matrix: list[list[bool]] = None):
 
         super(Aggregation, self).__init__(obj.name, description, optional, obj.project, filter_matrix)
-        self._registry.add(self)
         if uuid is None:
-            self.uuid = str(uuid4())
+            self.uuid = _create_uuid()
         else:
             self.uuid = str(uuid)
         self.object = obj
@@ -1106,6 +1855,7 @@ class Aggregation(Hirarchy):
     @parent_connection.setter
     def parent_connection(self, value):
         self._parent_connection = value
+        self.project.mark_dirty(self)
 
     @property
     def parent(self) -> Aggregation:
@@ -1116,6 +1866,7 @@ class Aggregation(Hirarchy):
             return False
         self._parent = value
         self._parent_connection = connection_type
+        self.project.register_change(self)
         return True
 
     def add_child(self, child: Aggregation, connection_type: int = value_constants.AGGREGATION) -> bool:
@@ -1138,8 +1889,9 @@ class Aggregation(Hirarchy):
         if not child.set_parent(self, connection_type):
             return False
 
-        self._children.add(child)
+        self._add_to_children(child)
         child.parent_connection = connection_type
+        self.project.register_change()
         return True
 
     @property
@@ -1168,6 +1920,559 @@ class Aggregation(Hirarchy):
         return self.id_group() + "_" + self.object.abbreviation + "_xxx"
 
 
+class BulkBuilder(object):
+    """
+    Collects rows of Objects, PropertySets and Attributes and creates them when the with block ends.
+    Rows reference each other and existing items by uuid, every add method returns the uuid of the new row.
+    All entities get created before any of them gets linked to its parent, and parents get linked before their
+    children, so no change cascades into existing children. New entities get attached to new containers directly,
+    the sort caches of the containers get cleared once. PropertySets with a parent get a child of every
+    parent Attribute that has no row in them (like PropertySet.create_child). The object index gets updated once
+    per Object at the end. Nothing gets created if the with block raises an exception or if a row references
+    a uuid that is neither a row nor an item of the matching type in the project (KeyError)
+    """
+
+    def __init__(self, project: Project) -> None:
+        self.project = project
+        self._object_rows: list[dict] = list()
+        self._property_set_rows: list[dict] = list()
+        self._attribute_rows: list[dict] = list()
+
+    def __enter__(self) -> BulkBuilder:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.build()
+
+    def add_object(self, name: str, ident_attribute: str | None = None, ifc_mapping: set[str] | None = None,
+                   abbreviation: str | None = None, description: str | None = None, optional: bool | None = None,
+                   parent: str | None = None, uuid: str | None = None,
+                   filter_matrix: list[list[bool]] | None = None) -> str:
+        """ident_attribute: uuid of the identifier Attribute"""
+        uuid = _create_uuid() if uuid is None else uuid
+        self._object_rows.append({"name": name, "ident_attribute": ident_attribute, "ifc_mapping": ifc_mapping,
+                                  "abbreviation": abbreviation, "description": description, "optional": optional,
+                                  "parent": parent, "uuid": uuid, "filter_matrix": filter_matrix})
+        return uuid
+
+    def add_property_set(self, name: str, obj: str | None = None, description: str | None = None,
+                         optional: bool | None = None, parent: str | None = None, uuid: str | None = None,
+                         filter_matrix: list[list[bool]] | None = None) -> str:
+        """obj: uuid of the Object, None creates a predefined PropertySet"""
+        uuid = _create_uuid() if uuid is None else uuid
+        self._property_set_rows.append({"name": name, "obj": obj, "description": description, "optional": optional,
+                                        "parent": parent, "uuid": uuid, "filter_matrix": filter_matrix})
+        return uuid
+
+    def add_attribute(self, property_set: str, name: str, value: list, value_type: str,
+                      data_type: str = value_constants.LABEL, child_inherits_values: bool = False,
+                      description: str | None = None, optional: bool | None = None, revit_mapping: str | None = None,
+                      parent: str | None = None, uuid: str | None = None,
+                      filter_matrix: list[list[bool]] | None = None) -> str:
+        """property_set: uuid of the PropertySet"""
+        uuid = _create_uuid() if uuid is None else uuid
+        self._attribute_rows.append({"property_set": property_set, "name": name, "value": value,
+                                     "value_type": value_type, "data_type": data_type,
+                                     "child_inherits_values": child_inherits_values, "description": description,
+                                     "optional": optional, "revit_mapping": revit_mapping, "parent": parent,
+                                     "uuid": uuid, "filter_matrix": filter_matrix})
+        return uuid
+
+    def add_objects(self, rows: Iterable[dict]) -> list[str]:
+        """rows: dicts with the arguments of add_object"""
+        return [self.add_object(**row) for row in rows]
+
+    def add_property_sets(self, rows: Iterable[dict]) -> list[str]:
+        """rows: dicts with the arguments of add_property_set"""
+        return [self.add_property_set(**row) for row in rows]
+
+    def add_attributes(self, rows: Iterable[dict]) -> list[str]:
+        """rows: dicts with the arguments of add_attribute"""
+        return [self.add_attribute(**row) for row in rows]
+
+    @staticmethod
+    def _get_depths(rows: list[dict]) -> dict[str, int]:
+        """distance of every row to the first ancestor that is not part of the rows"""
+        parents = {row["uuid"]: row["parent"] for row in rows}
+        depths: dict[str, int] = dict()
+        for uuid in parents:
+            chain = list()
+            while uuid in parents and uuid not in depths and uuid not in chain:
+                chain.append(uuid)
+                uuid = parents[uuid]
+            depth = depths.get(uuid, -1)
+            for uuid in reversed(chain):
+                depth += 1
+                depths[uuid] = depth
+        return depths
+
+    def _validate(self) -> None:
+        """raises a KeyError for the first row with a duplicate uuid or a reference that can't be resolved"""
+        proj = self.project
+        row_types: dict[str, type] = dict()
+        for item_type, rows in ((Object, self._object_rows), (PropertySet, self._property_set_rows),
+                                (Attribute, self._attribute_rows)):
+            for row in rows:
+                if row["uuid"] in row_types or proj.get_element_by_uuid(row["uuid"]) is not None:
+                    raise KeyError(f"{item_type.__name__} row '{row['name']}': uuid {row['uuid']} is already used")
+                row_types[row["uuid"]] = item_type
+
+        def check(row: dict, key: str, item_type: type, required: bool = False) -> None:
+            uuid = row[key]
+            if uuid is None and not required:
+                return
+            if row_types.get(uuid) is item_type or isinstance(proj.get_element_by_uuid(uuid), item_type):
+                return
+            raise KeyError(f"row '{row['name']}' ({row['uuid']}): {key} {uuid} is no {item_type.__name__}")
+
+        for row in self._object_rows:
+            check(row, "parent", Object)
+            check(row, "ident_attribute", Attribute)
+        for row in self._property_set_rows:
+            check(row, "obj", Object)
+            check(row, "parent", PropertySet)
+        for row in self._attribute_rows:
+            check(row, "property_set", PropertySet, required=True)
+            check(row, "parent", Attribute)
+
+    def build(self) -> None:
+        self._validate()
+        proj = self.project
+        items: dict[str, Hirarchy] = dict()
+
+        def get_item(uuid: str | None) -> Hirarchy | None:
+            if uuid is None:
+                return None
+            item = items.get(uuid)
+            return proj.get_element_by_uuid(uuid) if item is None else item
+
+        deferring = proj._defer_object_index()
+        try:
+            for row in self._object_rows:
+                items[row["uuid"]] = Object(row["name"], None, row["uuid"], row["ifc_mapping"], row["description"],
+                                            row["optional"], row["abbreviation"], proj, row["filter_matrix"])
+            for row in self._property_set_rows:
+                pset = PropertySet(row["name"], None, row["uuid"], row["description"], row["optional"], proj,
+                                   row["filter_matrix"])
+                items[row["uuid"]] = pset
+                obj = get_item(row["obj"])
+                if obj is None:
+                    continue
+                if row["obj"] in items:  # new Objects have no caches yet, they get cleared at the end
+                    obj._property_sets.append(pset)
+                    pset._object = obj
+                else:
+                    obj.add_property_set(pset)
+            for row in self._attribute_rows:
+                attribute = Attribute(None, row["name"], row["value"], row["value_type"], row["data_type"],
+                                      row["child_inherits_values"], row["uuid"], row["description"], row["optional"],
+                                      row["revit_mapping"], proj, row["filter_matrix"])
+                items[row["uuid"]] = attribute
+                self._attach_attribute(get_item(row["property_set"]), attribute, items)
+
+            links = self._inherit_attributes(get_item, items)
+            for rows in (self._object_rows, self._property_set_rows, self._attribute_rows):
+                depths = self._get_depths(rows)
+                links += [(depths[row["uuid"]], items[row["uuid"]], get_item(row["parent"])) for row in rows
+                          if row["parent"] is not None]
+            links.sort(key=lambda link: link[0])
+            for _, child, parent in links:
+                # the object index of all new Objects gets updated at the end, so Attribute.add_child isn't needed
+                if parent is not None:
+                    Hirarchy.add_child(parent, child)
+
+            for row in self._object_rows:
+                obj = items[row["uuid"]]
+                obj.clear_property_set_cache()
+                if row["ident_attribute"] is not None:
+                    obj.ident_attrib = get_item(row["ident_attribute"])
+            for row in self._property_set_rows:
+                items[row["uuid"]].clear_attribute_cache()
+        finally:
+            if deferring:
+                proj._flush_object_index()
+        self._object_rows, self._property_set_rows, self._attribute_rows = list(), list(), list()
+
+    @staticmethod
+    def _attach_attribute(pset: PropertySet | None, attribute: Attribute, items: dict[str, Hirarchy]) -> None:
+        if pset is None:
+            return
+        if items.get(pset.uuid) is pset:  # new PropertySets have no children yet
+            pset._attributes.add(attribute)
+            attribute._property_set = pset
+        else:
+            pset.add_attribute(attribute)
+
+    def _inherit_attributes(self, get_item, items: dict[str, Hirarchy]) -> list[tuple[int, Attribute, Attribute]]:
+        """
+        creates the missing child Attributes of PropertySets with a parent, before anything is linked.
+        returns the links of the new Attributes (depth, child, parent)
+        """
+        depths = self._get_depths(self._property_set_rows)
+        attribute_parents: dict[PropertySet, set[Attribute]] = dict()  # parents of the Attributes of a PropertySet
+        attributes: dict[PropertySet, list[Attribute]] = dict()  # including the inherited ones without link
+        for row in self._attribute_rows:
+            pset = get_item(row["property_set"])
+            attributes.setdefault(pset, list()).append(get_item(row["uuid"]))
+            attribute_parents.setdefault(pset, set()).add(get_item(row["parent"]))
+
+        links = list()
+        for row in sorted(self._property_set_rows, key=lambda r: depths[r["uuid"]]):
+            parent = get_item(row["parent"])
+            if parent is None:
+                continue
+            pset: PropertySet = get_item(row["uuid"])
+            existing_parents = attribute_parents.get(pset, set())
+            if items.get(parent.uuid) is parent:
+                parent_attributes = attributes.get(parent, ())
+            else:  # existing PropertySets already contain the new rows
+                parent_attributes = list(parent.get_all_attributes())
+            for attribute in parent_attributes:
+                if attribute in existing_parents:
+                    continue
+                child = Attribute(None, attribute.name, list(), attribute.value_type,
+                                  attribute.data_type, attribute.child_inherits_values, None, None, None,
+                                  attribute.revit_name, self.project)
+                child._value = None  # shares the values of its parent like Attribute.create_child
+                child._filter_mask = attribute._filter_mask
+                self._attach_attribute(pset, child, items)
+                attributes.setdefault(pset, list()).append(child)
+                links.append((depths[row["uuid"]], child, attribute))
+        return links
+
+
+# kinds of ChangeEvents
+CREATED = "created"
+MODIFIED = "modified"
+REMOVED = "removed"
+
+_UNSET = object()
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    item: Hirarchy | None  # None for changes of the Project itself or of its structure
+    kind: str  # CREATED, MODIFIED or REMOVED
+
+
+def _copy_state(value, depth: int = 1):
+    """copies the containers of a state down to depth, their entries are shared"""
+    if depth == 0:
+        return value
+    value_type = type(value)
+    if value_type is list:
+        return [_copy_state(entry, depth - 1) for entry in value]
+    if value_type is dict:
+        return {key: _copy_state(entry, depth - 1) for key, entry in value.items()}
+    if value_type is set:
+        return set(value)
+    return value
+
+
+_SLOT_NAMES: dict[type, tuple[str, ...]] = dict()
+
+
+def _get_slot_names(item_type: type) -> tuple[str, ...]:
+    names = _SLOT_NAMES.get(item_type)
+    if names is None:
+        names = tuple(name for cls in item_type.__mro__ for name in cls.__dict__.get("__slots__", ())
+                      if name != "__weakref__")
+        _SLOT_NAMES[item_type] = names
+    return names
+
+
+class Transaction(object):
+    """
+    Collects the changes of a with block. Changes of name, value_type and data_type cascade into the children once
+    per item at the end, items that got a new value themselves later on keep it. Objects and Attributes get
+    re-indexed once. The change listeners get one ChangeEvent per changed item at the end, items that got created
+    and removed inside the block are left out.
+    If rollback is True, the state of all items gets copied at the start (about a second per 100000 items) and
+    restored if the with block raises an exception or rollback() gets called. Without rollback the changes of a
+    with block that raises get committed. A transaction inside of a transaction becomes part of the outer one, so a
+    transaction with rollback can only be nested in a transaction with rollback
+    """
+
+    _RECURSIVE_CASCADES = {"name"}  # value_type and data_type only get passed to the direct children
+
+    def __init__(self, project: Project, rollback: bool = False) -> None:
+        self.project = project
+        self.rollback_enabled = rollback
+        self._outer: Transaction | None = None
+        self._changes: dict[Hirarchy | None, str] = dict()  # first kind of change per item
+        self._cascades: dict[tuple[Hirarchy, str], tuple[int, object]] = dict()  # (item, field) -> (sequence, value)
+        self._sequence = 0
+        self._ident_attributes: set[Attribute] = set()
+        self._applying = False
+        self._deferring_object_index = False
+        self._item_states: dict[Hirarchy, tuple] | None = None
+        self._project_state: dict | None = None
+
+    def __enter__(self) -> Transaction:
+        proj = self.project
+        if proj._transaction is not None:
+            if self.rollback_enabled and not proj._transaction.rollback_enabled:
+                raise ValueError("a Transaction with rollback can't be nested in a Transaction without rollback")
+            self._outer = proj._transaction
+            return self
+        if self.rollback_enabled:
+            self._save_state()
+        self._deferring_object_index = proj._defer_object_index()
+        proj._transaction = self
+        proj._update_change_recording()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._outer is not None or self.project._transaction is not self:  # joined or rolled back
+            return
+        if exc_type is not None and self.rollback_enabled:
+            self.rollback()
+            return
+        self.commit()
+
+    @property
+    def is_active(self) -> bool:
+        transaction = self if self._outer is None else self._outer
+        return self.project._transaction is transaction
+
+    def record(self, item: Hirarchy | None, kind: str) -> None:
+        if item not in self._changes:
+            self._changes[item] = kind
+
+    def defer_cascade(self, item: Hirarchy, field_name: str, value) -> None:
+        if self._applying:  # the cascade of a parent sets the children
+            return
+        self._sequence += 1
+        self._cascades[(item, field_name)] = (self._sequence, value)
+
+    def defer_ident_index(self, attribute: Attribute) -> bool:
+        if self._applying:
+            return False
+        self._ident_attributes.add(attribute)
+        return True
+
+    def _apply_cascades(self) -> None:
+        for (item, field_name), (sequence, value) in sorted(self._cascades.items(), key=lambda c: c[1][0]):
+            recursive = field_name in self._RECURSIVE_CASCADES
+            items = [item]
+            while items:
+                for child in items.pop().children:
+                    if not recursive:
+                        setattr(child, "_" + field_name, value)
+                        self.project.mark_dirty(child)
+                        continue
+                    later_cascade = self._cascades.get((child, field_name))
+                    if later_cascade is not None and later_cascade[0] > sequence:
+                        continue  # the child got its own value later on, its own cascade covers its children
+                    setattr(child, field_name, value)
+                    items.append(child)
+        self._cascades = dict()
+
+    def _apply_ident_index(self) -> None:
+        attributes = self._ident_attributes
+        for attribute in attributes:
+            if attributes.isdisjoint(attribute.get_all_parents()):  # the parent walks the subtree anyway
+                attribute.update_ident_index()
+        self._ident_attributes = set()
+
+    def _create_events(self) -> list[ChangeEvent]:
+        events = list()
+        items = self.project._items
+        for item, first_kind in self._changes.items():
+            if item is None:
+                events.append(ChangeEvent(None, MODIFIED))
+            elif item in items:
+                events.append(ChangeEvent(item, CREATED if first_kind == CREATED else MODIFIED))
+            elif first_kind != CREATED:
+                events.append(ChangeEvent(item, REMOVED))
+        return events
+
+    def commit(self) -> list[ChangeEvent]:
+        """applies the collected cascades and index updates and notifies the change listeners"""
+        if self._outer is not None:
+            return list()
+        proj = self.project
+        self._applying = True
+        try:
+            self._apply_cascades()
+            self._apply_ident_index()
+        finally:
+            self._applying = False
+            self._close()
+        events = self._create_events()
+        self._changes = dict()
+        if events:
+            proj._notify_change_listeners(events)
+        return events
+
+    def rollback(self) -> None:
+        """restores the state of the Project from the start of the transaction and ends it"""
+        if self._outer is not None:
+            self._outer.rollback()
+            return
+        if self._item_states is None:
+            raise RuntimeError("Transaction was started without rollback")
+        self._close()
+        self._restore_state()
+        self._changes = dict()
+        self._cascades = dict()
+        self._ident_attributes = set()
+
+    def _close(self) -> None:
+        proj = self.project
+        if self._deferring_object_index:
+            self._deferring_object_index = False
+            proj._flush_object_index()
+        proj._transaction = None
+        proj._update_change_recording()
+
+    def _save_state(self) -> None:
+        proj = self.project
+        self._item_states = dict()
+        for item in proj._items:
+            self._item_states[item] = tuple(_copy_state(getattr(item, name, _UNSET))
+                                            for name in _get_slot_names(type(item)))
+        # the object index holds sets per key, the filter masks are lists of lists
+        self._project_state = {key: _copy_state(value, 2) for key, value in proj.__dict__.items()
+                               if key not in ("_change_listeners", "_transaction", "_recording_changes", "_views",
+                                              "_store", "_deferred_object_index")}
+
+    def _restore_state(self) -> None:
+        proj = self.project
+        for item, state in self._item_states.items():
+            for name, value in zip(_get_slot_names(type(item)), state):
+                if value is not _UNSET:
+                    setattr(item, name, value)
+                elif hasattr(item, name):
+                    delattr(item, name)
+        revision = proj._revision
+        proj.__dict__.update(self._project_state)
+        proj._revision = revision + 1  # views that were built inside the transaction are outdated
+        self._item_states = None
+        self._project_state = None
+
+
+class TreeNode(object):
+    """read-only node of Project.tree(lightweight=True) with the attributes of the anytree.AnyNodes it replaces"""
+    __slots__ = ("name", "id", "obj", "parent", "children")
+
+    def __init__(self, name: str | None = None, id: str | None = None, obj: Project | Object | None = None,
+                 parent: TreeNode | None = None) -> None:
+        self.name = name
+        self.id = id
+        self.obj = obj
+        self.parent = parent
+        self.children: list[TreeNode] = list()
+        if parent is not None:
+            parent.children.append(self)
+
+    def __repr__(self) -> str:
+        return f"TreeNode(name={self.name!r}, id={self.id!r})"
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent is None
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    @property
+    def depth(self) -> int:
+        depth, node = 0, self.parent
+        while node is not None:
+            depth, node = depth + 1, node.parent
+        return depth
+
+    @property
+    def descendants(self) -> Iterator[TreeNode]:
+        """all nodes below this node in pre-order"""
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            yield node
+            stack += reversed(node.children)
+
+
+class ProjectView(object):
+    """
+    Filtered and sorted structure of a Project for one Phase / UseCase combination.
+    Every container gets filtered and sorted on first access and is shared afterwards,
+    so the returned lists must not be modified. Use Project.view() to get an up-to-date instance.
+    """
+
+    def __init__(self, project: Project, phase: Phase, use_case: UseCase) -> None:
+        self.project = project
+        self.phase = phase
+        self.use_case = use_case
+        self.revision = project.revision
+        self._cell_mask = project.get_filter_mask(phase, use_case)
+        self._objects: list[Object] | None = None
+        self._aggregations: list[Aggregation] | None = None
+        self._property_sets: dict[Object, list[PropertySet]] = dict()
+        self._attributes: dict[PropertySet, list[Attribute]] = dict()
+        self._children: dict[Hirarchy, list[Hirarchy]] = dict()
+
+    @property
+    def is_valid(self) -> bool:
+        return self.revision == self.project.revision
+
+    def is_active(self, item: Hirarchy) -> bool:
+        if self._cell_mask is None:
+            return False
+        return not item._filter_mask & self._cell_mask
+
+    def _filter(self, items: Iterable[Hirarchy]) -> list:
+        if self._cell_mask is None:
+            return list()
+        return [item for item in items if not item._filter_mask & self._cell_mask]
+
+    @property
+    def objects(self) -> list[Object]:
+        """active Objects sorted by ident_value"""
+        if self._objects is None:
+            self._objects = sorted(self._filter(self.project.get_all_objects()), key=lambda o: (o.ident_value, o.name))
+        return self._objects
+
+    @property
+    def aggregations(self) -> list[Aggregation]:
+        if self._aggregations is None:
+            self._aggregations = sorted(self._filter(self.project.get_all_aggregations()), key=lambda a: a.name)
+        return self._aggregations
+
+    def property_sets(self, obj: Object) -> list[PropertySet]:
+        """active PropertySets of Object sorted by name"""
+        property_sets = self._property_sets.get(obj)
+        if property_sets is None:
+            property_sets = self._filter(obj._get_sorted_property_sets())
+            self._property_sets[obj] = property_sets
+        return property_sets
+
+    def attributes(self, property_set: PropertySet) -> list[Attribute]:
+        """active Attributes of PropertySet sorted by name"""
+        attributes = self._attributes.get(property_set)
+        if attributes is None:
+            attributes = self._filter(property_set._get_sorted_attributes())
+            self._attributes[property_set] = attributes
+        return attributes
+
+    def children(self, item: Hirarchy) -> list[Hirarchy]:
+        """active children of item sorted by name"""
+        children = self._children.get(item)
+        if children is None:
+            children = sorted(self._filter(item.get_all_children()), key=lambda c: c.name)
+            self._children[item] = children
+        return children
+
+    def required_data_dict(self) -> dict[Object, dict[PropertySet, list[Attribute]]]:
+        """returns a new nested dict of all active Objects, PropertySets and Attributes as used by the exporters"""
+        required_data = dict()
+        for obj in self.objects:
+            required_data[obj] = {pset: list(self.attributes(pset)) for pset in self.property_sets(obj)}
+        return required_data
+
+
 @dataclass(unsafe_hash=True)
 class ProjectFilter:
     name: str
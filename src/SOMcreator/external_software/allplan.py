@@ -37,7 +37,7 @@ def create_mapping(project: classes.Project, path: str, allplan_mapping_name: st
 
         attribute_dict: dict[str, str] = dict()
 
-        for attribute in classes.Attribute:
+        for attribute in sorted(project.get_all_attributes(), key=lambda a: a.name):
             data_type = attribute.data_type
 
             if attribute.name in attribute_dict:
@@ -59,19 +59,19 @@ def create_mapping(project: classes.Project, path: str, allplan_mapping_name: st
     def create_zuweisung(kenner: str, worksheet: Worksheet):
 
         def get_attrib_count(obj: classes.Object):
-            return sum(len([attrib for attrib in pset.attributes]) for pset in obj.property_sets)
+            return sum(len(view.attributes(pset)) for pset in view.property_sets(obj))
 
         max_attribs = max(
-            get_attrib_count(obj) for obj in project.objects)
+            get_attrib_count(obj) for obj in view.objects)
         header = ["Kenner"] + ["Wert", "Name"] * max_attribs
         [worksheet.cell(1, i + 1, text) for i, text in enumerate(header)]   #print Header
         worksheet.cell(2, 1, kenner)
         row_index = 2
-        for obj in project.objects:
+        for obj in view.objects:
             worksheet.cell(row_index, 2, obj.ident_value)
             col_index = 3
-            for propery_set in obj.property_sets:
-                for attribute in propery_set.attributes:
+            for propery_set in view.property_sets(obj):
+                for attribute in view.attributes(propery_set):
                     if attribute.name != kenner:
                         worksheet.cell(row_index, col_index, attribute.name)
                         col_index += 2
@@ -96,6 +96,7 @@ def create_mapping(project: classes.Project, path: str, allplan_mapping_name: st
             worksheet.cell(2 + row_index, 4, allplan_mapping_name)
             worksheet.cell(2 + row_index, 5, transform_type(attribute_datatype))
 
+    view = project.view()
     wb = Workbook()
     ws = wb.active
     ws.title = TITLES[0]
@@ -110,9 +110,4 @@ def export(required_data_dict: REQUIRED_DATA_DICT,
         file.write(etree.tostring(svs, pretty_print=True))
 
 def build_full_required_data_dict(project:classes.Project)-> REQUIRED_DATA_DICT:
-    required_data = dict()
-    for obj in list(project.objects):
-        required_data[obj] = dict()
-        for pset in obj.property_sets:
-            required_data[obj][pset] = [attribute for attribute in pset.attributes]
-    return required_data
\ No newline at end of file
+    return project.view().required_data_dict()
\ No newline at end of file
@@ -21,12 +21,10 @@ def create_mapping(src_path: str, dest_path: str, project: classes.Project) -> N
     wb = load_workbook(src_path)
     sheet = wb.active
     important_rows = [row for i, row in enumerate(sheet.rows) if row[2].value is not None and i != 0]
-    object_dict = {obj.ident_attrib.value[0]: obj for obj in project.objects if
-                   not obj.is_concept}
 
     for row in important_rows:
         bauteil_bez_card, bauteil_bez_2, bauteilklass = map(lambda x: x.value, row)
-        obj = object_dict.get(bauteilklass)
+        obj = project.get_object_by_identifier(bauteilklass, filtered=True)
         if obj is None:
             logging.warning(f"identifier '{bauteilklass}' not found")
             continue
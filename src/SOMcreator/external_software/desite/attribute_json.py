@@ -7,8 +7,8 @@ from ...constants import json_constants, value_constants
 from ...external_software import xml
 
 
-def _iter_attributes(property_set: classes.PropertySet, pset_dict: dict) -> None:
-    for attribute in property_set.attributes:
+def _iter_attributes(view: classes.ProjectView, property_set: classes.PropertySet, pset_dict: dict) -> None:
+    for attribute in view.attributes(property_set):
         pset_dict[attribute.name] = dict()
         attribute_dict = pset_dict[attribute.name]
 
@@ -22,18 +22,19 @@ def _iter_attributes(property_set: classes.PropertySet, pset_dict: dict) -> None
 
 def export(project: classes.Project, path: str | os.PathLike) -> None:
     json_dict = dict()
-    for obj in sorted(project.objects, key=lambda x: x.ident_value):
-        if not obj.property_sets:
+    view = project.view()
+    for obj in view.objects:
+        if not view.property_sets(obj):
             continue
         if obj.ident_value is None:
             continue
         json_dict[obj.ident_value] = dict()
         obj_dict = json_dict[obj.ident_value]
-        for property_set in obj.property_sets:
-            if not property_set.attributes:
+        for property_set in view.property_sets(obj):
+            if not view.attributes(property_set):
                 continue
             obj_dict[property_set.name] = dict()
             pset_dict = obj_dict[property_set.name]
-            _iter_attributes(property_set, pset_dict)
+            _iter_attributes(view, property_set, pset_dict)
     with open(path, "w") as file:
         json.dump(json_dict, file, indent=1)
@@ -3,12 +3,13 @@ import csv
 from ... import classes
 
 
-def get_distinct_attributes(property_sets: list[classes.PropertySet]):
+def get_distinct_attributes(property_sets: list[classes.PropertySet], view: classes.ProjectView | None = None):
     attribute_names = list()
 
     for property_set in property_sets:
         attribute: classes.Attribute
-        attribute_names += [attribute.name for attribute in property_set.attributes]
+        attributes = property_set.attributes if view is None else view.attributes(property_set)
+        attribute_names += [attribute.name for attribute in attributes]
 
     distinct_attribute_names = list(dict.fromkeys(attribute_names))
 
@@ -21,14 +22,15 @@ def export_boq(project: classes.Project, path: str, pset_name: str) -> None:
 
     with open(path, "w", ) as file:
         writer = csv.writer(file, delimiter=";")
-        property_sets = [property_set for property_set in classes.PropertySet if
-                         property_set.name == pset_name]
-        distinct_attribute_names = get_distinct_attributes(property_sets)
+        property_sets = [property_set for property_set in sorted(project.get_all_property_sets(), key=lambda p: p.name)
+                         if property_set.name == pset_name]
+        view = project.view()
+        distinct_attribute_names = get_distinct_attributes(property_sets, view)
         header = ["Ident", "Object"] + [f"{pset_name}:{name}" for name in distinct_attribute_names]
         writer.writerow(header)
 
-        for obj in project.objects:
-            if pset_name not in [pset.name for pset in obj.property_sets]:
+        for obj in view.objects:
+            if pset_name not in [pset.name for pset in view.property_sets(obj)]:
                 continue
 
             property_set = obj.get_property_set_by_name(pset_name)
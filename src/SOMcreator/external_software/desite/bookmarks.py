@@ -12,7 +12,8 @@ def _handle_bookmark_list(proj: classes.Project) -> etree.ElementTree:
     xml_bookmark_list = etree.SubElement(xml_bookmarks, "cBookmarkList")
 
     obj: classes.Object
-    for obj in sorted(proj.objects, key=lambda o: o.ident_value):
+    view = proj.view()
+    for obj in view.objects:
         xml_bookmark = etree.SubElement(xml_bookmark_list, "cBookmark")
         xml_bookmark.set("ID", str(obj.uuid))
 
@@ -31,8 +32,8 @@ def _handle_bookmark_list(proj: classes.Project) -> etree.ElementTree:
         text = f"{attribute.property_set.name}:{attribute.name}##{data_type}"
         xml_col.set("v", text)
 
-        for property_set in obj.property_sets:
-            for attribute in property_set.attributes:
+        for property_set in view.property_sets(obj):
+            for attribute in view.attributes(property_set):
                 if attribute != obj.ident_attrib:
                     xml_col = etree.SubElement(xml_bookmark, "col")
                     data_type = xml.transform_data_format(attribute.data_type)
@@ -43,9 +44,10 @@ def _handle_bookmark_list(proj: classes.Project) -> etree.ElementTree:
 
 def _get_attribute_dict(proj: classes.Project) -> dict[str, str]:
     attribute_dict = {}
-    for obj in proj.objects:
-        for property_set in obj.property_sets:
-            for attribute in property_set.attributes:
+    view = proj.view()
+    for obj in view.objects:
+        for property_set in view.property_sets(obj):
+            for attribute in view.attributes(property_set):
                 attribute_dict[f"{property_set.name}:{attribute.name}"] = xml.transform_data_format(attribute.data_type)
 
     return attribute_dict
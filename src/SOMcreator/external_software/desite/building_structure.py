@@ -25,7 +25,7 @@ def _handle_section(id_dict, aggregation: classes.Aggregation, xml_item: Element
             _handle_section(id_dict, child, xml_item)
 
 
-def _handle_elementsection(xml_parent: Element):
+def _handle_elementsection(xml_parent: Element, project: classes.Project):
     xml_elementsection = etree.SubElement(xml_parent, "elementSection")
     xml_root = etree.SubElement(xml_elementsection, "section")
     xml_root.set("ID", str(uuid.uuid4()))
@@ -34,7 +34,7 @@ def _handle_elementsection(xml_parent: Element):
     xml_root.set("type", "typeBsContainer")
     xml_root.set("takt", "")
 
-    root_objects: list[classes.Aggregation] = [aggreg for aggreg in classes.Aggregation if
+    root_objects: list[classes.Aggregation] = [aggreg for aggreg in project.get_all_aggregations() if
                                                aggreg.is_root]
 
     root_objects.sort(key=lambda x: x.name)
@@ -46,13 +46,13 @@ def _handle_elementsection(xml_parent: Element):
     return xml_elementsection, id_dict
 
 
-def _handle_property_type_section(xml_repo) -> dict[str, int]:
+def _handle_property_type_section(xml_repo, project: classes.Project) -> dict[str, int]:
     xml_property_type_section = etree.SubElement(xml_repo, "propertyTypeSection")
 
     attribute_dict = dict()
 
     i = 1
-    for attribute in classes.Attribute:
+    for attribute in sorted(project.get_all_attributes(), key=lambda a: a.name):
         # use attribute_text instead of attribute to remove duplicates
         attribute_text = f"{attribute.property_set.name}:{attribute.name}"
         if attribute_text not in attribute_dict:
@@ -68,13 +68,14 @@ def _handle_property_type_section(xml_repo) -> dict[str, int]:
     return attribute_dict
 
 
-def _handle_property_section(xml_repo: etree.Element, id_dict: dict, attribute_dict: dict) -> None:
+def _handle_property_section(xml_repo: etree.Element, id_dict: dict, attribute_dict: dict,
+                             view: classes.ProjectView) -> None:
     xml_property_section = etree.SubElement(xml_repo, "propertySection")
 
     for node, ref_id in id_dict.items():
         obj = node.object
-        for property_set in obj.property_sets:
-            for attribute in property_set.attributes:
+        for property_set in view.property_sets(obj):
+            for attribute in view.attributes(property_set):
                 attribute_text = f"{attribute.property_set.name}:{attribute.name}"
                 ref_type = attribute_dict[attribute_text]
                 xml_property = etree.SubElement(xml_property_section, "property")
@@ -86,7 +87,8 @@ def _handle_property_section(xml_repo: etree.Element, id_dict: dict, attribute_d
                     xml_property.text = "füllen!"
 
 
-def _handle_repository(xml_parent: Element, id_dict: dict[classes.Aggregation, str]) -> None:
+def _handle_repository(xml_parent: Element, id_dict: dict[classes.Aggregation, str],
+                       view: classes.ProjectView) -> None:
     xml_repo = etree.SubElement(xml_parent, "repository")
     xml_id_mapping = etree.SubElement(xml_repo, "IDMapping")
 
@@ -95,8 +97,8 @@ def _handle_repository(xml_parent: Element, id_dict: dict[classes.Aggregation, s
         xml_id.set("k", str(i + 1))
         xml_id.set("v", str(id_value))
 
-    attribute_dict = _handle_property_type_section(xml_repo)
-    _handle_property_section(xml_repo, id_dict, attribute_dict)
+    attribute_dict = _handle_property_type_section(xml_repo, view.project)
+    _handle_property_section(xml_repo, id_dict, attribute_dict, view)
 
 
 def _handle_relation_section(xml_parent: Element) -> None:
@@ -110,10 +112,10 @@ def export_bs(project: classes.Project, path: str) -> None:
     if not path:
         return
     xml_boq_export = handle_header(project.author, "bsExport")
-    xml_elementsection, id_dict = _handle_elementsection(xml_boq_export)
+    xml_elementsection, id_dict = _handle_elementsection(xml_boq_export, project)
 
     etree.SubElement(xml_boq_export, "linkSection")
-    _handle_repository(xml_boq_export, id_dict)
+    _handle_repository(xml_boq_export, id_dict, project.view())
     _handle_relation_section(xml_boq_export)
 
     tree = etree.ElementTree(xml_boq_export)
@@ -396,14 +396,7 @@ def _fast_object_check(main_pset: str, main_attrib: str, author: str, required_d
 
 def build_full_data_dict(proj: classes.Project) -> dict[
     classes.Object, dict[classes.PropertySet, list[classes.Attribute]]]:
-    d = dict()
-    for obj in proj.objects:
-        d[obj] = dict()
-        for pset in obj.property_sets:
-            d[obj][pset] = list()
-            for attribute in pset.attributes:
-                d[obj][pset].append(attribute)
-    return d
+    return proj.view().required_data_dict()
 
 
 def export(project: classes.Project,
@@ -412,7 +405,8 @@ def export(project: classes.Project,
            object_structure: dict[classes.Object, set[classes.Object]] = None,
            export_type: str = "JS") -> None:
     if not object_structure:
-        object_structure = {o: o.children for o in project.objects}
+        view = project.view()
+        object_structure = {o: view.children(o) for o in view.objects}
 
     template = _handle_template(Template.TEMPLATE)
     xml_container, xml_qa_export = _init_xml(project.author, project.name, project.version)
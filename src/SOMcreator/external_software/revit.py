@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, IO, Iterator
+from typing import TYPE_CHECKING, IO
 
 from .. import classes
 from ..constants import value_constants
@@ -27,27 +27,9 @@ def export_ifc_template(path: str, pset_dict: dict[str, (list[classes.Attribute]
             file.write("\n")
 
 
-class IterItem(type):
-    _registry = set()
-
-    def __iter__(cls) -> Iterator[SP_Item]:
-        return iter(cls._registry)
-
-    def add_item(cls, item):
-        cls._registry.add(item)
-
-    def __len__(cls):
-        return len(cls._registry)
-
-    # def __new__(meta,name,bases,attrs):
-    #     attrs['_cars'] = weaker.WeakSet()
-    #     return type.__new__(meta, name, bases, attrs)
-
-
-class SP_Item(metaclass=IterItem):
+class SP_Item:
 
     def __init__(self, property_set_name, attribute, pset_number):
-        self.__class__.add_item(self)
         self.property_set_name = property_set_name
         self.attribute = attribute
         self.pset_number = pset_number
@@ -75,10 +57,11 @@ def export_shared_parameters(path: str, pset_dict: dict[str, (list[classes.Attri
             "*PARAM	GUID	NAME	DATATYPE	DATACATEGORY	GROUP	VISIBLE	DESCRIPTION	USERMODIFIABLE\n")
 
         property_set: classes.PropertySet
+        items: list[SP_Item] = list()
         for i, (pset_name, (attrib_list, ifc_mapping)) in enumerate(sorted(pset_dict.items())):
             for attrib in attrib_list:
-                t = SP_Item(pset_name, attrib, i)
+                items.append(SP_Item(pset_name, attrib, i))
 
-        for item in sorted(SP_Item, key=lambda x: x.attribute.name):
+        for item in sorted(items, key=lambda x: x.attribute.name):
             item.print(file)
             pass
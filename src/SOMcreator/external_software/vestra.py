@@ -59,11 +59,13 @@ def create_mapping(excel_path: str, folder_path: str, project: classes.Project)
         os.mkdir(folder_path)
 
     important_rows = [row for i, row in enumerate(sheet.rows) if row[2].value is not None and i != 0]
-    object_dict = {obj.ident_attrib.value[0]: obj for obj in project.objects if not obj.is_concept}
 
     for row in important_rows:
         values = list(map(lambda x: x.value, row))
         if len(values) != 4:
             raise ValueError("Spaltenkonfiguration nicht korrekt!")
         hz_nummer, hz_name, bauteil_name, bauteilklass = values
-        create_xml(hz_name, object_dict[bauteilklass])
+        obj = project.get_object_by_identifier(bauteilklass, filtered=True)
+        if obj is None:
+            raise KeyError(bauteilklass)
+        create_xml(hz_name, obj)
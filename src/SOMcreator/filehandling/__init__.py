@@ -1,33 +1,29 @@
 from __future__ import annotations
 
 import os
-import json
 import SOMcreator
 from .typing import MainDict
-from typing import Type, TYPE_CHECKING
-from . import constants, core, project, predefined_pset, property_set, obj, aggregation, inheritance
+from typing import Iterator, Type, TYPE_CHECKING
+from . import constants, core, project, predefined_pset, property_set, obj, aggregation, inheritance, stream, serializer, binary, \
+    database, journal, cache, selection
 from ..Template import HOME_DIR, MAPPING_TEMPLATE
 from ..external_software import xml
 import jinja2
 
 if TYPE_CHECKING:
     from SOMcreator.classes import Project
-parent_dict = dict()
-aggregation_dict = dict()
-phase_list = list()
-use_case_list = list()
-plugin_dict = dict()
 
 
 def create_mapping_script(project: SOMcreator.Project, pset_name: str, path: str):
     attrib_dict = dict()
     obj: SOMcreator.Object
-    for obj in project.objects:
+    view = project.view()
+    for obj in view.objects:
         klass = obj.ident_attrib.value[0]
         obj_dict = dict()
-        for pset in obj.property_sets:
+        for pset in view.property_sets(obj):
             pset_dict = dict()
-            for attribute in pset.attributes:
+            for attribute in view.attributes(pset):
                 name = attribute.name
                 data_format = xml.transform_data_format(attribute.data_type)
                 pset_dict[name] = data_format
@@ -44,46 +40,163 @@ def create_mapping_script(project: SOMcreator.Project, pset_name: str, path: str
         file.write(code)
     pass
 
-def open_json(cls: Type[Project], path: str):
-    SOMcreator.filehandling.parent_dict = dict()
+def open_json(cls: Type[Project], path: str, include: selection.Selection | None = None):
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"File '{path}' does not exist!")
+
+    with open(path, "rb") as file:
+        main_dict: MainDict = serializer.loads(file.read())
+    journal.apply(main_dict, path)
+    if include is not None:
+        return load_selection(cls, main_dict, include)
+    proj = load_main_dict(cls, main_dict)
+    proj.start_change_tracking(path)
+    return proj
+
 
+def open_binary(cls: Type[Project], path: str, include: selection.Selection | None = None):
     if not os.path.isfile(path):
         raise FileNotFoundError(f"File '{path}' does not exist!")
 
-    with open(path, "r") as file:
-        main_dict: MainDict = json.load(file)
+    with open(path, "rb") as file:
+        main_dict: MainDict = binary.loads(file.read())
+    if include is not None:
+        return load_selection(cls, main_dict, include)
+    return load_main_dict(cls, main_dict)
+
+
+def load_selection(cls: Type[Project], main_dict: MainDict, include: selection.Selection):
+    """
+    loads only the selected Objects and their dependencies. The project is not tracked as the state of the file,
+    saving it to the same path replaces the file content with the selection
+    """
+    reduced_dict, report = selection.reduce(main_dict, include)
+    proj = load_main_dict(cls, reduced_dict)
+    proj.load_report["selection"] = report
+    return proj
+
+
+def is_binary_path(path: str | os.PathLike) -> bool:
+    return os.fspath(path).lower().endswith(binary.FILE_EXTENSION)
 
-    SOMcreator.filehandling.plugin_dict = dict(main_dict)
 
-    project_dict = main_dict.get(constants.PROJECT)
-    SOMcreator.filehandling.phase_list, SOMcreator.filehandling.use_case_list = core.get_filter_lists(project_dict)
+def load_main_dict(cls: Type[Project], main_dict: MainDict):
+    context = core.LoadContext(main_dict)
 
-    proj, project_dict = project.load(cls, main_dict)
-    predefined_pset.load(proj, main_dict)
+    proj, project_dict = project.load(cls, main_dict, context)
+    predefined_pset.load(proj, main_dict, context)
 
-    obj.load(proj, main_dict)
+    obj.load(proj, main_dict, context)
 
-    aggregation.load(proj, main_dict)
+    aggregation.load(proj, main_dict, context)
 
-    inheritance.calculate(proj)
-    aggregation.calculate(proj)
-    proj.plugin_dict = SOMcreator.filehandling.plugin_dict
+    proj.load_report["inheritance"] = inheritance.calculate(proj, context)
+    aggregation.calculate(proj, context)
+    proj.plugin_dict = context.plugin_dict
     proj.import_dict = main_dict
     return proj
 
 
-def export_json(proj: Project, path: str) -> dict:
-    main_dict = create_export_dict(proj)
-    with open(path, "w") as file:
-        json.dump(main_dict, file)
+# sections that get loaded entity by entity in stream mode. Sorted by dependency
+STREAMED_SECTIONS = {
+    constants.PREDEFINED_PSETS: predefined_pset.load_entry,
+    constants.OBJECTS:          obj.load_entry,
+    constants.AGGREGATIONS:     aggregation.load_entry,
+}
+
+
+def _stream_section(proj: Project, section: str, entries: Iterator[tuple[str, dict]], context: core.LoadContext):
+    load_entry = STREAMED_SECTIONS[section]
+    for identifier, entity_dict in entries:
+        load_entry(proj, entity_dict, identifier, context)
+
+
+def open_json_stream(cls: Type[Project], path: str):
+    """
+    Loads the file section by section and entity by entity instead of decoding the whole document at once.
+    Only the unknown plugin sections are kept, as plugin_dict and import_dict.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"File '{path}' does not exist!")
+    if os.path.isfile(journal.get_journal_path(path)):  # the journal has to be replayed on the complete document
+        return open_json(cls, path)
+
+    proj = None
+    context = None
+    plugin_dict = dict()
+    deferred_sections = dict()  # sections that appear before the sections they depend on
+    with open(path, "r", encoding="utf-8") as file:
+        reader = stream.JsonStreamReader(file)
+        for key in reader.iter_items():
+            if key == constants.PROJECT:
+                project_section = {key: reader.read_value()}
+                context = core.LoadContext(project_section)
+                proj, project_dict = project.load(cls, project_section, context)
+            elif key not in STREAMED_SECTIONS:
+                plugin_dict[key] = reader.read_value()
+            elif proj is None or not reader.is_object_next() or (
+                    key == constants.AGGREGATIONS and constants.OBJECTS not in context.loaded_sections):
+                deferred_sections[key] = reader.read_value()
+            else:
+                entries = ((identifier, reader.read_value()) for identifier in reader.iter_items())
+                _stream_section(proj, key, entries, context)
+                context.loaded_sections.add(key)
+
+    if proj is None:
+        raise ValueError(f"File '{path}' contains no {constants.PROJECT} section")
+
+    for key in STREAMED_SECTIONS:
+        if key in context.loaded_sections:
+            continue
+        entities_dict = deferred_sections.pop(key, None)
+        if core.check_dict(entities_dict, key):
+            continue
+        _stream_section(proj, key, iter(entities_dict.items()), context)
+        context.loaded_sections.add(key)
+
+    proj.load_report["inheritance"] = inheritance.calculate(proj, context)
+    aggregation.calculate(proj, context)
+    context.plugin_dict.update(plugin_dict)
+    proj.plugin_dict = context.plugin_dict
+    proj.import_dict = dict(plugin_dict)
+    proj.start_change_tracking(path)
+    return proj
+
+
+def export_json(proj: Project, path: str, canonical: bool = False, lean: bool = False) -> dict:
+    main_dict = create_export_dict(proj, lean)
+    with open(path, "wb") as file:
+        file.write(serializer.dumps(main_dict, canonical))
+    journal.remove(path)
+    proj.start_change_tracking(path)
+    return main_dict
+
+
+def export_json_incremental(proj: Project, path: str, canonical: bool = False, lean: bool = False) -> dict:
+    """
+    appends the changes since the last save to the journal of the file. The file gets written as a whole if it
+    doesn't hold the state the changes are relative to, if phases or use cases changed or if the journal got too large.
+    Returns the journal entry or the main_dict if the file was written as a whole
+    """
+    if (proj.change_base != os.path.abspath(path) or not os.path.isfile(path) or proj.has_filter_changes()
+            or journal.needs_compaction(path)):
+        return export_json(proj, path, canonical, lean)
+    return journal.append(proj, path)
+
+
+def export_binary(proj: Project, path: str, compression: int = binary.ZLIB, lean: bool = False) -> dict:
+    main_dict = create_export_dict(proj, lean)
+    with open(path, "wb") as file:
+        file.write(binary.dumps(main_dict, compression))
     return main_dict
 
 
-def create_export_dict(proj: Project):
+def create_export_dict(proj: Project, lean: bool = False):
+    """lean: omit all values the loader restores on its own (default filter matrices, inherited descriptions)"""
     main_dict: MainDict = dict()
     project.write(proj, main_dict)
-    predefined_pset.write(proj, main_dict)
-    obj.write(proj, main_dict)
-    aggregation.write(proj, main_dict)
+    predefined_pset.write(proj, main_dict, lean)
+    obj.write(proj, main_dict, lean)
+    aggregation.write(proj, main_dict, lean)
     main_dict.update(proj.plugin_dict)
     return main_dict
\ No newline at end of file
@@ -13,26 +13,26 @@ if TYPE_CHECKING:
 
 
 ### Import ###
-def _get_aggregation(proj: SOMcreator.Project, aggregation_dict: dict, identifier: str, ):
-    name, description, optional, parent, filter_matrix = core.get_basics(proj, aggregation_dict)
+def load_entry(proj: SOMcreator.Project, aggregation_dict: dict, identifier: str, context: core.LoadContext):
+    name, description, optional, parent, filter_matrix = core.get_basics(proj, aggregation_dict, context)
     object_uuid = aggregation_dict[OBJECT]
     obj = proj.get_element_by_uuid(object_uuid)
     parent_connection = aggregation_dict[CONNECTION]
     aggregation = classes.Aggregation(obj=obj, parent_connection=parent_connection, uuid=identifier,
                                       description=description, optional=optional, filter_matrix=filter_matrix)
-    SOMcreator.filehandling.aggregation_dict[aggregation] = (parent, parent_connection)
+    context.aggregation_dict[aggregation] = (parent, parent_connection)
 
 
-def load(proj: classes.Project, main_dict: dict):
+def load(proj: classes.Project, main_dict: dict, context: core.LoadContext):
     aggregations_dict: dict[str, AggregationDict] = main_dict.get(AGGREGATIONS)
-    core.remove_part_of_dict(AGGREGATIONS)
+    core.remove_part_of_dict(context, AGGREGATIONS)
     aggregations_dict = dict() if core.check_dict(aggregations_dict, AGGREGATIONS) else aggregations_dict
     for uuid_ident, entity_dict in aggregations_dict.items():
-        _get_aggregation(proj, entity_dict, uuid_ident)
+        load_entry(proj, entity_dict, uuid_ident, context)
 
 
-def calculate(proj: SOMcreator.Project):
-    for aggregation, (uuid, connection_type) in SOMcreator.filehandling.aggregation_dict.items():
+def calculate(proj: SOMcreator.Project, context: core.LoadContext):
+    for aggregation, (uuid, connection_type) in context.aggregation_dict.items():
         parent = proj.get_element_by_uuid(uuid)
         if parent is None:
             continue
@@ -40,9 +40,9 @@ def calculate(proj: SOMcreator.Project):
 
 
 ### Export ###
-def _create_entry(element: classes.Aggregation) -> AggregationDict:
+def _create_entry(element: classes.Aggregation, lean: bool = False) -> AggregationDict:
     aggregation_dict: AggregationDict = dict()
-    core.write_basics(aggregation_dict, element)
+    core.write_basics(aggregation_dict, element, lean)
     aggregation_dict[OBJECT] = element.object.uuid
     if element.parent is not None:
         aggregation_dict[PARENT] = element.parent.uuid
@@ -52,7 +52,7 @@ def _create_entry(element: classes.Aggregation) -> AggregationDict:
     return aggregation_dict
 
 
-def write(proj: Project, main_dict: MainDict):
+def write(proj: Project, main_dict: MainDict, lean: bool = False):
     main_dict[AGGREGATIONS] = dict()
     for aggregation in proj.get_all_aggregations():
-        main_dict[AGGREGATIONS][aggregation.uuid] = _create_entry(aggregation)
+        main_dict[AGGREGATIONS][aggregation.uuid] = _create_entry(aggregation, lean)
@@ -2,9 +2,9 @@ from __future__ import annotations
 import SOMcreator
 from SOMcreator import classes
 from SOMcreator.filehandling import core
-from SOMcreator.filehandling.constants import VALUE, VALUE_TYPE, DATA_TYPE, CHILD_INHERITS_VALUE, REVIT_MAPPING
+from SOMcreator.filehandling.constants import VALUE, VALUE_TYPE, DATA_TYPE, CHILD_INHERITS_VALUE, REVIT_MAPPING, \
+    SHARES_VALUES
 from SOMcreator.constants.value_constants import OLD_DATATYPE_DICT
-from SOMcreator import filehandling
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,8 +12,8 @@ if TYPE_CHECKING:
 
 
 def load(proj: SOMcreator.Project, attribute_dict: dict, identifier: str,
-         property_set: classes.PropertySet, ) -> None:
-    name, description, optional, parent, filter_matrix = core.get_basics(proj, attribute_dict)
+         property_set: classes.PropertySet, context: core.LoadContext) -> None:
+    name, description, optional, parent, filter_matrix = core.get_basics(proj, attribute_dict, context)
     value = attribute_dict[VALUE]
     value_type = attribute_dict[VALUE_TYPE]
     data_type = attribute_dict[DATA_TYPE]
@@ -23,21 +23,26 @@ def load(proj: SOMcreator.Project, attribute_dict: dict, identifier: str,
         data_type = OLD_DATATYPE_DICT[data_type]
 
     child_inherits_value = attribute_dict[CHILD_INHERITS_VALUE]
-    revit_mapping = attribute_dict[REVIT_MAPPING]
+    revit_mapping = attribute_dict.get(REVIT_MAPPING)  # lean files omit it if it matches the name
     attribute = classes.Attribute(property_set=property_set, name=name, value=value, value_type=value_type,
                                   data_type=data_type,
                                   child_inherits_values=child_inherits_value, uuid=identifier,
                                   description=description, optional=optional, revit_mapping=revit_mapping,
                                   project=proj, filter_matrix=filter_matrix)
-    filehandling.parent_dict[attribute] = parent
+    if parent is not None and attribute_dict.get(SHARES_VALUES):
+        attribute._value = None  # reads the values of the parent once it gets linked
+    context.parent_dict[attribute] = parent
 
 
-def write(attribute: classes.Attribute) -> AttributeDict:
+def write(attribute: classes.Attribute, lean: bool = False) -> AttributeDict:
     attribute_dict: AttributeDict = dict()
-    core.write_basics(attribute_dict, attribute)
+    core.write_basics(attribute_dict, attribute, lean)
     attribute_dict[DATA_TYPE] = attribute.data_type
     attribute_dict[VALUE_TYPE] = attribute.value_type
     attribute_dict[CHILD_INHERITS_VALUE] = attribute.child_inherits_values
-    attribute_dict[REVIT_MAPPING] = attribute.revit_name
+    if not lean or attribute.revit_name != attribute.name:
+        attribute_dict[REVIT_MAPPING] = attribute.revit_name
     attribute_dict[VALUE] = attribute.get_own_values()
+    if attribute.is_sharing_values:
+        attribute_dict[SHARES_VALUES] = True
     return attribute_dict
@@ -0,0 +1,278 @@
+"""
+Compact binary container for the same data that gets written to JSON.
+Layout: header (magic, format version, compression) followed by the compressed payload.
+The payload holds a string table, a uuid table, a table of dict key tuples and the tagged document tree.
+Every string, uuid and key tuple is stored once and referenced by index, boolean matrices (filter matrices) are packed
+to bitmasks.
+"""
+from __future__ import annotations
+
+import lzma
+import struct
+import zlib
+from typing import Any
+from uuid import UUID
+
+FILE_EXTENSION = ".sombin"
+MAGIC = b"SOMB"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBB")
+_FLOAT = struct.Struct("<d")
+
+NO_COMPRESSION = 0
+ZLIB = 1
+LZMA = 2
+
+_COMPRESS = {
+    NO_COMPRESSION: lambda data: data,
+    ZLIB:           lambda data: zlib.compress(data, 9),
+    LZMA:           lambda data: lzma.compress(data),
+}
+_DECOMPRESS = {
+    NO_COMPRESSION: lambda data: data,
+    ZLIB:           zlib.decompress,
+    LZMA:           lzma.decompress,
+}
+
+_NULL = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT_TAG = 4
+_STRING = 5
+_UUID = 6
+_LIST = 7
+_DICT = 8
+_MATRIX = 9
+
+
+def _write_uint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _is_bool_matrix(value: list) -> bool:
+    if not value or type(value[0]) is not list:
+        return False
+    width = len(value[0])
+    for row in value:
+        if type(row) is not list or len(row) != width:
+            return False
+        for cell in row:
+            if cell is not True and cell is not False:
+                return False
+    return True
+
+
+class _Encoder(object):
+    """
+    Dicts are written as reference to their key tuple (shape) followed by the values, so the keys of the
+    entity dicts are stored only once per file
+    """
+
+    def __init__(self):
+        self.body = bytearray()
+        self.strings: dict[str, int] = dict()
+        self.uuids: dict[str, int] = dict()
+        self.shapes: dict[tuple[str, ...], int] = dict()
+        self.shape_references: list[list[tuple[int, int]]] = list()
+
+    def _reference(self, value: str) -> tuple[int, int]:
+        index = self.uuids.get(value)
+        if index is not None:
+            return _UUID, index
+        index = self.strings.get(value)
+        if index is not None:
+            return _STRING, index
+        if len(value) == 36 and value.count("-") == 4:
+            try:
+                is_uuid = str(UUID(value)) == value
+            except ValueError:
+                is_uuid = False
+            if is_uuid:
+                index = self.uuids[value] = len(self.uuids)
+                return _UUID, index
+        index = self.strings[value] = len(self.strings)
+        return _STRING, index
+
+    def _matrix(self, matrix: list[list[bool]]) -> None:
+        body = self.body
+        width = len(matrix[0])
+        body.append(_MATRIX)
+        _write_uint(body, len(matrix))
+        _write_uint(body, width)
+        mask = 0
+        bit = 1
+        for row in matrix:
+            for cell in row:
+                if cell:
+                    mask |= bit
+                bit <<= 1
+        body += mask.to_bytes((len(matrix) * width + 7) // 8, "little")
+
+    def encode(self, value: Any) -> None:
+        body = self.body
+        value_type = type(value)
+        if value_type is str:
+            tag, index = self._reference(value)
+            body.append(tag)
+            _write_uint(body, index)
+        elif value_type is dict:
+            shape = tuple(value)
+            index = self.shapes.get(shape)
+            if index is None:
+                index = self.shapes[shape] = len(self.shapes)
+                self.shape_references.append([self._reference(str(key)) for key in shape])
+            body.append(_DICT)
+            _write_uint(body, index)
+            for item in value.values():
+                self.encode(item)
+        elif value is None:
+            body.append(_NULL)
+        elif value is True:
+            body.append(_TRUE)
+        elif value is False:
+            body.append(_FALSE)
+        elif value_type is list or value_type is tuple:
+            if _is_bool_matrix(value):
+                self._matrix(value)
+                return
+            body.append(_LIST)
+            _write_uint(body, len(value))
+            for item in value:
+                self.encode(item)
+        elif isinstance(value, int):
+            body.append(_INT)
+            _write_uint(body, value << 1 if value >= 0 else ((-value) << 1) - 1)  # zigzag
+        elif isinstance(value, float):
+            body.append(_FLOAT_TAG)
+            body += _FLOAT.pack(value)
+        elif isinstance(value, str):
+            self.encode(str(value))
+        elif isinstance(value, dict):
+            self.encode(dict(value))
+        elif isinstance(value, (list, tuple)):
+            self.encode(list(value))
+        else:
+            raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+    def get_payload(self) -> bytes:
+        tables = bytearray()
+        _write_uint(tables, len(self.strings))
+        for string in self.strings:
+            data = string.encode("utf-8", "surrogatepass")
+            _write_uint(tables, len(data))
+            tables += data
+        _write_uint(tables, len(self.uuids))
+        for uuid in self.uuids:
+            tables += UUID(uuid).bytes
+        _write_uint(tables, len(self.shape_references))
+        for references in self.shape_references:
+            _write_uint(tables, len(references))
+            for tag, index in references:
+                tables.append(tag)
+                _write_uint(tables, index)
+        return bytes(tables + self.body)
+
+
+def _decode(data: bytes) -> Any:
+    pos = 0
+
+    def read_uint() -> int:
+        nonlocal pos
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while byte & 0x80:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            shift += 7
+        return result
+
+    def read_bytes(size: int) -> bytes:
+        nonlocal pos
+        pos += size
+        return data[pos - size:pos]
+
+    strings = [read_bytes(read_uint()).decode("utf-8", "surrogatepass") for _ in range(read_uint())]
+    uuids = list()
+    for _ in range(read_uint()):
+        text = read_bytes(16).hex()
+        uuids.append(f"{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}")
+    references = {_STRING: strings, _UUID: uuids}
+
+    def read_key() -> str:
+        nonlocal pos
+        pos += 1
+        return references[data[pos - 1]][read_uint()]
+
+    shapes = [tuple(read_key() for _ in range(read_uint())) for _ in range(read_uint())]
+
+    matrices: dict[tuple[int, int, bytes], tuple[tuple[bool, ...], ...]] = dict()
+
+    def decode() -> Any:
+        nonlocal pos
+        tag = data[pos]
+        pos += 1
+        if tag == _STRING:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+                return strings[index]
+            return strings[read_uint()]
+        if tag == _DICT:
+            shape = shapes[read_uint()]
+            return dict(zip(shape, [decode() for _ in shape]))
+        if tag == _UUID:
+            index = data[pos]
+            if index < 0x80:
+                pos += 1
+                return uuids[index]
+            return uuids[read_uint()]
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _NULL:
+            return None
+        if tag == _LIST:
+            return [decode() for _ in range(read_uint())]
+        if tag == _MATRIX:
+            rows = read_uint()
+            width = read_uint()
+            key = (rows, width, read_bytes((rows * width + 7) // 8))
+            matrix = matrices.get(key)
+            if matrix is None:  # filter matrices repeat a lot, so every distinct one gets unpacked once
+                mask = int.from_bytes(key[2], "little")
+                matrix = matrices[key] = tuple(tuple(bool(mask >> (row * width + column) & 1)
+                                                     for column in range(width)) for row in range(rows))
+            return [list(row) for row in matrix]
+        if tag == _INT:
+            value = read_uint()
+            return -((value + 1) >> 1) if value & 1 else value >> 1
+        if tag == _FLOAT_TAG:
+            return _FLOAT.unpack(read_bytes(_FLOAT.size))[0]
+        raise ValueError(f"Unknown tag {tag} at position {pos - 1}")
+
+    return decode()
+
+
+def dumps(obj: Any, compression: int = ZLIB) -> bytes:
+    encoder = _Encoder()
+    encoder.encode(obj)
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, compression) + _COMPRESS[compression](encoder.get_payload())
+
+
+def loads(data: bytes) -> Any:
+    magic, version, compression = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Data is no binary SOM file")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"Binary SOM format version {version} is not supported (max {FORMAT_VERSION})")
+    return _decode(_DECOMPRESS[compression](data[_HEADER.size:]))
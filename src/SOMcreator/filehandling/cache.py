@@ -0,0 +1,140 @@
+"""
+Opt-in on-disk cache for Project.open. The loaded Project gets pickled under the hash of the file content (including
+its journal) and the library version, so opening an unchanged file again only has to unpickle the Project.
+A cache is used if it gets passed to Project.open or if the environment variable SOMCREATOR_LOAD_CACHE points to a
+directory. Only use directories that nobody else can write to, unpickling runs arbitrary code.
+"""
+from __future__ import annotations
+
+import gc
+import hashlib
+import logging
+import os
+import pickle
+import sys
+from typing import TYPE_CHECKING, Callable
+
+import SOMcreator
+from . import journal
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+
+ENVIRONMENT_VARIABLE = "SOMCREATOR_LOAD_CACHE"
+DEFAULT_MAX_SIZE = 1 << 30  # 1 GiB
+FILE_EXTENSION = ".pickle"
+
+HIT = "hit"
+
+
+class _PausedGarbageCollection(object):
+    """unpickling creates millions of containers, the cyclic garbage collector would walk all of them several times"""
+
+    def __enter__(self):
+        self._enabled = gc.isenabled()
+        gc.disable()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._enabled:
+            gc.enable()
+
+
+class LoadCache(object):
+    """
+    Directory of pickled Projects. Once the directory grows above max_size bytes the least recently used entries get
+    removed
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_key(self, path: str | os.PathLike) -> str:
+        file_hash = hashlib.sha256()
+        file_hash.update(f"{SOMcreator.__version__}|{sys.version_info[0]}.{sys.version_info[1]}|"
+                         f"{pickle.HIGHEST_PROTOCOL}".encode())
+        for file_path in (os.fspath(path), journal.get_journal_path(path)):
+            if not os.path.isfile(file_path):
+                continue
+            file_hash.update(b"\0")
+            with open(file_path, "rb") as file:
+                for chunk in iter(lambda: file.read(1 << 20), b""):
+                    file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + FILE_EXTENSION)
+
+    def load(self, key: str) -> Project | None:
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, "rb") as file:
+                data = file.read()
+        except OSError:
+            return None
+        try:
+            with _PausedGarbageCollection():
+                proj = pickle.loads(data)
+        except Exception as error:  # written by an incompatible version or damaged
+            logging.warning(f"Load cache: entry {key} can't be restored ({error}) and gets removed")
+            os.remove(entry_path)
+            return None
+        os.utime(entry_path)  # mark as recently used
+        return proj
+
+    def store(self, key: str, proj: Project) -> None:
+        try:
+            data = pickle.dumps(proj, protocol=pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            logging.warning(f"Load cache: project '{proj.name}' is nested too deep to be pickled")
+            return
+        entry_path = self._get_entry_path(key)
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(data)
+        os.replace(temporary_path, entry_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """removes the least recently used entries until the cache fits into max_size"""
+        entries = list()
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(FILE_EXTENSION):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:  # removed by another process
+                pass
+            total_size -= size
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(FILE_EXTENSION):
+                os.remove(entry.path)
+
+    def open(self, path: str | os.PathLike, load: Callable[[], Project]) -> Project:
+        """returns the cached Project of the file at path or loads it with load and caches it"""
+        key = self.get_key(path)
+        proj = self.load(key)
+        if proj is None:
+            proj = load()
+            self.store(key, proj)
+            proj.load_report["cache"] = {HIT: 0}
+            return proj
+
+        proj.load_report["cache"] = {HIT: 1}
+        proj.start_change_tracking(path)  # the same content might have been cached from another path
+        return proj
+
+
+def get_default_cache() -> LoadCache | None:
+    directory = os.environ.get(ENVIRONMENT_VARIABLE)
+    if not directory:
+        return None
+    return LoadCache(directory)
@@ -19,6 +19,7 @@ PARENT = "parent"
 DATA_TYPE = "data_type"
 VALUE_TYPE = "value_type"
 CHILD_INHERITS_VALUE = "child_inherits_value"
+SHARES_VALUES = "shares_values"  # child Attribute that reads the values of its parent until they get set on it
 PROJECT = "Project"
 VERSION = "version"
 AUTHOR = "author"
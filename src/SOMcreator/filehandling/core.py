@@ -4,12 +4,12 @@ import logging
 from SOMcreator import classes
 import SOMcreator
 from SOMcreator.filehandling.constants import PROJECT_PHASES, USE_CASES, NAME, DESCRIPTION, OPTIONAL, PARENT, \
-    FILTER_MATRIX
+    FILTER_MATRIX, PROJECT
 
 if TYPE_CHECKING:
     from SOMcreator import Project
     from SOMcreator.filehandling.typing import ProjectDict, StandardDict, ObjectDict, PropertySetDict, AttributeDict, \
-        AggregationDict
+        AggregationDict, MainDict
 
 
 ##### Import #####
@@ -39,66 +39,101 @@ def get_filter_lists(project_dict: ProjectDict):
     return phase_list, use_case_list
 
 
-def get_basics(proj: SOMcreator.Project, element_dict: StandardDict) -> tuple[str, str, bool, str, list[list[bool]]]:
-    def get_value(d: dict, p: str) -> bool:
-        return d.get(p) if d.get(p) is not None else True
+class FilterRemap(object):
+    """
+    Translates the filter states stored in a file into a filter matrix that fits the loaded file.
+    The phase / use case mapping only depends on the file and the project, so it gets calculated once per load
+    """
 
-    name = element_dict[NAME]
-    description = element_dict[DESCRIPTION]
-    optional = element_dict[OPTIONAL]
-    parent = element_dict[PARENT]
-    matrix = element_dict.get(FILTER_MATRIX)
-    phase_list, use_case_list = SOMcreator.filehandling.phase_list, SOMcreator.filehandling.use_case_list
-    matrix_list = list()
-    for _ in proj.get_project_phase_list():
-        matrix_list.append([True for __ in proj.get_use_case_list()])
+    def __init__(self, proj: SOMcreator.Project, phase_list: list[classes.Phase],
+                 use_case_list: list[classes.UseCase]):
+        project_phases = proj.get_project_phase_list()
+        project_use_cases = proj.get_use_case_list()
+        self.phase_count = len(phase_list)
+        self.use_case_count = len(use_case_list)
+        self.project_phase_names = [phase.name for phase in project_phases]
+        self.project_use_case_count = len(project_use_cases)
 
-    if matrix is None:  # handle deprecated file types
-        matrix = list()
-        file_phases: list[bool] = element_dict.get(PROJECT_PHASES)
+        # index of every project phase / use case inside the file lists (None if it doesn't exist in the file)
+        file_phase_indexes = {phase: index for index, phase in reversed(list(enumerate(phase_list)))}
+        file_use_case_indexes = {use_case: index for index, use_case in reversed(list(enumerate(use_case_list)))}
+        self.phase_indexes = [file_phase_indexes.get(phase) for phase in project_phases]
+        self.use_case_indexes = [file_use_case_indexes.get(use_case) for use_case in project_use_cases]
+
+    def convert_deprecated(self, element_dict: StandardDict) -> list[list[bool]]:
+        """builds the filter matrix out of the separate phase and use case lists of deprecated file types"""
+
+        def get_value(d: dict, p: str) -> bool:
+            return d.get(p) if d.get(p) is not None else True
+
+        file_phases: list[bool] | dict[str, bool] = element_dict.get(PROJECT_PHASES)
         if isinstance(file_phases, dict):  # deprecated
-            output_phases = [get_value(file_phases, phase.name) for phase in proj.get_project_phase_list()]
+            output_phases = [get_value(file_phases, name) for name in self.project_phase_names]
         elif file_phases is None:
-            output_phases = [True for _ in proj.get_project_phase_list()]
+            output_phases = [True for _ in self.phase_indexes]
         else:
-            output_phases = [True for _ in proj.get_project_phase_list()]
-            for output_index, existing_phase in enumerate(proj.get_project_phase_list()):
-                if existing_phase in phase_list:
-                    value = file_phases[phase_list.index(existing_phase)]
-                    output_phases[output_index] = value
+            output_phases = [True if index is None else file_phases[index] for index in self.phase_indexes]
 
         file_use_cases: list[bool] = element_dict.get(USE_CASES)
         if file_use_cases is None:
-            output_use_cases = [True for _ in proj.get_use_case_list()]
+            output_use_cases = [True for _ in self.use_case_indexes]
         else:
-            output_use_cases = [True for _ in proj.get_use_case_list()]
-            for output_index, existing_use_case in enumerate(proj.get_use_case_list()):
-                if existing_use_case in use_case_list:
-                    value = file_use_cases[use_case_list.index(existing_use_case)]
-                    output_use_cases[output_index] = value
-
-        for phase_index, phase in enumerate(output_phases):
-            pl = list()
-            for use_case_index, use_case in enumerate(output_use_cases):
-                pl.append(bool(output_phases[phase_index] and output_use_cases[use_case_index]))
-            matrix.append(pl)
-
-    phase_count = len(SOMcreator.filehandling.phase_list)
-    use_case_count = len(SOMcreator.filehandling.use_case_list)
-
-    if phase_count > len(matrix):
-        for _ in range(phase_count - len(matrix)):
-            matrix.append([True for _ in range(use_case_count)])
-    elif phase_count < len(matrix):
-        matrix = matrix[:phase_count]
-
-    for phase_index, use_case_list in enumerate(matrix):
-        if use_case_count > len(use_case_list):
-            [use_case_list.append(True) for _ in range(use_case_count - len(use_case_list))]
-        elif use_case_count < len(use_case_list):
-            use_case_list = use_case_list[:use_case_count]
-        matrix[phase_index] = use_case_list
-    return name, description, optional, parent, matrix
+            output_use_cases = [True if index is None else file_use_cases[index] for index in self.use_case_indexes]
+
+        return [[bool(phase_state and use_case_state) for use_case_state in output_use_cases]
+                for phase_state in output_phases]
+
+    def fit(self, matrix: list[list[bool]]) -> list[list[bool]]:
+        """pads or truncates the matrix to the phase and use case count of the file"""
+        use_case_count = self.use_case_count
+        if len(matrix) == self.phase_count and all(len(row) == use_case_count for row in matrix):
+            return matrix
+
+        if self.phase_count > len(matrix):
+            matrix = matrix + [[True for _ in range(use_case_count)] for _ in range(self.phase_count - len(matrix))]
+        elif self.phase_count < len(matrix):
+            matrix = matrix[:self.phase_count]
+
+        for phase_index, row in enumerate(matrix):
+            if use_case_count > len(row):
+                matrix[phase_index] = row + [True for _ in range(use_case_count - len(row))]
+            elif use_case_count < len(row):
+                matrix[phase_index] = row[:use_case_count]
+        return matrix
+
+
+class LoadContext(object):
+    """
+    Working state of a single load. Every call of open_json creates its own context, so several files can be loaded
+    at the same time (e.g. on a thread pool) and nothing is left over from a previous load
+    """
+
+    def __init__(self, main_dict: MainDict):
+        self.plugin_dict: dict = dict(main_dict)
+        self.parent_dict: dict[classes.ClassTypes, str | None] = dict()
+        self.aggregation_dict: dict[classes.Aggregation, tuple[str | None, int]] = dict()
+        self.loaded_sections: set[str] = set()
+        self.phase_list, self.use_case_list = get_filter_lists(main_dict.get(PROJECT))
+        self._filter_remap: FilterRemap | None = None
+
+    def get_filter_remap(self, proj: SOMcreator.Project) -> FilterRemap:
+        if self._filter_remap is None:
+            self._filter_remap = FilterRemap(proj, self.phase_list, self.use_case_list)
+        return self._filter_remap
+
+
+def get_basics(proj: SOMcreator.Project, element_dict: StandardDict,
+               context: LoadContext) -> tuple[str, str, bool, str, list[list[bool]]]:
+    name = element_dict[NAME]
+    description = element_dict.get(DESCRIPTION)  # lean files omit inherited descriptions
+    optional = element_dict[OPTIONAL]
+    parent = element_dict.get(PARENT)
+    matrix = element_dict.get(FILTER_MATRIX)
+    remap = context.get_filter_remap(proj)
+
+    if matrix is None:  # handle deprecated file types
+        matrix = remap.convert_deprecated(element_dict)
+    return name, description, optional, parent, remap.fit(matrix)
 
 
 def check_dict(d: dict | None, d_name: str) -> bool:
@@ -108,36 +143,51 @@ def check_dict(d: dict | None, d_name: str) -> bool:
     return False
 
 
-def remove_part_of_dict(key):
+def remove_part_of_dict(context: LoadContext, key):
     """
     Removes part of plugin dict if its saved in Core
+    :param context:
     :param key:
     :return:
     """
-    SOMcreator.filehandling.plugin_dict.pop(key)
+    context.plugin_dict.pop(key)
 
 
 #### Export ######
 
 def write_filter_matrix(element: classes.ClassTypes):
-    proj = element.project
-    phases = proj.get_project_phase_list()
-    use_cases = proj.get_use_case_list()
-    matrix = list()
-    for phase in phases:
-        phase_list = list()
-        for use_case in use_cases:
-            phase_list.append(element.get_filter_state(phase, use_case))
-        matrix.append(phase_list)
-    return matrix
+    return element.get_filter_matrix()
+
+
+def is_detached(element: classes.PropertySet | classes.Attribute) -> bool:
+    """True if the element got removed from its Object / PropertySet without being deleted, exports skip it"""
+    if isinstance(element, classes.PropertySet):
+        return element.object is not None and element not in element.object.get_all_property_sets()
+    property_set = element.property_set
+    return property_set is None or element not in property_set.get_all_attributes()
 
 
 def write_basics(entity_dict: ObjectDict | PropertySetDict | AttributeDict | AggregationDict,
-                 element: classes.ClassTypes) -> None:
-    """function gets called from all Entities"""
+                 element: classes.ClassTypes, lean: bool = False) -> None:
+    """
+    function gets called from all Entities
+    lean: skip everything the loader can restore on its own (all-True filter matrix, missing parent,
+    description inherited from the parent)
+    """
     entity_dict[NAME] = element.name
     entity_dict[OPTIONAL] = element.optional
-    entity_dict[FILTER_MATRIX] = write_filter_matrix(element)
-    parent = None if element.parent is None else element.parent.uuid
-    entity_dict[PARENT] = parent
-    entity_dict[DESCRIPTION] = element.description
+    if not lean:
+        entity_dict[FILTER_MATRIX] = write_filter_matrix(element)
+        entity_dict[PARENT] = None if element.parent is None else element.parent.uuid
+        entity_dict[DESCRIPTION] = element.description
+        return
+
+    filter_matrix = write_filter_matrix(element)
+    if not all(all(row) for row in filter_matrix):
+        entity_dict[FILTER_MATRIX] = filter_matrix
+    if element.parent is not None:
+        entity_dict[PARENT] = element.parent.uuid
+        if element.description_wo_hirarchy:
+            entity_dict[DESCRIPTION] = element.description_wo_hirarchy
+    else:
+        entity_dict[DESCRIPTION] = element.description
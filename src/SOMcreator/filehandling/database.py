@@ -0,0 +1,282 @@
+"""
+SQLite storage for projects that are too large to be read and written as a whole.
+Every Object, PropertySet, Attribute and Aggregation is stored in its own row as the same dict that gets written to
+JSON (without the nested children), so a save only rewrites the rows of the items that changed.
+The project, the Objects, the predefined PropertySets and the Aggregations are loaded on open, the PropertySets and
+Attributes of an Object get loaded the first time they are requested.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+from typing import TYPE_CHECKING, Type
+
+from SOMcreator import classes
+from . import core, project, predefined_pset, property_set, attribute, obj, aggregation, inheritance, serializer
+from .constants import PROJECT, PREDEFINED_PSETS, OBJECTS, AGGREGATIONS, PROPERTY_SETS, ATTRIBUTES, IDENT_ATTRIBUTE
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+    from .typing import MainDict, ObjectDict, PropertySetDict
+
+FILE_EXTENSION = ".somdb"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS project (key TEXT PRIMARY KEY, data BLOB);
+CREATE TABLE IF NOT EXISTS objects (uuid TEXT PRIMARY KEY, ident_value TEXT, data BLOB);
+CREATE TABLE IF NOT EXISTS property_sets (uuid TEXT PRIMARY KEY, object TEXT, parent TEXT, data BLOB);
+CREATE TABLE IF NOT EXISTS attributes (uuid TEXT PRIMARY KEY, property_set TEXT, object TEXT, parent TEXT, data BLOB);
+CREATE TABLE IF NOT EXISTS aggregations (uuid TEXT PRIMARY KEY, data BLOB);
+CREATE INDEX IF NOT EXISTS property_set_object ON property_sets (object);
+CREATE INDEX IF NOT EXISTS property_set_parent ON property_sets (parent);
+CREATE INDEX IF NOT EXISTS attribute_object ON attributes (object);
+CREATE INDEX IF NOT EXISTS attribute_parent ON attributes (parent);
+"""
+
+_TABLES = {  # keyed by class name, the classes module imports filehandling
+    "Object":      "objects",
+    "PropertySet": "property_sets",
+    "Attribute":   "attributes",
+    "Aggregation": "aggregations",
+}
+
+_SCHEMA_KEY = "schema_version"
+
+
+def is_database_path(path: str | os.PathLike) -> bool:
+    return os.fspath(path).lower().endswith(FILE_EXTENSION)
+
+
+class ProjectStore(object):
+    """
+    Connection to a .somdb file. The store gets attached to the Project it loaded or saved and keeps track of the
+    Objects whose content is still in the database
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.path.abspath(os.fspath(path))
+        self._connection = sqlite3.connect(self.path)
+        self._connection.executescript(_SCHEMA)
+        self._children_cache: dict[str, list[str]] = dict()
+        self._phase_list: list[classes.Phase] = list()
+        self._use_case_list: list[classes.UseCase] = list()
+        self._project_dict: dict = dict()
+        self._project: Project | None = None
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _get_project_rows(self) -> dict[str, object]:
+        rows = self._connection.execute("SELECT key, data FROM project")
+        return {key: serializer.loads(data) for key, data in rows}
+
+    ##### Import #####
+
+    def load_project(self, cls: Type[Project]) -> Project:
+        project_rows = self._get_project_rows()
+        if PROJECT not in project_rows:
+            raise ValueError(f"File '{self.path}' contains no {PROJECT}")
+        schema_version = project_rows.pop(_SCHEMA_KEY, SCHEMA_VERSION)
+        if schema_version > SCHEMA_VERSION:
+            raise ValueError(f"SOM database version {schema_version} is not supported (max {SCHEMA_VERSION})")
+
+        main_dict: MainDict = project_rows
+        main_dict[PREDEFINED_PSETS] = self._read_property_sets("object IS NULL", ())
+        main_dict[AGGREGATIONS] = {uuid: serializer.loads(data) for uuid, data in
+                                   self._connection.execute("SELECT uuid, data FROM aggregations ORDER BY rowid")}
+        main_dict[OBJECTS] = dict()
+        context = core.LoadContext(main_dict)
+        proj, project_dict = project.load(cls, main_dict, context)
+        self._project_dict = project_dict
+        self._phase_list, self._use_case_list = context.phase_list, context.use_case_list
+        self._project = proj
+        proj.attach_store(self)
+
+        predefined_pset.load(proj, main_dict, context)
+        core.remove_part_of_dict(context, OBJECTS)
+        rows = self._connection.execute("SELECT uuid, ident_value, data FROM objects ORDER BY rowid").fetchall()
+        for uuid, ident_value, data in rows:
+            object_dict: ObjectDict = serializer.loads(data)
+            object_dict[PROPERTY_SETS] = dict()
+            object_dict[IDENT_ATTRIBUTE] = None
+            obj.load_entry(proj, object_dict, uuid, context)
+            proj.get_element_by_uuid(uuid).set_pending(ident_value)
+        aggregation.load(proj, main_dict, context)
+
+        proj.load_report["inheritance"] = inheritance.calculate(proj, context)
+        aggregation.calculate(proj, context)
+        proj.plugin_dict = context.plugin_dict
+        proj.import_dict = main_dict
+        proj.start_change_tracking(self.path)
+        return proj
+
+    def _read_property_sets(self, condition: str, parameters: tuple) -> dict[str, PropertySetDict]:
+        psets_dict = dict()
+        for uuid, data in self._connection.execute(
+                f"SELECT uuid, data FROM property_sets WHERE {condition} ORDER BY rowid", parameters):
+            pset_dict = serializer.loads(data)
+            pset_dict[ATTRIBUTES] = dict()
+            psets_dict[uuid] = pset_dict
+        if not psets_dict:
+            return psets_dict
+        for uuid, pset_uuid, data in self._connection.execute(
+                f"SELECT uuid, property_set, data FROM attributes WHERE {condition} ORDER BY rowid", parameters):
+            if pset_uuid in psets_dict:
+                psets_dict[pset_uuid][ATTRIBUTES][uuid] = serializer.loads(data)
+        return psets_dict
+
+    def load_object_content(self, element: classes.Object) -> None:
+        """loads PropertySets and Attributes of a pending Object and links them to their parents"""
+        proj = element.project
+        context = core.LoadContext({PROJECT: self._project_dict})
+        context.phase_list, context.use_case_list = self._phase_list, self._use_case_list
+
+        row = self._connection.execute("SELECT data FROM objects WHERE uuid = ?", (element.uuid,)).fetchone()
+        for uuid, pset_dict in self._read_property_sets("object = ?", (element.uuid,)).items():
+            property_set.load(proj, pset_dict, uuid, element, context)
+        ident_attrib_id = None if row is None else serializer.loads(row[0]).get(IDENT_ATTRIBUTE)
+        element.ident_attrib = proj.get_element_by_uuid(ident_attrib_id)
+
+        for entity, uuid in context.parent_dict.items():
+            parent = proj.get_element_by_uuid(uuid)
+            if parent is not None:
+                parent.add_child(entity)
+
+    def get_object_of(self, uuid: str) -> classes.Object | None:
+        """returns the pending Object that contains the PropertySet or Attribute with the given uuid"""
+        row = self._connection.execute("SELECT object FROM property_sets WHERE uuid = ? UNION "
+                                       "SELECT object FROM attributes WHERE uuid = ?", (uuid, uuid)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        element = self._project.get_element_by_uuid(row[0])
+        return element if isinstance(element, classes.Object) else None
+
+    def get_content_uuids(self, object_uuids: set[str]) -> set[str]:
+        """returns the uuids of the PropertySets and Attributes of the given Objects"""
+        rows = self._connection.execute("SELECT uuid, object FROM property_sets UNION ALL "
+                                        "SELECT uuid, object FROM attributes")
+        return {uuid for uuid, object_uuid in rows if object_uuid in object_uuids}
+
+    def get_objects_with_children_of(self, item: classes.Hirarchy) -> list[classes.Object]:
+        """returns the pending Objects that contain children of item"""
+        if not isinstance(item, (classes.PropertySet, classes.Attribute)):  # Objects and Aggregations are loaded
+            return list()
+        object_uuids = self._children_cache.get(item.uuid)
+        if object_uuids is None:
+            table = _TABLES[type(item).__name__]
+            object_uuids = [row[0] for row in self._connection.execute(
+                f"SELECT DISTINCT object FROM {table} WHERE parent = ? AND object IS NOT NULL", (item.uuid,))]
+            self._children_cache[item.uuid] = object_uuids
+        proj = item.project
+        objects = [proj.get_element_by_uuid(uuid) for uuid in object_uuids]
+        return [o for o in objects if isinstance(o, classes.Object) and not o.is_loaded]
+
+    ##### Export #####
+
+    def _write_project(self, proj: Project) -> None:
+        main_dict: MainDict = dict()
+        project.write(proj, main_dict)
+        main_dict.update(proj.plugin_dict)
+        main_dict[_SCHEMA_KEY] = SCHEMA_VERSION
+        self._connection.execute("DELETE FROM project")
+        self._connection.executemany("INSERT INTO project (key, data) VALUES (?, ?)",
+                                     [(key, serializer.dumps(value)) for key, value in main_dict.items()])
+        self._project_dict = main_dict[PROJECT]
+        self._phase_list, self._use_case_list = proj.get_project_phase_list(), proj.get_use_case_list()
+
+    def _write_item(self, item: classes.Hirarchy) -> None:
+        execute = self._connection.execute
+        if isinstance(item, (classes.PropertySet, classes.Attribute)) and core.is_detached(item):
+            # not part of the project file until it gets attached again, which rewrites its row
+            execute(f"DELETE FROM {_TABLES[type(item).__name__]} WHERE uuid = ?", (item.uuid,))
+        elif isinstance(item, classes.Object):
+            execute("INSERT OR REPLACE INTO objects (uuid, ident_value, data) VALUES (?, ?, ?)",
+                    (item.uuid, item.ident_value, serializer.dumps(obj._write_object(item, property_sets=False))))
+        elif isinstance(item, classes.PropertySet):
+            object_uuid = None if item.object is None else item.object.uuid
+            parent_uuid = None if item.parent is None else item.parent.uuid
+            execute("INSERT OR REPLACE INTO property_sets (uuid, object, parent, data) VALUES (?, ?, ?, ?)",
+                    (item.uuid, object_uuid, parent_uuid, serializer.dumps(property_set.write_entry(item, attributes=False))))
+        elif isinstance(item, classes.Attribute):
+            pset = item.property_set
+            object_uuid = None if pset is None or pset.object is None else pset.object.uuid
+            execute("INSERT OR REPLACE INTO attributes (uuid, property_set, object, parent, data) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (item.uuid, None if pset is None else pset.uuid, object_uuid,
+                     None if item.parent is None else item.parent.uuid, serializer.dumps(attribute.write(item))))
+        elif isinstance(item, classes.Aggregation):
+            execute("INSERT OR REPLACE INTO aggregations (uuid, data) VALUES (?, ?)",
+                    (item.uuid, serializer.dumps(aggregation._create_entry(item))))
+
+    def save_full(self, proj: Project) -> None:
+        """replaces the content of the database with the whole project"""
+        proj.load_pending_objects()
+        self._project = proj
+        with self._connection:
+            for table in ("project", *_TABLES.values()):
+                self._connection.execute(f"DELETE FROM {table}")
+            self._write_project(proj)
+            # same order as the JSON export, the rows get loaded in insertion order
+            psets = sorted(proj.get_predefined_psets(), key=lambda x: x.uuid)
+            for element in sorted(proj.get_all_objects(), key=lambda o: o.uuid):
+                self._write_item(element)
+                psets += element.get_all_property_sets()
+            for pset in psets:
+                self._write_item(pset)
+                for item in pset.get_all_attributes():
+                    self._write_item(item)
+            for item in proj.get_all_aggregations():
+                self._write_item(item)
+        self._children_cache.clear()
+        proj.start_change_tracking(self.path)
+
+    def flush(self, proj: Project) -> None:
+        """writes the items that changed since the last save"""
+        if proj.change_base != self.path or proj.has_filter_changes():  # the stored rows are outdated
+            self.save_full(proj)
+            return
+        dirty_items, removed_items = proj.pop_item_changes()
+        with self._connection:
+            for uuid, item_type in removed_items.items():
+                table = _TABLES.get(item_type.__name__)
+                if table is not None:
+                    self._connection.execute(f"DELETE FROM {table} WHERE uuid = ?", (uuid,))
+                if item_type is classes.Object:  # content of an Object that was deleted before it got loaded
+                    self._connection.execute("DELETE FROM property_sets WHERE object = ?", (uuid,))
+                    self._connection.execute("DELETE FROM attributes WHERE object = ?", (uuid,))
+            for item in dirty_items:
+                if proj.get_element_by_uuid(item.uuid) is not item:  # removed after it was modified
+                    continue
+                self._write_item(item)
+            self._write_project(proj)
+        self._children_cache.clear()
+
+
+def open_database(cls: Type[Project], path: str | os.PathLike) -> Project:
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"File '{path}' does not exist!")
+    store = ProjectStore(path)
+    try:
+        return store.load_project(cls)
+    except Exception:
+        store.close()
+        raise
+
+
+def export_database(proj: Project, path: str | os.PathLike) -> None:
+    """
+    saving to the database the project was opened from or last saved to only writes the changes,
+    any other path gets a full copy of the project and becomes the store of the project
+    """
+    store = proj.store
+    if isinstance(store, ProjectStore) and store.path == os.path.abspath(os.fspath(path)):
+        store.flush(proj)
+        return
+    if os.path.exists(path):
+        os.remove(path)
+    new_store = ProjectStore(path)
+    new_store.save_full(proj)
+    proj.attach_store(new_store)
+    if isinstance(store, ProjectStore):
+        store.close()
@@ -1,35 +1,93 @@
 from __future__ import annotations
+import logging
 import SOMcreator
 from SOMcreator import classes
+from SOMcreator.filehandling import core
 
+UUID = "uuid"
+NAME = "name"
+UNRESOLVED = "unresolved"
 
-def _find_parent(uuid_dict, element: classes.ClassTypes):
-    for test_el, identifier in SOMcreator.filehandling.parent_dict.items():
-        if type(test_el) is not type(element):
-            continue
-        if identifier not in uuid_dict:
-            continue
-        if test_el == element:
-            continue
-        if test_el.parent is not None:
-            continue
 
-        if test_el.name != element.name:
-            continue
+def _value_key(value: list):
+    try:
+        key = tuple(value)
+        hash(key)
+    except TypeError:  # unhashable values like ranges
+        key = repr(value)
+    return key
+
+
+class _ParentIndex(object):
+    """
+    Maps (type, name[, value]) to the entities whose parent uuid exists in the project.
+    Those are the only candidates the name fallback may copy a parent from. Candidates are kept in load order and
+    skipped once they are linked, so every bucket is walked at most once per load
+    """
 
-        if isinstance(test_el, classes.Attribute):
-            if test_el.value == element.value:
+    def __init__(self, parent_dict: dict, uuids: set[str]):
+        self._buckets: dict[tuple, list] = dict()
+        self._positions: dict[tuple, int] = dict()
+        for entity, identifier in parent_dict.items():
+            if identifier is None or identifier not in uuids:
+                continue
+            for key in self._keys(entity):
+                self._buckets.setdefault(key, list()).append((entity, identifier))
+
+    @staticmethod
+    def _keys(entity: classes.ClassTypes) -> list[tuple]:
+        keys = list()
+        if isinstance(entity, classes.Attribute):
+            keys.append((type(entity), entity.name, _value_key(entity.value)))
+        keys.append((type(entity), entity.name))
+        return keys
+
+    def _first_free(self, key: tuple, element: classes.ClassTypes) -> str | None:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return None
+        position = self._positions.get(key, 0)
+        while position < len(bucket) and bucket[position][0].parent is not None:
+            position += 1
+        self._positions[key] = position
+        for index in range(position, len(bucket)):
+            entity, identifier = bucket[index]
+            if entity is element:
+                continue
+            if entity.parent is None:
                 return identifier
-        return identifier
+        return None
 
+    def find_parent(self, element: classes.ClassTypes) -> str | None:
+        for key in self._keys(element):
+            identifier = self._first_free(key, element)
+            if identifier is not None:
+                return identifier
+        return None
 
-def calculate(proj: SOMcreator.Project):
-    uuid_dict = proj.get_uuid_dict()
-    for entity, uuid in SOMcreator.filehandling.parent_dict.items():
-        if uuid is None:
-            continue
-        if uuid not in uuid_dict:
-            uuid = _find_parent(uuid_dict, entity)
+
+def calculate(proj: SOMcreator.Project, context: core.LoadContext) -> dict[str, int]:
+    """links all loaded entities to their parents and returns how many parents were resolved by uuid and by name"""
+    parent_dict = context.parent_dict
+    report = {UUID: 0, NAME: 0, UNRESOLVED: 0}
+    index = None
+    for entity, uuid in parent_dict.items():
         if uuid is None:
             continue
-        uuid_dict[uuid].add_child(entity)
+        parent = proj.get_element_by_uuid(uuid)  # loads the parent if it is part of a pending Object
+        if parent is not None:
+            report[UUID] += 1
+        else:
+            if index is None:
+                index = _ParentIndex(parent_dict, proj.get_uuids())  # keeps pending Objects pending
+            uuid = index.find_parent(entity)
+            if uuid is None:
+                report[UNRESOLVED] += 1
+                continue
+            report[NAME] += 1
+            parent = proj.get_element_by_uuid(uuid)
+        parent.add_child(entity)
+
+    logging.info(f"Inheritance: {report[UUID]} parents resolved by uuid, {report[NAME]} by name, "
+                 f"{report[UNRESOLVED]} unresolved")
+    return report
@@ -0,0 +1,218 @@
+"""
+Append-only journal for JSON files. An incremental save appends the entities that changed since the last save to
+<file>.journal instead of rewriting the file, open_json replays the journal on top of the file.
+Every line of the journal is one save: the project section, the removed uuids and the changed entities as the same
+dicts that get written to JSON (without their nested children). compact() folds the journal back into the file.
+Replaying an entry twice gives the same result, so a compaction that gets interrupted can't corrupt the project.
+Every entry stores size and hash of the file it was written for, entries of a file that got rewritten by another
+tool are skipped.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from SOMcreator import classes
+from . import core, project, obj, property_set, attribute, aggregation, serializer
+from .constants import PREDEFINED_PSETS, OBJECTS, AGGREGATIONS, PROPERTY_SETS, ATTRIBUTES
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+    from .typing import MainDict
+
+JOURNAL_SUFFIX = ".journal"
+COMPACTION_RATIO = 0.5  # incremental saves rewrite the whole file once the journal exceeds this share of its size
+
+# keys of a journal entry
+MAIN = "main"
+REMOVED = "removed"
+ITEMS = "items"
+BASE = "base"
+
+_TYPE_ORDER = ("Object", "PropertySet", "Attribute", "Aggregation")  # owners need to exist before their children
+_CHILDREN_KEYS = {"Object": PROPERTY_SETS, "PropertySet": ATTRIBUTES}
+
+
+def get_journal_path(path: str | os.PathLike) -> str:
+    return os.fspath(path) + JOURNAL_SUFFIX
+
+
+def needs_compaction(path: str | os.PathLike) -> bool:
+    journal_path = get_journal_path(path)
+    if not os.path.isfile(journal_path):
+        return False
+    return os.path.getsize(journal_path) > COMPACTION_RATIO * os.path.getsize(path)
+
+
+_fingerprints: dict[str, tuple[tuple[int, int], list]] = dict()  # path -> ((size, mtime), fingerprint)
+
+
+def get_fingerprint(path: str | os.PathLike) -> list:
+    """[size, sha256] of the file at path, the hash gets reused while size and mtime don't change"""
+    path = os.path.abspath(os.fspath(path))
+    stat = os.stat(path)
+    key = (stat.st_size, stat.st_mtime_ns)
+    cached = _fingerprints.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    file_hash = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            file_hash.update(chunk)
+    fingerprint = [stat.st_size, file_hash.hexdigest()]
+    _fingerprints[path] = (key, fingerprint)
+    return fingerprint
+
+
+def remove(path: str | os.PathLike) -> None:
+    """removes the journal of the file at path, needs to be called after the file got written as a whole"""
+    journal_path = get_journal_path(path)
+    if os.path.isfile(journal_path):
+        os.remove(journal_path)
+
+
+##### Export #####
+
+def _create_item_entry(item: classes.Hirarchy) -> list:
+    """[type name, uuid, uuid of the owner, entity dict]"""
+    if isinstance(item, classes.Object):
+        return ["Object", item.uuid, None, obj._write_object(item, property_sets=False)]
+    if isinstance(item, classes.PropertySet):
+        owner = None if item.object is None else item.object.uuid
+        return ["PropertySet", item.uuid, owner, property_set.write_entry(item, attributes=False)]
+    if isinstance(item, classes.Attribute):
+        owner = None if item.property_set is None else item.property_set.uuid
+        return ["Attribute", item.uuid, owner, attribute.write(item)]
+    return ["Aggregation", item.uuid, None, aggregation._create_entry(item)]
+
+
+def _is_detached(item: classes.Hirarchy) -> bool:
+    return isinstance(item, (classes.PropertySet, classes.Attribute)) and core.is_detached(item)
+
+
+def create_entry(proj: Project) -> dict:
+    """collects the changes since the last save"""
+    dirty_items, removed_items = proj.pop_item_changes()
+    items = [item for item in dirty_items if proj.get_element_by_uuid(item.uuid) is item]
+    # items that got removed from their owner are not part of the file until they get attached again
+    removed = list(removed_items) + [item.uuid for item in items if _is_detached(item)]
+    items = [item for item in items if not _is_detached(item)]
+    items.sort(key=lambda item: _TYPE_ORDER.index(type(item).__name__))
+
+    main_dict: MainDict = dict()
+    project.write(proj, main_dict)
+    main_dict.update(proj.plugin_dict)
+    return {
+        MAIN:    main_dict,
+        REMOVED: removed,
+        ITEMS:   [_create_item_entry(item) for item in items],
+    }
+
+
+def append(proj: Project, path: str | os.PathLike) -> dict:
+    entry = create_entry(proj)
+    entry[BASE] = get_fingerprint(path)
+    with open(get_journal_path(path), "ab") as file:
+        file.write(serializer.dumps(entry) + b"\n")
+    return entry
+
+
+##### Import #####
+
+def _index(main_dict: MainDict) -> dict[str, dict]:
+    """maps the uuid of every entity to the dict that contains it"""
+    locations = dict()
+    psets_dicts = [main_dict.get(PREDEFINED_PSETS) or dict()]
+    for key in (PREDEFINED_PSETS, OBJECTS, AGGREGATIONS):
+        container = main_dict.get(key) or dict()
+        locations.update(dict.fromkeys(container, container))
+    for object_dict in (main_dict.get(OBJECTS) or dict()).values():
+        psets_dict = object_dict.get(PROPERTY_SETS) or dict()
+        locations.update(dict.fromkeys(psets_dict, psets_dict))
+        psets_dicts.append(psets_dict)
+    for psets_dict in psets_dicts:
+        for pset_dict in psets_dict.values():
+            attributes_dict = pset_dict.get(ATTRIBUTES) or dict()
+            locations.update(dict.fromkeys(attributes_dict, attributes_dict))
+    return locations
+
+
+def _get_container(main_dict: MainDict, locations: dict[str, dict], type_name: str, owner: str | None) -> dict | None:
+    if type_name == "Object":
+        return main_dict.setdefault(OBJECTS, dict())
+    if type_name == "Aggregation":
+        return main_dict.setdefault(AGGREGATIONS, dict())
+    if type_name == "PropertySet" and owner is None:
+        return main_dict.setdefault(PREDEFINED_PSETS, dict())
+    owner_container = locations.get(owner)
+    if owner_container is None or owner not in owner_container:
+        return None
+    return owner_container[owner].setdefault(PROPERTY_SETS if type_name == "PropertySet" else ATTRIBUTES, dict())
+
+
+def _apply_entry(main_dict: MainDict, entry: dict, locations: dict[str, dict]) -> None:
+    main_dict.update(entry[MAIN])
+    for uuid in entry[REMOVED]:
+        container = locations.pop(uuid, None)
+        if container is not None:
+            container.pop(uuid, None)
+
+    for type_name, uuid, owner, entity_dict in entry[ITEMS]:
+        container = _get_container(main_dict, locations, type_name, owner)
+        if container is None:
+            logging.warning(f"Journal: owner {owner} of {type_name} {uuid} doesn't exist")
+            continue
+        old_container = locations.get(uuid)
+        old_dict = None if old_container is None else old_container.get(uuid)
+        children_key = _CHILDREN_KEYS.get(type_name)
+        if children_key is not None:  # entries don't contain the children, they are kept from the previous state
+            entity_dict[children_key] = dict() if old_dict is None else old_dict.get(children_key, dict())
+        if old_dict is not None and old_container is not container:
+            del old_container[uuid]
+        container[uuid] = entity_dict
+        locations[uuid] = container
+
+
+def apply(main_dict: MainDict, path: str | os.PathLike) -> int:
+    """replays the journal of the file at path on its main_dict and returns the number of applied entries"""
+    journal_path = get_journal_path(path)
+    if not os.path.isfile(journal_path):
+        return 0
+    locations = _index(main_dict)
+    fingerprint = get_fingerprint(path)
+    count = 0
+    with open(journal_path, "rb") as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = serializer.loads(line)
+            except ValueError:  # the last save got interrupted
+                logging.warning(f"Journal '{journal_path}': entry {number} is incomplete and gets skipped")
+                break
+            if entry.get(BASE, fingerprint) != fingerprint:
+                logging.warning(f"Journal '{journal_path}': entry {number} belongs to another version of the file "
+                                f"and gets skipped")
+                continue
+            _apply_entry(main_dict, entry, locations)
+            count += 1
+    logging.info(f"Journal '{journal_path}': {count} entries applied")
+    return count
+
+
+def compact(path: str | os.PathLike, canonical: bool = False) -> int:
+    """
+    folds the journal into the file without loading a Project and returns the number of folded entries
+    """
+    with open(path, "rb") as file:
+        main_dict: MainDict = serializer.loads(file.read())
+    count = apply(main_dict, path)
+    if count:
+        temporary_path = os.fspath(path) + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(serializer.dumps(main_dict, canonical))
+        os.replace(temporary_path, path)
+    remove(path)
+    return count
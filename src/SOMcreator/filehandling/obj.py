@@ -13,8 +13,9 @@ if TYPE_CHECKING:
 
 ### Import ###
 
-def _load_object(proj: SOMcreator.Project, object_dict: ObjectDict, identifier: str) -> None:
-    name, description, optional, parent, filter_matrix = core.get_basics(proj, object_dict)
+def load_entry(proj: SOMcreator.Project, object_dict: ObjectDict, identifier: str,
+               context: core.LoadContext) -> None:
+    name, description, optional, parent, filter_matrix = core.get_basics(proj, object_dict, context)
     ifc_mapping = object_dict[IFC_MAPPINGS]
     if isinstance(ifc_mapping, list):
         ifc_mapping = set(ifc_mapping)
@@ -26,38 +27,39 @@ def _load_object(proj: SOMcreator.Project, object_dict: ObjectDict, identifier:
                          filter_matrix=filter_matrix)
     property_sets_dict = object_dict[PROPERTY_SETS]
     for ident, pset_dict in property_sets_dict.items():
-        property_set.load(proj, pset_dict, ident, obj)
+        property_set.load(proj, pset_dict, ident, obj, context)
     ident_attrib_id = object_dict[IDENT_ATTRIBUTE]
     ident_attrib = proj.get_element_by_uuid(ident_attrib_id)
     obj.ident_attrib = ident_attrib
-    SOMcreator.filehandling.parent_dict[obj] = parent
+    context.parent_dict[obj] = parent
 
 
-def load(proj: Project, main_dict: dict):
+def load(proj: Project, main_dict: dict, context: core.LoadContext):
     objects_dict: dict[str, ObjectDict] = main_dict.get(OBJECTS)
-    core.remove_part_of_dict(OBJECTS)
+    core.remove_part_of_dict(context, OBJECTS)
 
     objects_dict = dict() if core.check_dict(objects_dict, OBJECTS) else objects_dict
 
     for uuid_ident, entity_dict in objects_dict.items():
-        _load_object(proj, entity_dict, uuid_ident)
+        load_entry(proj, entity_dict, uuid_ident, context)
 
 
 ### Export ###
-def _write_object(element: classes.Object) -> ObjectDict:
+def _write_object(element: classes.Object, lean: bool = False, property_sets: bool = True) -> ObjectDict:
+    """property_sets: False skips the PropertySets, for backends that store every entity separately"""
     object_dict: ObjectDict = dict()
-    core.write_basics(object_dict, element)
+    core.write_basics(object_dict, element, lean)
 
     if isinstance(element.ifc_mapping, set):
         object_dict[IFC_MAPPINGS] = list(element.ifc_mapping)
     else:
         object_dict[IFC_MAPPINGS] = list(element.ifc_mapping)
 
-    psets_dict = dict()
-    for pset in element.get_all_property_sets():
-        psets_dict[pset.uuid] = property_set.write_entry(pset)
-
-    object_dict[PROPERTY_SETS] = psets_dict
+    if property_sets:
+        psets_dict = dict()
+        for pset in element.get_all_property_sets():
+            psets_dict[pset.uuid] = property_set.write_entry(pset, lean)
+        object_dict[PROPERTY_SETS] = psets_dict
     object_dict[ABBREVIATION] = element.abbreviation
 
     if isinstance(element.ident_attrib, classes.Attribute):
@@ -68,8 +70,8 @@ def _write_object(element: classes.Object) -> ObjectDict:
     return object_dict
 
 
-def write(proj: Project, main_dict: MainDict):
+def write(proj: Project, main_dict: MainDict, lean: bool = False):
     main_dict[OBJECTS] = dict()
 
     for obj in sorted(proj.get_all_objects(), key=lambda o: o.uuid):
-        main_dict[OBJECTS][obj.uuid] = _write_object(obj)
+        main_dict[OBJECTS][obj.uuid] = _write_object(obj, lean)
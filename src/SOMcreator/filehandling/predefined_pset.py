@@ -5,20 +5,24 @@ from SOMcreator.filehandling import property_set
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from SOMcreator.filehandling.typing import MainDict
+    from SOMcreator.filehandling.typing import MainDict, PropertySetDict
     from SOMcreator import Project
 
 
-def load(project: Project, main_dict: MainDict):
+def load_entry(project: Project, pset_dict: PropertySetDict, identifier: str, context: core.LoadContext):
+    property_set.load(project, pset_dict, identifier, None, context)
+
+
+def load(project: Project, main_dict: MainDict, context: core.LoadContext):
     predef_pset_dict = main_dict.get(PREDEFINED_PSETS)
-    core.remove_part_of_dict(PREDEFINED_PSETS)
+    core.remove_part_of_dict(context, PREDEFINED_PSETS)
     predef_pset_dict = dict() if core.check_dict(predef_pset_dict, PREDEFINED_PSETS) else predef_pset_dict
 
     for uuid_ident, entity_dict in predef_pset_dict.items():
-        property_set.load(project, entity_dict, uuid_ident, None)
+        load_entry(project, entity_dict, uuid_ident, context)
 
 
-def write(proj: Project, main_dict: MainDict):
+def write(proj: Project, main_dict: MainDict, lean: bool = False):
     main_dict[PREDEFINED_PSETS] = dict()
     for predefined_property_set in sorted(proj.get_predefined_psets(), key=lambda x: x.uuid):
-        main_dict[PREDEFINED_PSETS][predefined_property_set.uuid] = property_set.write_entry(predefined_property_set)
+        main_dict[PREDEFINED_PSETS][predefined_property_set.uuid] = property_set.write_entry(predefined_property_set, lean)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import threading
 from typing import TYPE_CHECKING, Type
 
 from .constants import PROJECT, NAME, AUTHOR, VERSION, AGGREGATION_PSET, AGGREGATION_ATTRIBUTE, CURRENT_PR0JECT_PHASE, \
@@ -11,6 +12,8 @@ from SOMcreator.filehandling import core
 if TYPE_CHECKING:
     from SOMcreator import Project
 
+_activation_lock = threading.Lock()
+
 
 def _load_filter_matrix(project_dict: ProjectDict, use_case_list: list[classes.UseCase],
                         phase_list: list[classes.Phase]):
@@ -41,21 +44,22 @@ def _load_filter(current_state: str | int | None,
     return current_state, value_list
 
 
-def _load_usecases(project_dict: ProjectDict) -> tuple[classes.UseCase, list[classes.UseCase]]:
+def _load_usecases(project_dict: ProjectDict,
+                   context: core.LoadContext) -> tuple[classes.UseCase, list[classes.UseCase]]:
     current_use_case = project_dict.get(CURRENT_USE_CASE)
-    use_case_list = SOMcreator.filehandling.use_case_list
+    use_case_list = context.use_case_list
     return _load_filter(current_use_case, use_case_list)
 
 
-def _load_phases(project_dict: ProjectDict) -> tuple[classes.Phase, list[classes.Phase]]:
+def _load_phases(project_dict: ProjectDict, context: core.LoadContext) -> tuple[classes.Phase, list[classes.Phase]]:
     current_project_phase = project_dict.get(CURRENT_PR0JECT_PHASE)
-    phase_list = SOMcreator.filehandling.phase_list
+    phase_list = context.phase_list
     return _load_filter(current_project_phase, phase_list)
 
 
-def load(cls: Type[Project], main_dict: MainDict) -> tuple[Project, dict]:
+def load(cls: Type[Project], main_dict: MainDict, context: core.LoadContext) -> tuple[Project, dict]:
     project_dict: ProjectDict = main_dict.get(PROJECT)
-    core.remove_part_of_dict(PROJECT)
+    core.remove_part_of_dict(context, PROJECT)
 
     name = project_dict.get(NAME)
     author = project_dict.get(AUTHOR)
@@ -64,11 +68,15 @@ def load(cls: Type[Project], main_dict: MainDict) -> tuple[Project, dict]:
     aggregation_pset_name = project_dict.get(AGGREGATION_PSET)
     aggregation_attribute = project_dict.get(AGGREGATION_ATTRIBUTE)
 
-    current_use_case, use_case_list = _load_usecases(project_dict)
-    current_phase, phase_list = _load_phases(project_dict)
+    current_use_case, use_case_list = _load_usecases(project_dict, context)
+    current_phase, phase_list = _load_phases(project_dict, context)
     filter_matrix = _load_filter_matrix(project_dict, use_case_list, phase_list)
 
-    proj = cls(name, author, phase_list, use_case_list, filter_matrix)
+    # loading never changes SOMcreator.active_project, the caller activates the loaded project if it wants to
+    with _activation_lock:
+        active_project = SOMcreator.active_project
+        proj = cls(name, author, phase_list, use_case_list, filter_matrix)
+        SOMcreator.active_project = active_project
     proj.version = version
     if aggregation_pset_name is not None:
         proj.aggregation_pset = aggregation_pset_name
@@ -11,14 +11,15 @@ if TYPE_CHECKING:
     from SOMcreator import Project
 
 
-def load(proj: Project, pset_dict: PropertySetDict, identifier: str, obj: classes.Object | None) -> None:
-    name, description, optional, parent, filter_matrix = core.get_basics(proj, pset_dict)
+def load(proj: Project, pset_dict: PropertySetDict, identifier: str, obj: classes.Object | None,
+         context: core.LoadContext) -> None:
+    name, description, optional, parent, filter_matrix = core.get_basics(proj, pset_dict, context)
     pset = classes.PropertySet(name=name, obj=obj, uuid=identifier, description=description, optional=optional,
                                project=proj, filter_matrix=filter_matrix)
     attributes_dict = pset_dict[ATTRIBUTES]
     for ident, attribute_dict in attributes_dict.items():
-        attribute.load(proj, attribute_dict, ident, pset)
-    SOMcreator.filehandling.parent_dict[pset] = parent
+        attribute.load(proj, attribute_dict, ident, pset, context)
+    context.parent_dict[pset] = parent
 
 
 
@@ -26,12 +27,15 @@ def load(proj: Project, pset_dict: PropertySetDict, identifier: str, obj: classe
 
 #### Export ####
 
-def write_entry(pset: classes.PropertySet) -> PropertySetDict:
+def write_entry(pset: classes.PropertySet, lean: bool = False, attributes: bool = True) -> PropertySetDict:
+    """attributes: False skips the Attributes, for backends that store every entity separately"""
     pset_dict: PropertySetDict = dict()
-    core.write_basics(pset_dict, pset)
+    core.write_basics(pset_dict, pset, lean)
+    if not attributes:
+        return pset_dict
     attributes_dict = dict()
     for attrib in pset.get_all_attributes():
-        new_dict = attribute.write(attrib)
+        new_dict = attribute.write(attrib, lean)
         attributes_dict[attrib.uuid] = new_dict
     pset_dict[ATTRIBUTES] = attributes_dict
     return pset_dict
@@ -0,0 +1,153 @@
+"""
+Partial loading. The main_dict gets reduced to the selected Objects and everything they depend on before any entity
+is constructed: parent Objects, the PropertySets (predefined or part of other Objects) and Attributes their entities
+inherit from, the Aggregations of the selected Objects and the parent chains of those Aggregations.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable
+
+from .constants import OBJECTS, PREDEFINED_PSETS, AGGREGATIONS, PROPERTY_SETS, ATTRIBUTES, PARENT, IFC_MAPPINGS, \
+    IDENT_ATTRIBUTE, VALUE, CHILD_INHERITS_VALUE, OBJECT, SHARES_VALUES
+
+if TYPE_CHECKING:
+    from .typing import MainDict, ObjectDict, AttributeDict
+
+SELECTED = "selected"
+LOADED = "loaded"
+SKIPPED = "skipped"
+
+
+class Selection(object):
+    """
+    Objects get selected if their ident value, one of their ifc mappings or their uuid is part of the selection
+    """
+
+    def __init__(self, ident_values: Iterable[str] = (), ifc_mappings: Iterable[str] = (), uuids: Iterable[str] = ()):
+        self.ident_values = set(ident_values)
+        self.ifc_mappings = set(ifc_mappings)
+        self.uuids = set(uuids)
+
+    @classmethod
+    def create(cls, include: Selection | str | Iterable[str]) -> Selection:
+        """include: a Selection, an ident value or an iterable of ident values"""
+        if isinstance(include, Selection):
+            return include
+        if isinstance(include, str):
+            include = [include]
+        return cls(ident_values=include)
+
+    def matches(self, identifier: str, object_dict: ObjectDict, ident_value: str) -> bool:
+        if identifier in self.uuids or ident_value in self.ident_values:
+            return True
+        return not self.ifc_mappings.isdisjoint(object_dict.get(IFC_MAPPINGS) or ())
+
+
+class _DependencyIndex(object):
+    """owner of every PropertySet and Attribute of the main_dict"""
+
+    def __init__(self, main_dict: MainDict):
+        self.pset_owners: dict[str, str | None] = dict()  # uuid of the Object, None for predefined PropertySets
+        self.attribute_owners: dict[str, str] = dict()
+        self.attributes: dict[str, AttributeDict] = dict()
+        for identifier, object_dict in (main_dict.get(OBJECTS) or dict()).items():
+            self._add_property_sets(object_dict.get(PROPERTY_SETS) or dict(), identifier)
+        self._add_property_sets(main_dict.get(PREDEFINED_PSETS) or dict(), None)
+
+    def _add_property_sets(self, psets_dict: dict, owner: str | None) -> None:
+        for pset_uuid, pset_dict in psets_dict.items():
+            self.pset_owners[pset_uuid] = owner
+            attributes_dict = pset_dict.get(ATTRIBUTES) or dict()
+            self.attributes.update(attributes_dict)
+            self.attribute_owners.update(dict.fromkeys(attributes_dict, pset_uuid))
+
+    def _is_inheriting_values(self, attribute_dict: AttributeDict) -> bool:
+        parent = self.attributes.get(attribute_dict.get(PARENT))
+        if parent is None:
+            return False
+        return bool(parent.get(CHILD_INHERITS_VALUE)) or self._is_inheriting_values(parent)
+
+    def get_value(self, identifier: str) -> list:
+        """same as Attribute.value, parents get only resolved by uuid"""
+        attribute_dict = self.attributes[identifier]
+        if attribute_dict.get(SHARES_VALUES) and attribute_dict.get(PARENT) in self.attributes:
+            return self.get_value(attribute_dict[PARENT])
+        own_values = attribute_dict.get(VALUE) or list()
+        if not self._is_inheriting_values(attribute_dict):
+            return own_values
+        parent_values = self.get_value(attribute_dict[PARENT])
+        return parent_values + [value for value in own_values if value not in parent_values]
+
+    def get_ident_value(self, object_dict: ObjectDict) -> str:
+        identifier = object_dict.get(IDENT_ATTRIBUTE)
+        if identifier not in self.attributes:
+            return str()
+        return ";".join(str(x) for x in self.get_value(identifier))
+
+    def get_pset_dependency(self, pset_uuid: str | None) -> tuple[str | None, str | None]:
+        """(object uuid, predefined pset uuid) the PropertySet belongs to"""
+        if pset_uuid not in self.pset_owners:
+            return None, None
+        owner = self.pset_owners[pset_uuid]
+        return (None, pset_uuid) if owner is None else (owner, None)
+
+
+def reduce(main_dict: MainDict, selection: Selection) -> tuple[MainDict, dict[str, int]]:
+    """returns a main_dict with the selected Objects and their dependencies and a report with the Object counts"""
+    objects_dict: dict[str, ObjectDict] = main_dict.get(OBJECTS) or dict()
+    predefined_dict: dict = main_dict.get(PREDEFINED_PSETS) or dict()
+    aggregations_dict: dict = main_dict.get(AGGREGATIONS) or dict()
+    index = _DependencyIndex(main_dict)
+
+    selected = [identifier for identifier, object_dict in objects_dict.items()
+                if selection.matches(identifier, object_dict, index.get_ident_value(object_dict))]
+    objects: set[str] = set()
+    predefined_psets: set[str] = set()
+    aggregations: set[str] = set()
+    object_aggregations: dict[str, list[str]] = dict()
+    for identifier, aggregation_dict in aggregations_dict.items():
+        object_aggregations.setdefault(aggregation_dict.get(OBJECT), list()).append(identifier)
+
+    def add_pset_dependency(pset_uuid: str | None) -> None:
+        object_uuid, predefined_uuid = index.get_pset_dependency(pset_uuid)
+        if object_uuid is not None:
+            stack.append(object_uuid)
+        elif predefined_uuid is not None and predefined_uuid not in predefined_psets:
+            predefined_psets.add(predefined_uuid)
+            add_attribute_dependencies(predefined_dict[predefined_uuid])
+
+    def add_attribute_dependencies(pset_dict: dict) -> None:
+        for attribute_dict in (pset_dict.get(ATTRIBUTES) or dict()).values():
+            parent = attribute_dict.get(PARENT)
+            if parent in index.attribute_owners:
+                add_pset_dependency(index.attribute_owners[parent])
+
+    stack = list(selected)
+    while stack:
+        identifier = stack.pop()
+        if identifier in objects or identifier not in objects_dict:
+            continue
+        objects.add(identifier)
+        object_dict = objects_dict[identifier]
+        stack.append(object_dict.get(PARENT))
+        for pset_dict in (object_dict.get(PROPERTY_SETS) or dict()).values():
+            add_pset_dependency(pset_dict.get(PARENT))
+            add_attribute_dependencies(pset_dict)
+
+        # Aggregations of the Object with their parent chains
+        aggregation_stack = list(object_aggregations.get(identifier, ()))
+        while aggregation_stack:
+            aggregation_uuid = aggregation_stack.pop()
+            if aggregation_uuid in aggregations or aggregation_uuid not in aggregations_dict:
+                continue
+            aggregations.add(aggregation_uuid)
+            aggregation_dict = aggregations_dict[aggregation_uuid]
+            stack.append(aggregation_dict.get(OBJECT))
+            aggregation_stack.append(aggregation_dict.get(PARENT))
+
+    reduced_dict: MainDict = dict(main_dict)
+    reduced_dict[OBJECTS] = {key: value for key, value in objects_dict.items() if key in objects}
+    reduced_dict[PREDEFINED_PSETS] = {key: value for key, value in predefined_dict.items() if key in predefined_psets}
+    reduced_dict[AGGREGATIONS] = {key: value for key, value in aggregations_dict.items() if key in aggregations}
+    report = {SELECTED: len(selected), LOADED: len(objects), SKIPPED: len(objects_dict) - len(objects)}
+    return reduced_dict, report
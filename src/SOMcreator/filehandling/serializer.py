@@ -0,0 +1,134 @@
+"""
+JSON encoding and decoding for Project.open and Project.save.
+orjson or ujson get used if they are installed, the standard library json module is the fallback.
+"""
+from __future__ import annotations
+
+import json
+import locale
+import re
+from typing import Any
+
+STDLIB = "json"
+ORJSON = "orjson"
+UJSON = "ujson"
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_character(match: re.Match) -> str:
+    code = ord(match.group())
+    if code > 0xFFFF:  # characters outside the BMP get written as surrogate pair like json.dumps does
+        code -= 0x10000
+        return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+    return f"\\u{code:04x}"
+
+
+def _ensure_ascii(data: bytes) -> bytes:
+    """escapes non ascii characters, so files stay ascii no matter which backend wrote them"""
+    if data.isascii():
+        return data
+    return _NON_ASCII.sub(_escape_character, data.decode("utf-8")).encode("ascii")
+
+
+class JsonBackend(object):
+    name = STDLIB
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("ascii")
+
+
+class OrjsonBackend(JsonBackend):
+    name = ORJSON
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return _ensure_ascii(self._orjson.dumps(obj))
+
+
+class UjsonBackend(JsonBackend):
+    name = UJSON
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data: bytes) -> Any:
+        return self._ujson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=True, escape_forward_slashes=False).encode("ascii")
+
+
+BACKEND_CLASSES: dict[str, type[JsonBackend]] = {
+    ORJSON: OrjsonBackend,
+    UJSON:  UjsonBackend,
+    STDLIB: JsonBackend,
+}
+
+_backends: dict[str, JsonBackend] = dict()
+_selected_backend: str | None = None
+
+
+def get_backend(name: str | None = None) -> JsonBackend:
+    """
+    returns the backend with the given name. Without a name the backend set by set_backend is returned,
+    otherwise the fastest installed one
+    :raises ImportError: if the requested backend is not installed
+    """
+    name = name or _selected_backend
+    if name is not None:
+        if name not in _backends:
+            _backends[name] = BACKEND_CLASSES[name]()
+        return _backends[name]
+
+    for backend_name in BACKEND_CLASSES:
+        try:
+            return get_backend(backend_name)
+        except ImportError:
+            continue
+
+
+def get_available_backends() -> list[str]:
+    available = list()
+    for name in BACKEND_CLASSES:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def set_backend(name: str | None) -> None:
+    """select the backend by name. None restores the automatic selection"""
+    global _selected_backend
+    if name is not None:
+        get_backend(name)
+    _selected_backend = name
+
+
+def loads(data: bytes) -> Any:
+    try:
+        return get_backend().loads(data)
+    except ValueError:  # files that were edited by hand may not be utf-8 encoded
+        return json.loads(data.decode(locale.getpreferredencoding(False)))
+
+
+def dumps(obj: Any, canonical: bool = False) -> bytes:
+    """
+    canonical: sorted keys and compact separators, written by the standard library. The output is byte-identical
+    no matter which backends are installed, the other backends differ in the formatting of floats
+    """
+    if canonical:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("ascii")
+    return get_backend().dumps(obj)
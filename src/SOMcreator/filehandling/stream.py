@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator, TextIO
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonStreamReader(object):
+    """
+    Reads a JSON document piece by piece, so only the currently requested value has to be held in memory.
+    Objects can be walked key by key with iter_items(), every value is either read with read_value(),
+    walked with a nested iter_items() or skipped.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = 1 << 20):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0  # absolute position of the buffer start inside the document
+        self._eof = False
+
+    @property
+    def position(self) -> int:
+        return self._offset + self._pos
+
+    def _fill(self, size: int | None = None) -> bool:
+        if self._eof:
+            return False
+        if self._pos > len(self._buffer) // 2:
+            self._offset += self._pos
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        chunk = self._file.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Unexpected end of document", self._buffer, self._pos)
+
+    def _expect(self, character: str) -> None:
+        if self._peek() != character:
+            raise json.JSONDecodeError(f"Expecting '{character}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def is_object_next(self) -> bool:
+        return self._peek() == "{"
+
+    def read_value(self) -> Any:
+        """decodes the next value completely"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                end = None
+            # a value that ends with the buffer might continue in the next chunk (e.g. numbers)
+            if end is not None and (end < len(self._buffer) or self._eof):
+                self._pos = end
+                return value
+            # grow geometrically, so large values are not decoded over and over again
+            if not self._fill(max(self._chunk_size, len(self._buffer) - self._pos)) and end is None:
+                raise json.JSONDecodeError("Unexpected end of document", self._buffer, self._pos)
+
+    def iter_items(self) -> Iterator[str]:
+        """
+        iterates over the keys of the next JSON object. The value of every key has to be consumed before the next
+        key is requested, otherwise it gets skipped
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self._expect(":")
+            start = self.position
+            yield key
+            if self.position == start:
+                self.read_value()
+            character = self._peek()
+            self._pos += 1
+            if character == "}":
+                return
+            if character != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, self._pos - 1)
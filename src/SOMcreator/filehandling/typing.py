@@ -46,6 +46,7 @@ class AttributeDict(StandardDict):
     child_inherits_value: bool
     revit_mapping: str
     Value: list[str] | list[float] | list[[float, float]]
+    shares_values: bool
 
 
 class AggregationDict(StandardDict):
@@ -53,7 +53,6 @@ def create_structure_dict(ifc_file: ifcopenshell.file, project: classes.Project,
                           attribute_bundle: tuple[str, str, str, str, str, str]) -> dict:
     """Iterate over all Entities, build the targeted Datastructure"""
     targeted_group_structure = {GROUP: {}, ELEMENT: {}, IFC_REP: None}
-    bk_dict = {obj.ident_value: obj for obj in project.objects}
 
     for index, el in enumerate(list(ifc_file.by_type("IfcElement"))):
         attrib, gruppe, identity = get_ifc_el_info(el, attribute_bundle)
@@ -67,7 +66,7 @@ def create_structure_dict(ifc_file: ifcopenshell.file, project: classes.Project,
                 focus_dict[GROUP][part] = {GROUP: {}, ELEMENT: list(), IFC_REP: None}
             focus_dict = focus_dict[GROUP][part]
 
-        obj: classes.Object = bk_dict.get(attrib)
+        obj: classes.Object = project.get_object_by_identifier(attrib, filtered=True)
         abbrev = obj.abbreviation
         if abbrev.upper() not in focus_dict[GROUP]:
             focus_dict[GROUP][abbrev] = {GROUP: {}, ELEMENT: list(), IFC_REP: None}
@@ -98,8 +97,8 @@ def fill_existing_groups(ifc_file: ifcopenshell.file, structure_dict: dict,
 
 
 def create_aggregation_structure(ifc_file: ifcopenshell.file, structure: dict, id_gruppe: list[str],
-                                 parent_group, is_sammler: bool, attribute_bundle, owner_history, kuerzel_dict,
-                                 fill_with_empty_values: bool, obj=None):
+                                 parent_group, is_sammler: bool, attribute_bundle, owner_history,
+                                 project: classes.Project, fill_with_empty_values: bool, obj=None):
     """Take targeted group structure and build it in IFC-File"""
 
     main_pset, main_attribute, group_pset, group_attribute, identity_pset, identity_attribute = attribute_bundle
@@ -171,7 +170,7 @@ def create_aggregation_structure(ifc_file: ifcopenshell.file, structure: dict, i
         ifc_rep = structure[GROUP][abbreviation][IFC_REP]
         new_id_gruppe = id_gruppe + [abbreviation]
         if is_sammler:
-            obj = kuerzel_dict.get(abbreviation.upper())
+            obj = project.get_object_by_abbreviation(abbreviation, filtered=True)
             if obj is None:
                 continue
             name = obj.name
@@ -183,7 +182,7 @@ def create_aggregation_structure(ifc_file: ifcopenshell.file, structure: dict, i
         else:
             group = ifc_rep
         create_aggregation_structure(ifc_file, structure[GROUP][abbreviation], new_id_gruppe, group,
-                                     not is_sammler, attribute_bundle, owner_history, kuerzel_dict,
+                                     not is_sammler, attribute_bundle, owner_history, project,
                                      fill_with_empty_values, obj)
 
     if not is_sammler:
@@ -202,7 +201,6 @@ def main(ifc_path: os.PathLike | str, export_path: os.PathLike | str, project: c
 
     targeted_group_structure = create_structure_dict(ifc_file, project, attribute_bundle)
     fill_existing_groups(ifc_file, targeted_group_structure, attribute_bundle)
-    kuerzel_dict = {obj.abbreviation.upper(): obj for obj in project.objects}
     create_aggregation_structure(ifc_file, targeted_group_structure, [], None, True, attribute_bundle, owner_history,
-                                 kuerzel_dict, fill_with_empty_values, None)
+                                 project, fill_with_empty_values, None)
     ifc_file.write(export_path)
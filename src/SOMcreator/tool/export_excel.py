@@ -93,7 +93,7 @@ class ExportExcel:
             sheet.cell(1, column).value = text
 
         row = 1
-        for row, obj in enumerate(sorted(project.objects), start=2):
+        for row, obj in enumerate(project.view().objects, start=2):
             for column, getter_function in enumerate(getter_functions, start=1):
                 sheet.cell(row, column).value = getter_function(obj)
                 if obj.optional:
@@ -109,10 +109,10 @@ class ExportExcel:
 
     @classmethod
     def filter_to_sheets(cls, ) -> dict:
-        project = cls.get_project()
-        d = {obj.ident_value: {NAME: obj.name, OBJECTS: []} for obj in project.objects if
+        objects = cls.get_project().view().objects
+        d = {obj.ident_value: {NAME: obj.name, OBJECTS: []} for obj in objects if
              len(obj.ident_value.split(".")) == 1}
-        for obj in project.objects:
+        for obj in objects:
             group = obj.ident_value.split(".")[0]
             d[group][OBJECTS].append(obj)
         d["son"] = {NAME: "Sonstige", OBJECTS: []}
@@ -152,8 +152,9 @@ class ExportExcel:
 
         pset_start_row = start_row + 4
         index = 0
-        for property_set in sorted(obj.property_sets):
-            for attribute in sorted(property_set.attributes):
+        view = cls.get_project().view()
+        for property_set in view.property_sets(obj):
+            for attribute in view.attributes(property_set):
                 sheet.cell(pset_start_row + index, start_column).value = attribute.name
                 sheet.cell(pset_start_row + index, start_column + 1).value = property_set.name
                 sheet.cell(pset_start_row + index, start_column + 2).value = attribute.description
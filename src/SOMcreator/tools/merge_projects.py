@@ -36,7 +36,7 @@ def _add_item(existing_project: SOMcreator.Project, import_project: SOMcreator.P
                                  use_case_mapping)
     existing_project.add_item(item)
     item._project = existing_project
-    item._filter_matrix = new_filter_matrix
+    item.set_filter_matrix(new_filter_matrix)
 
 
 def _import_object(existing_project, import_project, obj, old_predefined_psets_mapping, phase_mapping,
@@ -0,0 +1,51 @@
+import pytest
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+
+
+def create_catalogue() -> classes.Project:
+    proj = classes.Project("Catalogue", "SOMcreator")
+    predefined = classes.PropertySet("Predefined", None, project=proj)
+    classes.Attribute(predefined, "shared", ["x", "y"], value_constants.LIST, project=proj)
+    classes.Attribute(predefined, "inherited", ["1"], value_constants.LIST, child_inherits_values=True,
+                      project=proj)
+    for index in range(3):
+        obj = classes.Object(f"Object {index}", None, project=proj)
+        obj.add_property_set(predefined.create_child("Predefined"))
+    first = next(o for o in proj.get_all_objects() if o.name == "Object 0")
+    first.get_property_set_by_name("Predefined").get_attribute_by_name("shared").value = ["own"]
+    return proj
+
+
+def get_children(proj: classes.Project) -> dict[tuple[str, str], classes.Attribute]:
+    return {(attribute.property_set.object.name, attribute.name): attribute for attribute in proj.get_all_attributes()
+            if attribute.property_set.object is not None}
+
+
+@pytest.mark.parametrize("file_name,lean", [("catalogue.SOMjson", False), ("catalogue.SOMjson", True),
+                                            ("catalogue.sombin", False), ("catalogue.somdb", False)])
+def test_children_keep_sharing_values(tmp_path, file_name, lean):
+    proj = create_catalogue()
+    path = tmp_path / file_name
+    proj.save(path, lean=lean)
+    with classes.Project.open(path) as loaded:
+        expected = get_children(proj)
+        children = get_children(loaded)
+        assert children.keys() == expected.keys()
+        for key, attribute in children.items():
+            assert attribute.value == expected[key].value
+            assert attribute.is_sharing_values == expected[key].is_sharing_values
+        assert sum(attribute.is_sharing_values for attribute in children.values()) == 5
+
+
+def test_value_changes_reach_inheriting_children():
+    proj = classes.Project("Values", "SOMcreator")
+    parent = classes.Attribute(None, "parent", ["x"], value_constants.LIST, child_inherits_values=True, project=proj)
+    child = parent.create_child()
+    child.value = ["x", "y"]
+    parent.value.append("z")  # value is a copy, editing it in place changes nothing
+    assert parent.value == ["x"]
+    assert child.value == ["x", "y"]
+    parent.value = parent.value + ["z"]
+    assert child.value == ["x", "z", "y"]
@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from SOMcreator import classes, filehandling
+from SOMcreator.constants import value_constants
+from SOMcreator.filehandling import binary, create_export_dict
+
+
+def create_project() -> classes.Project:
+    proj = classes.Project("Binär", "SOMcreator")
+    proj.create_project_phase("LPH 2")
+    proj.create_use_case("Kosten")
+    phases, use_cases = proj.get_project_phase_list(), proj.get_use_case_list()
+
+    predefined = classes.PropertySet("Predefined", None, project=proj, description="Vordefiniert")
+    classes.Attribute(predefined, "inherited", ["a", "b"], value_constants.LIST, child_inherits_values=True,
+                      project=proj)
+    classes.Attribute(predefined, "range", [[0.5, 10.25]], value_constants.RANGE, value_constants.REAL, project=proj)
+
+    parent_aggregation = None
+    for index in range(4):
+        obj = classes.Object(f"Object {index}", None, project=proj, abbreviation=f"O{index}")
+        pset = classes.PropertySet("Ident", obj, project=proj)
+        obj.ident_attrib = classes.Attribute(pset, "id", [str(index)], value_constants.LIST, project=proj)
+        child_pset = predefined.create_child("Predefined")
+        obj.add_property_set(child_pset)
+        if index % 2:
+            child_pset.get_attribute_by_name("inherited").value = ["a", "b", f"own {index}"]
+            obj.set_filter_state(phases[1], use_cases[0], False)
+            pset.set_filter_state(phases[0], use_cases[1], False)
+            obj.ident_attrib.set_filter_state(phases[1], use_cases[1], False)
+
+        aggregation = classes.Aggregation(obj)
+        if parent_aggregation is None:
+            parent_aggregation = aggregation
+        else:
+            parent_aggregation.add_child(aggregation, value_constants.INHERITANCE if index == 3 else
+                                         value_constants.AGGREGATION)
+    return proj
+
+
+def get_export(proj: classes.Project) -> str:
+    return json.dumps(create_export_dict(proj), sort_keys=True)
+
+
+@pytest.mark.parametrize("compression", [binary.NO_COMPRESSION, binary.ZLIB, binary.LZMA])
+def test_document_round_trip(compression):
+    document = {"matrix": [[True, False], [False, True]], "uuid": "0a6f6a1e-6d8e-4f1a-9c7e-3b9a6f1f2d3c",
+                "values": [None, True, False, 0, -3, 2 ** 40, 1.5, "Größe", [], {}], "empty": ""}
+    assert binary.loads(binary.dumps(document, compression)) == document
+
+
+@pytest.mark.parametrize("lean", [False, True])
+def test_project_round_trip(tmp_path, lean):
+    proj = create_project()
+    path = str(tmp_path / f"project{binary.FILE_EXTENSION}")
+    proj.save(path, lean=lean)
+
+    loaded = classes.Project.open(path)
+    assert get_export(loaded) == get_export(proj)
+    objects = {obj.name: obj for obj in loaded.get_all_objects()}
+    assert objects["Object 1"].get_property_set_by_name("Predefined").get_attribute_by_name("inherited").value == [
+        "a", "b", "own 1"]
+    assert not objects["Object 1"].get_filter_state(loaded.get_project_phase_list()[1], loaded.get_use_case_list()[0])
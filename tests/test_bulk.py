@@ -0,0 +1,18 @@
+import pytest
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+
+
+@pytest.mark.parametrize("bad_reference", ["obj", "property_set", "parent"])
+def test_unknown_references_create_nothing(bad_reference):
+    proj = classes.Project("Bulk", "SOMcreator")
+    with pytest.raises(KeyError, match=bad_reference):
+        with proj.bulk() as builder:
+            obj = builder.add_object("Object")
+            pset = builder.add_property_set("PropertySet", "unknown" if bad_reference == "obj" else obj)
+            builder.add_attribute("unknown" if bad_reference == "property_set" else pset, "Attribute", ["x"],
+                                  value_constants.LIST, parent="unknown" if bad_reference == "parent" else None)
+    assert not list(proj.get_all_objects())
+    assert not list(proj.get_all_property_sets())
+    assert not list(proj.get_all_attributes())
@@ -0,0 +1,73 @@
+import json
+import os
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+from SOMcreator.filehandling import cache, create_export_dict
+
+
+def create_project(object_count: int) -> classes.Project:
+    proj = classes.Project("Cache", "SOMcreator")
+    for index in range(object_count):
+        obj = classes.Object(f"Object {index}", None, project=proj)
+        pset = classes.PropertySet("Ident", obj, project=proj)
+        obj.ident_attrib = classes.Attribute(pset, "id", [str(index)], value_constants.LIST, project=proj)
+    return proj
+
+
+def get_export(proj: classes.Project) -> str:
+    return json.dumps(create_export_dict(proj), sort_keys=True)
+
+
+def open_cached(path: str, load_cache: cache.LoadCache) -> tuple[classes.Project, int]:
+    proj = classes.Project.open(path, cache=load_cache)
+    return proj, proj.load_report["cache"][cache.HIT]
+
+
+def test_cache_hit_and_invalidation(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    load_cache = cache.LoadCache(tmp_path / "cache")
+    create_project(3).save(path)
+
+    first, hit = open_cached(path, load_cache)
+    assert hit == 0
+    second, hit = open_cached(path, load_cache)
+    assert hit == 1
+    assert second is not first
+    assert get_export(second) == get_export(first)
+
+    changed = create_project(4)
+    changed.save(path)
+    third, hit = open_cached(path, load_cache)
+    assert hit == 0
+    assert get_export(third) == get_export(changed)
+
+
+def test_damaged_entries_get_replaced(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    load_cache = cache.LoadCache(tmp_path / "cache")
+    create_project(3).save(path)
+    open_cached(path, load_cache)
+    with open(os.path.join(load_cache.directory, load_cache.get_key(path) + cache.FILE_EXTENSION), "wb") as file:
+        file.write(b"no pickle")
+
+    proj, hit = open_cached(path, load_cache)
+    assert hit == 0
+    assert len(list(proj.get_all_objects())) == 3
+    assert open_cached(path, load_cache)[1] == 1
+
+
+def test_least_recently_used_entries_get_evicted(tmp_path):
+    load_cache = cache.LoadCache(tmp_path / "cache")
+    entry_paths = list()
+    for index in range(3):
+        path = str(tmp_path / f"project {index}.SOMjson")
+        create_project(index + 1).save(path)
+        open_cached(path, load_cache)
+        entry_path = os.path.join(load_cache.directory, load_cache.get_key(path) + cache.FILE_EXTENSION)
+        os.utime(entry_path, (index, index))
+        entry_paths.append(entry_path)
+
+    load_cache.max_size = sum(os.path.getsize(entry_path) for entry_path in entry_paths[1:])
+    load_cache.evict()
+    assert sorted(os.listdir(load_cache.directory)) == sorted(os.path.basename(p) for p in entry_paths[1:])
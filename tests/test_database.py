@@ -0,0 +1,76 @@
+import os
+import sqlite3
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+
+
+def create_project() -> classes.Project:
+    proj = classes.Project("Database", "SOMcreator")
+    for index in range(3):
+        obj = classes.Object(f"Object {index}", None, project=proj)
+        pset = classes.PropertySet("Ident", obj, project=proj)
+        obj.ident_attrib = classes.Attribute(pset, "id", [str(index)], value_constants.LIST, project=proj)
+        classes.Attribute(pset, "extra", ["x"], value_constants.LIST, project=proj)
+    return proj
+
+
+def test_lookups_on_pending_objects(tmp_path):
+    path = tmp_path / "project.somdb"
+    create_project().save(path)
+    proj = classes.Project.open(path)
+    for obj in proj.get_all_objects():
+        assert not obj.is_loaded
+        pset = obj.get_property_set_by_name("Ident")
+        assert pset is not None
+        assert pset.get_attribute_by_name("id").value == [obj.ident_value]
+
+
+def test_detached_items_are_saved(tmp_path):
+    path = tmp_path / "project.somdb"
+    create_project().save(path)
+    proj = classes.Project.open(path)
+    objects = sorted(proj.get_all_objects(), key=lambda o: o.name)
+    pset = objects[0].get_property_set_by_name("Ident")
+    pset.remove_attribute(pset.get_attribute_by_name("extra"))
+    objects[1].remove_property_set(objects[1].get_property_set_by_name("Ident"))
+    proj.save(path)
+    proj.close()
+
+    proj = classes.Project.open(path)
+    objects = sorted(proj.get_all_objects(), key=lambda o: o.name)
+    assert [a.name for a in objects[0].get_property_set_by_name("Ident").attributes] == ["id"]
+    assert objects[1].get_all_property_sets() == []
+    assert len(objects[2].get_property_set_by_name("Ident").attributes) == 2
+    proj.close()
+
+
+def test_close_releases_the_store(tmp_path):
+    path = tmp_path / "project.somdb"
+    create_project().save(path)
+    with classes.Project.open(path) as proj:
+        obj = next(iter(proj.get_all_objects()))
+        assert proj.store is not None
+    assert proj.store is None
+    os.remove(path)  # fails on Windows while the connection is open
+    try:
+        obj.get_all_property_sets()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("pending Object got loaded from a closed store")
+
+
+def test_name_fallback_keeps_objects_pending(tmp_path):
+    path = tmp_path / "project.somdb"
+    proj = create_project()
+    parent = classes.Object("Parent", None, project=proj)
+    parent.add_child(classes.Object("Child", None, project=proj))
+    proj.save(path)
+    with sqlite3.connect(path) as connection:
+        connection.execute("DELETE FROM objects WHERE uuid = ?", (parent.uuid,))
+    connection.close()
+
+    with classes.Project.open(path) as proj:
+        assert proj.load_report["inheritance"]["unresolved"] == 1
+        assert not any(obj.is_loaded for obj in proj.get_all_objects())
@@ -0,0 +1,32 @@
+import pytest
+
+from SOMcreator import classes
+
+
+def test_removed_cells_free_their_bits():
+    proj = classes.Project("Filter", "SOMcreator")
+    obj = classes.Object("Object", None, project=proj)
+    use_case = proj.get_use_case_list()[0]
+    for index in range(20):
+        phase = proj.create_project_phase(f"Phase {index}")
+        obj.set_filter_state(phase, use_case, False)
+        proj.remove_project_phase(phase.name)
+    assert proj._next_filter_bit == 2
+
+    phase = proj.create_project_phase("new")
+    extra_use_case = proj.create_use_case("extra")
+    assert obj.get_filter_state(phase, use_case)
+    assert obj.get_filter_matrix() == [[True, True], [True, True]]
+    obj.set_filter_state(phase, extra_use_case, False)
+    proj.remove_use_case(extra_use_case.name)
+    assert obj.get_filter_matrix() == [[True], [True]]
+    assert obj._filter_mask == 0
+
+
+def test_item_phase_methods_are_deprecated():
+    proj = classes.Project("Filter", "SOMcreator")
+    obj = classes.Object("Object", None, project=proj)
+    with pytest.deprecated_call():
+        obj.add_project_phase()
+    with pytest.deprecated_call():
+        obj.remove_use_case(proj.get_use_case_list()[0])
@@ -0,0 +1,39 @@
+import json
+
+from SOMcreator import classes, filehandling
+from SOMcreator.constants import value_constants
+from SOMcreator.filehandling import constants, create_export_dict
+
+
+def test_dangling_parents_fall_back_to_name_and_value(tmp_path):
+    proj = classes.Project("Inheritance", "SOMcreator")
+    predefined = {value: classes.PropertySet(f"Predefined {value}", None, project=proj) for value in "12"}
+    for value, pset in predefined.items():
+        classes.Attribute(pset, "a", [value], value_constants.LIST, project=proj)
+    objects = dict()
+    for name, value in (("Second", "2"), ("First", "1"), ("Broken", "1")):
+        obj = classes.Object(name, None, project=proj)
+        obj.add_property_set(predefined[value].create_child("Pset"))
+        obj.get_property_set_by_name("Pset").get_attribute_by_name("a").value = [value, f"own {value}"]
+        objects[name] = obj
+    lost_parent = classes.Object("Lost Parent", None, project=proj)
+    lost_parent.add_child(classes.Object("Orphan", None, project=proj))
+
+    main_dict = create_export_dict(proj)
+    objects_dict = main_dict[constants.OBJECTS]
+    # candidates have to be unlinked yet, a plain name match would pick the parent of "Second"
+    ordered = [objects[name].uuid for name in ("Broken", "Second", "First")]
+    main_dict[constants.OBJECTS] = {uuid: objects_dict.pop(uuid) for uuid in ordered} | objects_dict
+    broken_pset = next(iter(main_dict[constants.OBJECTS][objects["Broken"].uuid][constants.PROPERTY_SETS].values()))
+    next(iter(broken_pset[constants.ATTRIBUTES].values()))[constants.PARENT] = "missing attribute"
+    main_dict[constants.OBJECTS].pop(lost_parent.uuid)
+    path = str(tmp_path / "inheritance.SOMjson")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(main_dict, file)
+
+    loaded = filehandling.open_json(classes.Project, path)
+    report = loaded.load_report["inheritance"]
+    assert (report["name"], report["unresolved"]) == (1, 1)
+    broken = next(obj for obj in loaded.get_all_objects() if obj.name == "Broken")
+    attribute = broken.get_property_set_by_name("Pset").get_attribute_by_name("a")
+    assert attribute.parent.property_set.name == "Predefined 1"
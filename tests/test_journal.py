@@ -0,0 +1,48 @@
+import json
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+from SOMcreator.filehandling import create_export_dict, journal
+
+
+def create_project() -> classes.Project:
+    proj = classes.Project("Journal", "SOMcreator")
+    for index in range(3):
+        obj = classes.Object(f"Object {index}", None, project=proj)
+        pset = classes.PropertySet("Ident", obj, project=proj)
+        obj.ident_attrib = classes.Attribute(pset, "id", [str(index)], value_constants.LIST, project=proj)
+        classes.Attribute(pset, "extra", ["x"], value_constants.LIST, project=proj)
+        classes.PropertySet("Other", obj, project=proj)
+    return proj
+
+
+def get_export(proj: classes.Project) -> str:
+    return json.dumps(create_export_dict(proj), sort_keys=True)
+
+
+def test_detached_items_are_journaled(tmp_path):
+    path = tmp_path / "project.SOMjson"
+    create_project().save(path)
+    proj = classes.Project.open(path)
+    objects = sorted(proj.get_all_objects(), key=lambda o: o.name)
+    pset = objects[0].get_property_set_by_name("Ident")
+    pset.remove_attribute(pset.get_attribute_by_name("extra"))
+    objects[1].remove_property_set(objects[1].get_property_set_by_name("Other"))
+    proj.save(path, incremental=True)
+    assert get_export(classes.Project.open(path)) == get_export(proj)
+    journal.compact(path)
+    assert get_export(classes.Project.open(path)) == get_export(proj)
+
+
+def test_journal_of_a_rewritten_file_is_skipped(tmp_path):
+    path = tmp_path / "project.SOMjson"
+    create_project().save(path)
+    proj = classes.Project.open(path)
+    next(iter(proj.get_all_objects())).name = "Renamed"
+    proj.save(path, incremental=True)
+
+    journal_data = open(journal.get_journal_path(path), "rb").read()
+    rewritten = create_project()
+    rewritten.save(path)  # written by another tool, the journal stays
+    open(journal.get_journal_path(path), "wb").write(journal_data)
+    assert get_export(classes.Project.open(path)) == get_export(rewritten)
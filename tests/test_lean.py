@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+from SOMcreator.filehandling import constants, create_export_dict
+
+
+def create_project() -> classes.Project:
+    proj = classes.Project("Lean", "SOMcreator")
+    phase = proj.create_project_phase("LPH 2")
+    predefined = classes.PropertySet("Predefined", None, project=proj, description="Vordefiniert")
+    classes.Attribute(predefined, "inherited", ["a"], value_constants.LIST, child_inherits_values=True,
+                      description="geerbt", project=proj)
+    for index in range(3):
+        obj = classes.Object(f"Object {index}", None, project=proj)
+        obj.add_property_set(predefined.create_child("Predefined"))
+        if index == 1:
+            obj.set_filter_state(phase, proj.get_use_case_list()[0], False)
+            obj.get_property_set_by_name("Predefined").description = "eigene Beschreibung"
+    return proj
+
+
+def get_export(proj: classes.Project) -> str:
+    return json.dumps(create_export_dict(proj), sort_keys=True)
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_lean_file_loads_like_a_full_file(tmp_path, stream):
+    proj = create_project()
+    full_path, lean_path = str(tmp_path / "full.SOMjson"), str(tmp_path / "lean.SOMjson")
+    proj.save(full_path)
+    lean_dict = proj.save(lean_path, lean=True)
+
+    full, lean = classes.Project.open(full_path, stream=stream), classes.Project.open(lean_path, stream=stream)
+    assert get_export(lean) == get_export(full) == get_export(proj)
+    assert os.path.getsize(lean_path) < os.path.getsize(full_path)
+
+    objects = {obj_dict[constants.NAME]: obj_dict for obj_dict in lean_dict[constants.OBJECTS].values()}
+    assert constants.FILTER_MATRIX not in objects["Object 0"]
+    assert constants.FILTER_MATRIX in objects["Object 1"]
+    psets = {name: next(iter(obj_dict[constants.PROPERTY_SETS].values())) for name, obj_dict in objects.items()}
+    assert constants.DESCRIPTION not in psets["Object 0"]
+    assert psets["Object 1"][constants.DESCRIPTION] == "eigene Beschreibung"
+    attribute_dict = next(iter(psets["Object 0"][constants.ATTRIBUTES].values()))
+    assert constants.REVIT_MAPPING not in attribute_dict
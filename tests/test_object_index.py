@@ -0,0 +1,24 @@
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+
+
+def _create_object(proj: classes.Project, name: str, ident: str, abbreviation: str) -> classes.Object:
+    obj = classes.Object(name, None, abbreviation=abbreviation, project=proj)
+    pset = classes.PropertySet("Allgemein", obj, project=proj)
+    obj.ident_attrib = classes.Attribute(pset, "Ident", [ident], value_constants.LIST, project=proj)
+    return obj
+
+
+def test_lookup_prefers_active_objects_and_is_deterministic():
+    proj = classes.Project("Index", "SOMcreator")
+    inactive = _create_object(proj, "A", "1", "abc")
+    active = _create_object(proj, "B", "1", "ABC")
+    inactive.set_filter_state(proj.current_project_phase, proj.current_use_case, False)
+
+    assert proj.get_object_by_identifier("1") is inactive
+    assert proj.get_object_by_abbreviation("Abc") is inactive
+    assert proj.get_object_by_identifier("1", filtered=True) is active
+    assert proj.get_object_by_abbreviation("Abc", filtered=True) is active
+
+    active.set_filter_state(proj.current_project_phase, proj.current_use_case, False)
+    assert proj.get_object_by_identifier("1", filtered=True) is None
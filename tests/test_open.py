@@ -0,0 +1,69 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import SOMcreator
+from SOMcreator import classes, filehandling
+from SOMcreator.constants import value_constants
+from SOMcreator.filehandling import constants, create_export_dict
+
+
+def create_project(name: str, object_count: int) -> classes.Project:
+    proj = classes.Project(name, "SOMcreator")
+    predefined = classes.PropertySet("Predefined", None, project=proj)
+    classes.Attribute(predefined, "inherited", ["1"], value_constants.LIST, child_inherits_values=True, project=proj)
+    root = None
+    for index in range(object_count):
+        obj = classes.Object(f"{name} {index}", None, project=proj, description="Wärmedämmung, Größe in m²")
+        pset = classes.PropertySet("Ident", obj, project=proj)
+        obj.ident_attrib = classes.Attribute(pset, "id", [f"{name}.{index}"], value_constants.LIST, project=proj)
+        obj.add_property_set(predefined.create_child("Predefined"))
+        aggregation = classes.Aggregation(obj)
+        if root is None:
+            root = aggregation
+        else:
+            root.add_child(aggregation)
+    return proj
+
+
+def get_export(proj: classes.Project) -> str:
+    return json.dumps(create_export_dict(proj), sort_keys=True)
+
+
+def test_parallel_loads_keep_the_active_project(tmp_path):
+    expected = dict()
+    for name, object_count in (("First", 20), ("Second", 30)):
+        path = str(tmp_path / f"{name}.SOMjson")
+        proj = create_project(name, object_count)
+        proj.save(path)
+        expected[path] = get_export(proj)
+
+    active_project = classes.Project("Active", "SOMcreator")
+    paths = list(expected) * 4
+    with ThreadPoolExecutor(8) as executor:
+        projects = list(executor.map(classes.Project.open, paths))
+
+    assert SOMcreator.active_project is active_project
+    for path, proj in zip(paths, projects):
+        assert get_export(proj) == expected[path]
+
+
+@pytest.mark.parametrize("section_order", [
+    [constants.PROJECT, constants.PREDEFINED_PSETS, constants.OBJECTS, constants.AGGREGATIONS],
+    [constants.AGGREGATIONS, constants.OBJECTS, constants.PROJECT, constants.PREDEFINED_PSETS],
+    [constants.PROJECT, constants.AGGREGATIONS, constants.OBJECTS, constants.PREDEFINED_PSETS],
+])
+def test_stream_load_matches_json_load(tmp_path, section_order):
+    main_dict = create_export_dict(create_project("Bauteil Ü", 10))
+    reordered = {"Plugin": {"Schlüssel": ["Wert ä", 1, None, {"nested": True}]}}
+    reordered.update((key, main_dict.pop(key)) for key in section_order)
+    reordered.update(main_dict)
+    path = str(tmp_path / "umlaut.SOMjson")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(reordered, file, ensure_ascii=False)
+
+    streamed = filehandling.open_json_stream(classes.Project, path)
+    assert get_export(streamed) == get_export(filehandling.open_json(classes.Project, path))
+    assert streamed.name == "Bauteil Ü"
+    assert streamed.plugin_dict["Plugin"] == {"Schlüssel": ["Wert ä", 1, None, {"nested": True}]}
@@ -0,0 +1,46 @@
+import pytest
+
+from SOMcreator import classes
+from SOMcreator.constants import value_constants
+from SOMcreator.filehandling import binary, selection
+
+
+def create_project() -> classes.Project:
+    proj = classes.Project("Selection", "SOMcreator")
+    predefined = dict()
+    for name in ("Used", "Unused"):
+        predefined[name] = classes.PropertySet(name, None, project=proj)
+        classes.Attribute(predefined[name], "inherited", ["a"], value_constants.LIST, child_inherits_values=True,
+                          project=proj)
+    objects = dict()
+    for name in ("Root", "Middle", "Leaf", "Top", "Other"):
+        obj = classes.Object(name, None, project=proj, ifc_mapping={f"Ifc{name}"})
+        pset = classes.PropertySet("Ident", obj, project=proj)
+        obj.ident_attrib = classes.Attribute(pset, "id", [name.lower()], value_constants.LIST, project=proj)
+        objects[name] = obj
+    objects["Root"].add_child(objects["Middle"])
+    objects["Middle"].add_child(objects["Leaf"])
+    objects["Leaf"].add_property_set(predefined["Used"].create_child("Used"))
+    objects["Other"].add_property_set(predefined["Unused"].create_child("Unused"))
+
+    aggregations = {name: classes.Aggregation(objects[name]) for name in ("Top", "Leaf", "Other")}
+    aggregations["Top"].add_child(aggregations["Leaf"])
+    return proj
+
+
+@pytest.mark.parametrize("extension", [".SOMjson", binary.FILE_EXTENSION])
+@pytest.mark.parametrize("include", ["leaf", selection.Selection(ifc_mappings=["IfcLeaf"])])
+def test_partial_load_pulls_in_dependencies(tmp_path, extension, include):
+    path = str(tmp_path / f"project{extension}")
+    create_project().save(path)
+
+    proj = classes.Project.open(path, include=include)
+    objects = {obj.name: obj for obj in proj.get_all_objects()}
+    assert sorted(objects) == ["Leaf", "Middle", "Root", "Top"]
+    assert objects["Leaf"].parent is objects["Middle"] and objects["Middle"].parent is objects["Root"]
+    assert [pset.name for pset in proj.get_predefined_psets()] == ["Used"]
+    assert objects["Leaf"].get_property_set_by_name("Used").parent is not None
+    assert sorted(aggregation.name for aggregation in proj.get_all_aggregations()) == ["Leaf", "Top"]
+    leaf_aggregation = next(iter(objects["Leaf"].aggregations))
+    assert leaf_aggregation.parent.object is objects["Top"]
+    assert proj.load_report["selection"] == {selection.SELECTED: 1, selection.LOADED: 4, selection.SKIPPED: 1}
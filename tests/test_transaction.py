@@ -0,0 +1,20 @@
+import pytest
+
+from SOMcreator import classes
+
+
+def test_rollback_needs_an_outer_transaction_with_rollback():
+    proj = classes.Project("Transaction", "SOMcreator")
+    obj = classes.Object("Object", None, project=proj)
+    with proj.transaction():
+        with pytest.raises(ValueError):
+            with proj.transaction(rollback=True):
+                obj.name = "changed"
+    assert obj.name == "Object"
+
+    with pytest.raises(RuntimeError):
+        with proj.transaction(rollback=True):
+            with proj.transaction(rollback=True):
+                obj.name = "changed"
+                raise RuntimeError
+    assert obj.name == "Object"
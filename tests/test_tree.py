@@ -0,0 +1,45 @@
+import pytest
+
+from SOMcreator import classes
+
+
+def get_structure(node) -> dict:
+    return {child.name: get_structure(child) for child in node.children}
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+def test_tree_is_cached_until_objects_change(lightweight):
+    proj = classes.Project("Tree", "SOMcreator")
+    objects = {name: classes.Object(name, None, project=proj) for name in ("A", "B", "C")}
+    objects["A"].add_child(objects["B"])
+    tree = proj.tree(lightweight)
+    assert get_structure(tree) == {"A": {"B": {}}, "C": {}}
+
+    objects["B"].description = "no change of the tree"
+    assert proj.tree(lightweight) is tree
+
+    objects["C"].add_child(objects["B"])
+    assert get_structure(proj.tree(lightweight)) == {"A": {}, "C": {"B": {}}}
+
+    objects["C"].name = "D"
+    assert get_structure(proj.tree(lightweight)) == {"A": {}, "D": {"B": {}}}
+
+    objects["A"].set_filter_state(proj.current_project_phase, proj.current_use_case, False)
+    assert get_structure(proj.tree(lightweight)) == {"D": {"B": {}}}
+
+    proj.name = "Renamed"
+    assert proj.tree(lightweight).id == "Renamed"
+
+
+def test_tree_is_cached_per_phase():
+    proj = classes.Project("Tree", "SOMcreator")
+    first_phase = proj.current_project_phase
+    second_phase = proj.create_project_phase("second")
+    obj = classes.Object("A", None, project=proj)
+    obj.set_filter_state(second_phase, proj.current_use_case, False)
+
+    first_tree = proj.tree()
+    proj.current_project_phase = second_phase
+    assert get_structure(proj.tree()) == {}
+    proj.current_project_phase = first_phase
+    assert proj.tree() is first_tree